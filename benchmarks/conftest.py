@@ -0,0 +1,31 @@
+import os
+import pytest
+from util.benchmark import Benchmark, save_results
+from util.local_app import LocalAppServer
+
+
+@pytest.fixture(scope="session")
+def app_url(request):
+    """Benchmark selalu jalan ke stand-in lokal supaya hasilnya bisa dibandingkan antar commit."""
+    latency = request.config.getoption("--app-latency-ms") / 1000
+    with LocalAppServer(latency=latency) as server:
+        yield server.url
+
+
+@pytest.fixture(scope="session")
+def bench_results(request):
+    """Kumpulkan hasil semua benchmark lalu tulis ke --bench-out di akhir sesi."""
+    results = {}
+    yield results
+    if not results:
+        return
+    path = request.config.getoption("--bench-out")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    save_results(results, path)
+
+
+@pytest.fixture
+def bench(driver, bench_results, request):
+    runner = Benchmark(driver, rounds=request.config.getoption("--bench-rounds"))
+    yield runner
+    bench_results.update(runner.results)
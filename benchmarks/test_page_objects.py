@@ -0,0 +1,88 @@
+import pytest
+from pages.cart_page import CartPage
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from pages.report_page import ReportPage
+from util.navigation import Navigator
+
+pytestmark = pytest.mark.benchmark
+
+PRODUCT = "Wireless Headphones"
+
+
+def test_bench_login(bench, driver, app_url, creds):
+    lp = LoginPage(driver)
+
+    def logged_out():
+        driver.delete_all_cookies()
+        driver.execute_script("window.localStorage.clear();")
+        lp.visit(app_url)
+
+    def login():
+        lp.login(creds["email"], creds["password"])
+        lp.assert_logged_in()
+
+    lp.visit(app_url)
+    result = bench.measure("LoginPage.login", login, setup=logged_out)
+    assert result["rounds"] == bench.rounds
+
+
+@pytest.mark.usefixtures("logged_in")
+def test_bench_search_product(bench, driver):
+    pp = ProductsPage(driver)
+    bench.measure("ProductsPage.search_product", lambda: pp.search_product(PRODUCT))
+    pp.assert_product_visible(PRODUCT)
+
+
+def test_bench_add_to_cart(bench, driver, cart_state):
+    pp = ProductsPage(driver)
+
+    def empty_cart():
+        cart_state.clear()
+        pp.search_product(PRODUCT)
+
+    bench.measure("ProductsPage.add_to_cart", lambda: pp.add_to_cart(PRODUCT), setup=empty_cart)
+    assert cart_state.items() == [(PRODUCT, 1)]
+
+
+def test_bench_get_quantity(bench, driver, cart_state):
+    cart_state.seed([(PRODUCT, 2)])
+    cp = CartPage(driver)
+    bench.measure("CartPage.get_quantity", cp.get_quantity)
+    assert cp.get_quantity() == 2
+
+
+def test_bench_checkout(bench, driver, cart_state):
+    cp = CartPage(driver)
+    txids = []
+
+    def checkout():
+        cp.checkout()
+        cp.fill_customer_info("Bench User", "bench@example.com")
+        cp.select_payment_method("Cash")
+        cp.complete_transaction()
+        txids.append(cp.get_transaction_alert_and_id()[1])
+
+    bench.measure("CartPage.checkout_complete", checkout, setup=lambda: cart_state.seed([(PRODUCT, 1)]))
+    assert all(txids)
+
+
+@pytest.mark.usefixtures("logged_in")
+def test_bench_report_getters(bench, driver):
+    Navigator.for_driver(driver).go_to_reports()
+    rp = ReportPage(driver)
+    rp.wait_for_page()
+
+    def read_report():
+        rp.get_summary_cards()
+        rp.get_daily_sales()
+        rp.get_top_products()
+
+    # _snapshot dikosongkan tiap putaran supaya yang diukur pembacaan DOM, bukan cache
+    bench.measure("ReportPage.getters", read_report, setup=lambda: setattr(rp, "_snapshot", None))
+    # Setup (tidak diukur) pindah ke filter lain dulu, jadi tiap putaran benar-benar mengganti filter
+    bench.measure(
+        "ReportPage.select_filter",
+        lambda: rp.select_filter("This Year"),
+        setup=lambda: rp.select_filter("This Month"),
+    )
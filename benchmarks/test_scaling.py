@@ -0,0 +1,64 @@
+import json
+import logging
+import os
+import time
+import pytest
+from pages.report_page import ReportPage
+from pages.transactions_page import TransactionsPage
+from util.report_reference import ReportReference, diff_report
+from util.navigation import Navigator
+from util.tx_generator import TransactionSeeder
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.scaling
+
+
+def _timed(action):
+    start = time.perf_counter()
+    result = action()
+    return result, round((time.perf_counter() - start) * 1000, 1)
+
+
+@pytest.mark.usefixtures("logged_in")
+def test_reports_and_transactions_scaling(request, driver):
+    """Waktu render Reports dan Transactions untuk tiap ukuran dataset (kurva scaling)."""
+    sizes = [int(size) for size in request.config.getoption("--scaling-sizes").split(",")]
+    seeder = TransactionSeeder(driver)
+    curve = []
+
+    for size in sizes:
+        seeded = seeder.seed(size)
+        point = {"size": size, "chars": seeded["chars"], "seed_s": seeded["seconds"]}
+        if not seeded["ok"]:
+            # Batas localStorage (~5 juta karakter per origin) sudah terlewati
+            point["error"] = seeded["error"]
+            curve.append(point)
+            continue
+        driver.refresh()
+
+        nav = Navigator.for_driver(driver)
+        rp = ReportPage(driver)
+        _, point["reports_render_ms"] = _timed(lambda: (nav.go_to_reports(), rp.wait_for_page()))
+        rp.select_filter("This Year")
+        cards, point["summary_cards_ms"] = _timed(rp.get_summary_cards)
+        assert len(cards) == 4
+        expected, point["reference_ms"] = _timed(lambda: ReportReference.from_browser(driver).aggregate("This Year"))
+        mismatches = diff_report(expected, cards, rp.get_daily_sales(), rp.get_top_products())
+        assert not mismatches, f"Report tidak sesuai data seed ({size} transaksi): {mismatches[:5]}"
+
+        tp = TransactionsPage(driver, timeout=60)
+        _, point["transactions_render_ms"] = _timed(tp.open)
+        _, point["transactions_index_ms"] = _timed(tp.load)
+        point["rows"] = len(tp.load())
+        assert not tp.missing(seeded["sample_ids"]), "TXID hasil seed tidak muncul di tabel"
+
+        logger.info(f"[scaling] {point}")
+        curve.append(point)
+
+    path = request.config.getoption("--scaling-out")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(curve, f, indent=2)
+    request.node.user_properties.append(("scaling_curve", curve))
+    assert any("error" not in point for point in curve), "Tidak ada ukuran dataset yang muat di localStorage"
@@ -0,0 +1,35 @@
+import os
+from datetime import datetime
+import pytest
+from pages.cart_page import CartPage
+from pages.products_page import ProductsPage
+from util.leak import SoakRun
+
+pytestmark = pytest.mark.soak
+
+PRODUCT = "Wireless Headphones"
+
+
+def test_soak_cart_cycle(request, driver, cart_state):
+    """Add → + → − → remove berulang; heap/node/listener tidak boleh terus naik."""
+    config = request.config
+    cart_state.clear()
+    pp = ProductsPage(driver)
+    cp = CartPage(driver)
+
+    def cycle():
+        pp.add_to_cart(PRODUCT)
+        cp.increase_quantity()
+        cp.decrease_quantity()
+        cp.remove_product()
+
+    soak = SoakRun(driver, cycles=config.getoption("--soak-cycles"))
+    soak.run(cycle)
+
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    soak.write_csv(os.path.join(config.getoption("--soak-out"), f"cart_cycle_{stamp}.csv"))
+    request.node.user_properties.append(("soak_trend", soak.trend()))
+
+    assert cart_state.items() == [], "Cart harus kosong di akhir setiap siklus"
+    violations = soak.check(max_heap_per_cycle=config.getoption("--soak-max-heap-growth"))
+    assert not violations, "Indikasi leak: " + "; ".join(violations)
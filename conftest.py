@@ -1,39 +1,582 @@
+import json
+import logging
+import os
+import statistics
+from contextlib import contextmanager, nullcontext
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from pytest_html import extras as html_extras
 from data.config import BASE_URL, ADMIN
+from pages.login_page import LoginPage
+from util.asset_cache import AssetCache
+from util.auth_state import AuthSnapshot
+from util.browser_context import BrowserContext
+from util.browser_pool import BrowserPool
+from util.cart_state import CartState
+from util.driver_provider import ChromeDriverProvider, create_driver
+from util.element_cache import ELEMENT_CACHE_STATS
+from util.failure_capture import MODES, FrameRecorder
+from util.local_app import LocalAppServer
+from util.navigation import MODES as NAV_MODES, NAV_METRICS, Navigator
+from util.parallel import DURATIONS_FILE, load_durations, save_durations
+from util.perf_metrics import PerfRecorder
+from util.profiler import WebDriverProfiler
+from util.screenshots import FORMATS, SCREENSHOTS
+from util.timeouts import TIMINGS, TIMINGS_FILE
+from util.waits import WAIT_METRICS
 
+logger = logging.getLogger(__name__)
 
-@pytest.fixture(scope="session")
-def app_url():
-    """URL utama aplikasi."""
+browser_pool_key = pytest.StashKey[BrowserPool]()
+driver_provider_key = pytest.StashKey[ChromeDriverProvider]()
+asset_cache_key = pytest.StashKey[AssetCache]()
+perf_key = pytest.StashKey[PerfRecorder]()
+profiler_key = pytest.StashKey[WebDriverProfiler]()
+frame_recorder_key = pytest.StashKey[FrameRecorder]()
+test_durations = {}
+element_cache_by_test = {}
+perf_samples = []
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("browser")
+    group.addoption(
+        "--chromedriver",
+        metavar="PATH",
+        default=None,
+        help="Path chromedriver lokal (default: env CHROMEDRIVER_PATH, PATH, lalu cache/webdriver-manager).",
+    )
+    group.addoption(
+        "--no-browser-reuse",
+        action="store_true",
+        default=False,
+        help="Launch Chrome baru untuk setiap test (tanpa pool).",
+    )
+    group.addoption(
+        "--browser-context",
+        action="store_true",
+        default=False,
+        help="Isolasi per test lewat CDP browser context di Chrome dari pool (fallback: Chrome baru per test).",
+    )
+    group.addoption(
+        "--browser-max-uses",
+        type=int,
+        default=25,
+        help="Jumlah test maksimal per driver sebelum di-recycle.",
+    )
+    group.addoption(
+        "--ui-login",
+        action="store_true",
+        default=False,
+        help="Login lewat form di setiap test (tanpa snapshot auth).",
+    )
+    group.addoption(
+        "--local-app",
+        action="store_true",
+        default=False,
+        help="Jalankan test ke stand-in lokal (util/local_app.py), bukan ke Netlify.",
+    )
+    group.addoption(
+        "--app-latency-ms",
+        type=float,
+        default=0.0,
+        help="Latency buatan per request untuk stand-in lokal (ms).",
+    )
+    group.addoption(
+        "--asset-cache",
+        metavar="DIR",
+        default=None,
+        help="Layani aset statis dari cache disk lewat intersepsi CDP Fetch (content-addressed, per URL + ETag).",
+    )
+    group.addoption(
+        "--asset-cache-offline",
+        action="store_true",
+        default=False,
+        help="Dengan --asset-cache: semua request dari cache, tanpa network sama sekali.",
+    )
+    group.addoption(
+        "--block-third-party",
+        action="store_true",
+        default=False,
+        help="Dengan --asset-cache: blokir request ke host selain aplikasi (font, analytics).",
+    )
+    group.addoption(
+        "--perf-metrics",
+        action="store_true",
+        default=False,
+        help="Kumpulkan metrik performa frontend per aksi page object (otomatis untuk test dengan marker perf_budget).",
+    )
+    group.addoption(
+        "--profile-webdriver",
+        metavar="DIR",
+        default=None,
+        help="Profil setiap WebDriver command per test; tulis profile.json + summary.csv ke DIR.",
+    )
+    group.addoption(
+        "--profile-top",
+        type=int,
+        default=10,
+        help="Jumlah method page object paling lambat yang dicetak di akhir sesi.",
+    )
+    group.addoption(
+        "--screenshot-workers",
+        type=int,
+        default=2,
+        help="Jumlah thread yang menulis screenshot di background.",
+    )
+    group.addoption(
+        "--screenshot-format",
+        choices=sorted(FORMATS),
+        default="png",
+        help="Format file screenshot; webp/jpeg butuh Pillow (default: png apa adanya dari browser).",
+    )
+    group.addoption(
+        "--screenshot-scale",
+        type=float,
+        default=1.0,
+        help="Downscale screenshot (mis. 0.5); butuh Pillow.",
+    )
+    group.addoption(
+        "--evidence",
+        action="store_true",
+        default=False,
+        help="Aktifkan screenshot evidence eksplisit (take_screenshot) di test yang lulus.",
+    )
+    group.addoption(
+        "--failure-capture",
+        choices=MODES,
+        default="off",
+        help=(
+            "Ring buffer frame terakhir yang di-dump saat test gagal: off (hanya page source + screenshot "
+            "saat gagal), dom (+1 round trip per aksi), atau screenshot."
+        ),
+    )
+    group.addoption(
+        "--failure-frames",
+        type=int,
+        default=5,
+        help="Jumlah frame terakhir yang disimpan di ring buffer.",
+    )
+    group.addoption(
+        "--failure-dir",
+        metavar="DIR",
+        default="reports/failures",
+        help="Folder dump frame + page source test yang gagal.",
+    )
+    group.addoption(
+        "--adaptive-timeouts",
+        action="store_true",
+        default=False,
+        help="Pakai timeout per wait dari history latency (p99 x margin, tidak pernah melebihi timeout hard-coded).",
+    )
+    group.addoption(
+        "--timeout-margin",
+        type=float,
+        default=3.0,
+        help="Pengali p99 latency untuk timeout adaptif.",
+    )
+    group.addoption(
+        "--wait-timings",
+        metavar="PATH",
+        default=TIMINGS_FILE,
+        help="File history latency wait (dibaca dan di-update tiap sesi).",
+    )
+    group.addoption(
+        "--timeout-report-ratio",
+        type=float,
+        default=10.0,
+        help="Laporkan wait yang timeout-nya >= N x p99 latency teramati.",
+    )
+    group.addoption(
+        "--nav-mode",
+        choices=NAV_MODES,
+        default="click",
+        help="Cara Navigator pindah halaman: click (menu sidebar), history (pushState SPA), atau url (load penuh).",
+    )
+
+    bench = parser.getgroup("benchmark")
+    bench.addoption(
+        "--bench-rounds",
+        type=int,
+        default=10,
+        help="Jumlah putaran terukur per operasi benchmark (setelah 1 putaran warmup).",
+    )
+    bench.addoption(
+        "--bench-out",
+        metavar="PATH",
+        default="reports/benchmark.json",
+        help="File JSON hasil benchmark (bandingkan dengan `python -m util.benchmark`).",
+    )
+    bench.addoption(
+        "--soak-cycles",
+        type=int,
+        default=200,
+        help="Jumlah siklus cart (add, +, -, remove) untuk test soak/leak.",
+    )
+    bench.addoption(
+        "--soak-max-heap-growth",
+        type=float,
+        default=2048,
+        help="Batas pertumbuhan heap JS per siklus (byte, sesudah GC) sebelum test soak gagal.",
+    )
+    bench.addoption(
+        "--soak-out",
+        metavar="DIR",
+        default="reports/soak",
+        help="Folder CSV time series heap / node / listener per run soak.",
+    )
+    bench.addoption(
+        "--scaling-sizes",
+        default="1000,5000,10000",
+        help=(
+            "Ukuran dataset transaksi (dipisah koma) untuk kurva scaling Reports/Transactions. "
+            "Default muat di kuota localStorage; ukuran >18rb opt-in (dicatat QuotaExceededError)."
+        ),
+    )
+    bench.addoption(
+        "--scaling-out",
+        metavar="PATH",
+        default="reports/scaling.json",
+        help="File JSON kurva scaling (waktu render per ukuran dataset).",
+    )
+
+
+def _timing_target(config):
+    """Kunci history latency wait: URL aplikasi, atau stand-in lokal + latency-nya."""
+    if config.getoption("--local-app"):
+        return f"local-app@{config.getoption('--app-latency-ms'):g}ms"
     return BASE_URL
 
 
+def pytest_configure(config):
+    Navigator.default_mode = config.getoption("--nav-mode")
+    TIMINGS.configure(
+        path=config.getoption("--wait-timings"),
+        adaptive=config.getoption("--adaptive-timeouts"),
+        margin=config.getoption("--timeout-margin"),
+        target=_timing_target(config),
+    )
+    SCREENSHOTS.configure(
+        workers=config.getoption("--screenshot-workers"),
+        fmt=config.getoption("--screenshot-format"),
+        scale=config.getoption("--screenshot-scale"),
+        enabled=config.getoption("--evidence"),
+    )
+    if config.getoption("--profile-webdriver"):
+        config.stash[profiler_key] = WebDriverProfiler()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Worker paralel hanya menjalankan node id di shard-nya (lihat util/parallel.py)."""
+    shard_file = os.environ.get("PWDK_SHARD_FILE")
+    if not shard_file:
+        return
+    with open(shard_file, encoding="utf-8") as f:
+        shard = set(json.load(f))
+    selected = [item for item in items if item.nodeid in shard]
+    deselected = [item for item in items if item.nodeid not in shard]
+    missing = shard - {item.nodeid for item in selected}
+    if missing:
+        # Jangan sampai test hilang diam-diam dari run paralel
+        raise pytest.UsageError(f"{len(missing)} node id di shard tidak ter-collect: {sorted(missing)[:5]}")
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """Gagalkan test kalau metrik aksi page object melewati @pytest.mark.perf_budget."""
+    result = yield
+    recorder = item.stash.get(perf_key, None)
+    if recorder is not None:
+        violations = []
+        for marker in item.iter_markers("perf_budget"):
+            violations += recorder.check_budget(*marker.args, **marker.kwargs)
+        if violations:
+            pytest.fail("Perf budget terlampaui:\n" + "\n".join(violations))
+    return result
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Test gagal: dump ring buffer frame + page source + screenshot ke disk dan report HTML."""
+    report = yield
+    recorder = item.stash.get(frame_recorder_key, None)
+    if recorder is None or not report.failed or report.when not in ("setup", "call") or recorder.driver is None:
+        return report
+    out_dir = os.path.join(os.environ.get("SCREENSHOT_ROOT", ""), item.config.getoption("--failure-dir"))
+    attachments = recorder.dump(item.nodeid, out_dir)
+    report.extras = getattr(report, "extras", []) + [
+        html_extras.png(content, name=label) if kind == "png" else html_extras.text(content, name=label)
+        for label, kind, content in attachments
+    ]
+    recorder.clear()
+    return report
+
+
+def pytest_runtest_logreport(report):
+    """Catat durasi setup + call + teardown per test untuk balancing paralel."""
+    test_durations[report.nodeid] = test_durations.get(report.nodeid, 0.0) + report.duration
+
+
+def pytest_sessionfinish(session):
+    SCREENSHOTS.shutdown()
+    TIMINGS.save(WAIT_METRICS)
+
+    profiler = session.config.stash.get(profiler_key, None)
+    if profiler is not None:
+        profiler.write(session.config.getoption("--profile-webdriver"))
+
+    if not test_durations:
+        return
+    path = os.environ.get("TEST_DURATIONS_FILE", DURATIONS_FILE)
+    history = load_durations(path)
+    history.update(test_durations)
+    save_durations(history, path)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    provider = config.stash.get(driver_provider_key, None)
+    if provider is not None:
+        terminalreporter.write_sep("-", "chromedriver")
+        terminalreporter.write_line(provider.summary())
+    pool = config.stash.get(browser_pool_key, None)
+    if pool is not None:
+        terminalreporter.write_sep("-", "browser pool")
+        terminalreporter.write_line(pool.summary())
+    asset_cache = config.stash.get(asset_cache_key, None)
+    if asset_cache is not None:
+        terminalreporter.write_sep("-", "asset cache")
+        terminalreporter.write_line(asset_cache.summary())
+    if config.getoption("--browser-context"):
+        terminalreporter.write_sep("-", "browser contexts")
+        terminalreporter.write_line(BrowserContext.summary())
+    if element_cache_by_test:
+        hits = sum(c["hits"] for c in element_cache_by_test.values())
+        misses = sum(c["misses"] for c in element_cache_by_test.values())
+        stale = sum(c["stale"] for c in element_cache_by_test.values())
+        terminalreporter.write_sep("-", "element cache")
+        terminalreporter.write_line(f"hits={hits}, misses={misses}, stale={stale}")
+    profiler = config.stash.get(profiler_key, None)
+    if profiler is not None and profiler.profiles:
+        terminalreporter.write_sep("-", "slowest page-object methods (webdriver time)")
+        terminalreporter.write_line(f"{'method':<45}{'calls':>8}{'time (s)':>12}")
+        for method, stats in profiler.top_methods(config.getoption("--profile-top")):
+            terminalreporter.write_line(f"{method:<45}{stats['calls']:>8}{stats['time']:>12.3f}")
+    if perf_samples:
+        by_action = {}
+        for sample in perf_samples:
+            by_action.setdefault(sample["name"], []).append(sample["duration_ms"])
+        terminalreporter.write_sep("-", "frontend perf (per aksi page object)")
+        terminalreporter.write_line(f"{'action':<50}{'n':>5}{'median (ms)':>14}{'max (ms)':>12}")
+        for name, values in sorted(by_action.items()):
+            terminalreporter.write_line(
+                f"{name:<50}{len(values):>5}{statistics.median(values):>14.1f}{max(values):>12.1f}"
+            )
+    if SCREENSHOTS.stats["captured"]:
+        terminalreporter.write_sep("-", "screenshots")
+        terminalreporter.write_line(SCREENSHOTS.summary())
+    if NAV_METRICS.samples:
+        terminalreporter.write_sep("-", "navigation (route.mode)")
+        for line in NAV_METRICS.summary():
+            terminalreporter.write_line(line)
+    if WAIT_METRICS.samples:
+        terminalreporter.write_sep("-", "waits")
+        for line in WAIT_METRICS.summary():
+            terminalreporter.write_line(line)
+        ratio = config.getoption("--timeout-report-ratio")
+        overgenerous = TIMINGS.overgenerous(WAIT_METRICS, ratio)
+        if overgenerous:
+            terminalreporter.write_sep("-", f"timeout >= {ratio:g}x p99 latency")
+            terminalreporter.write_line(f"{'wait':<45}{'timeout (s)':>12}{'p99 (s)':>10}{'n':>6}")
+            for name, limit, p99, n in overgenerous:
+                terminalreporter.write_line(f"{name:<45}{limit:>12.2f}{p99:>10.3f}{n:>6}")
+
+
+@pytest.fixture(scope="session")
+def app_url(request):
+    """URL utama aplikasi (Netlify, atau stand-in lokal dengan --local-app)."""
+    if not request.config.getoption("--local-app"):
+        yield BASE_URL
+        return
+
+    latency = request.config.getoption("--app-latency-ms") / 1000
+    with LocalAppServer(latency=latency) as server:
+        yield server.url
+
+
 @pytest.fixture(scope="session")
 def creds():
     """Kredensial admin."""
     return ADMIN
 
 
+@pytest.fixture(scope="session")
+def chromedriver(request):
+    """Resolve binary chromedriver sekali per sesi (lihat util/driver_provider.py)."""
+    provider = ChromeDriverProvider(request.config.getoption("--chromedriver"))
+    provider.path()
+    request.config.stash[driver_provider_key] = provider
+    return provider
+
+
+@pytest.fixture(scope="session")
+def browser_pool(request, chromedriver):
+    """Pool driver yang dipakai ulang selama satu sesi test."""
+    pool = BrowserPool(
+        lambda: create_driver(chromedriver), max_uses=request.config.getoption("--browser-max-uses")
+    )
+    request.config.stash[browser_pool_key] = pool
+    yield pool
+    pool.close_all()
+
+
+@pytest.fixture(scope="session")
+def asset_cache(request, app_url):
+    """Cache aset CDP (None kalau --asset-cache tidak dipakai)."""
+    folder = request.config.getoption("--asset-cache")
+    if not folder:
+        yield None
+        return
+    cache = AssetCache(
+        folder,
+        app_url,
+        offline=request.config.getoption("--asset-cache-offline"),
+        block_third_party=request.config.getoption("--block-third-party"),
+    )
+    request.config.stash[asset_cache_key] = cache
+    yield cache
+    cache.close()
+
+
+def _profiled(request, drv):
+    profiler = request.config.stash.get(profiler_key, None)
+    return profiler.track(request.node.nodeid, drv) if profiler is not None else nullcontext()
+
+
+@contextmanager
+def _instrumented(request, drv):
+    """Profiler (kalau aktif) + ring buffer frame untuk dump saat test gagal."""
+    recorder = FrameRecorder(request.config.getoption("--failure-capture"), request.config.getoption("--failure-frames"))
+    request.node.stash[frame_recorder_key] = recorder
+    with _profiled(request, drv), recorder.track(drv):
+        yield
+
+
 @pytest.fixture(scope="function")
-def driver():
-    opts = Options()
-
-    # Jalankan headless jika tidak perlu lihat browser
-    opts.add_argument("--headless=new")  # Comment kalau mau lihat browser
-    opts.add_argument("--window-size=1440,1080")
-    opts.add_experimental_option("excludeSwitches", ["enable-logging"])
-    # Optimisasi startup
-    opts.add_argument("--disable-extensions")
-    opts.add_argument("--disable-gpu")
-    opts.add_argument("--log-level=3") 
-    opts.add_argument("--no-sandbox")
-    opts.add_argument("--disable-dev-shm-usage")
-    
-    drv = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=opts)
-    drv.implicitly_wait(5)
-    yield drv
-    drv.quit()
+def driver(request, app_url, asset_cache):
+    use_context = request.config.getoption("--browser-context")
+    if use_context and BrowserContext.supported:
+        pool = request.getfixturevalue("browser_pool")
+        drv = pool.acquire()
+        context = BrowserContext.open(drv, app_url)
+        if context is not None:
+            if asset_cache is not None:
+                asset_cache.attach(drv)
+            with _instrumented(request, drv):
+                yield drv
+            try:
+                if asset_cache is not None:
+                    asset_cache.detach(drv)
+                context.close()
+            except Exception as e:
+                logger.warning(f"⚠️ Browser context gagal ditutup, driver di-recycle: {type(e).__name__}: {e}")
+                pool.discard(drv)
+                return
+            # Tab awal tidak disentuh test, cukup reset ringan tanpa navigasi
+            pool.release(drv)
+            return
+        pool.release(drv, reset_url=app_url)
+
+    if use_context or request.config.getoption("--no-browser-reuse"):
+        drv = create_driver(request.getfixturevalue("chromedriver"))
+        if asset_cache is not None:
+            asset_cache.attach(drv)
+        with _instrumented(request, drv):
+            yield drv
+        if asset_cache is not None:
+            asset_cache.detach(drv)
+        drv.quit()
+        return
+
+    pool = request.getfixturevalue("browser_pool")
+    drv = pool.acquire()
+    if asset_cache is not None:
+        # Interceptor tetap terpasang selama driver ada di pool (no-op kalau sudah)
+        asset_cache.attach(drv)
+    with _instrumented(request, drv):
+        yield drv
+    pool.release(drv, reset_url=app_url)
+
+
+@pytest.fixture(scope="session")
+def auth_snapshot(request, app_url, creds):
+    """Login sekali per sesi dan simpan state-nya (localStorage + cookies)."""
+    if request.config.getoption("--ui-login"):
+        return None
+
+    if request.config.getoption("--no-browser-reuse"):
+        drv = create_driver(request.getfixturevalue("chromedriver"))
+        try:
+            return AuthSnapshot.capture(drv, app_url, creds)
+        finally:
+            drv.quit()
+
+    pool = request.getfixturevalue("browser_pool")
+    drv = pool.acquire()
+    try:
+        return AuthSnapshot.capture(drv, app_url, creds)
+    finally:
+        pool.release(drv, reset_url=app_url)
+
+
+@pytest.fixture(scope="function")
+def logged_in(auth_snapshot, driver, app_url, creds):
+    """
+    Driver yang sudah login. Pakai snapshot auth kalau ada,
+    fallback ke form login kalau snapshot tidak berhasil.
+    """
+    if auth_snapshot is not None and auth_snapshot.restore(driver, app_url):
+        return driver
+
+    lp = LoginPage(driver)
+    lp.visit(app_url)
+    lp.login(creds["email"], creds["password"])
+    lp.assert_logged_in()
+    return driver
+
+
+@pytest.fixture(scope="function")
+def cart_state(logged_in):
+    """Akses cart aplikasi langsung lewat localStorage (seed/clear/read)."""
+    return CartState(logged_in)
+
+
+@pytest.fixture(autouse=True)
+def element_cache_stats(request):
+    """Counter hit/miss element cache per test (masuk ke user_properties report)."""
+    ELEMENT_CACHE_STATS.reset()
+    yield ELEMENT_CACHE_STATS
+    stats = ELEMENT_CACHE_STATS.as_dict()
+    element_cache_by_test[request.node.nodeid] = stats
+    request.node.user_properties.append(("element_cache", stats))
+
+
+@pytest.fixture(autouse=True)
+def perf_metrics(request):
+    """
+    Recorder metrik frontend per test (--perf-metrics atau marker perf_budget).
+    Sample per aksi masuk ke user_properties report sebagai "perf_metrics".
+    """
+    enabled = request.config.getoption("--perf-metrics") or request.node.get_closest_marker("perf_budget")
+    if not enabled or "driver" not in request.fixturenames:
+        yield None
+        return
+
+    drv = request.getfixturevalue("driver")
+    recorder = PerfRecorder.start(drv)
+    request.node.stash[perf_key] = recorder
+    yield recorder
+    PerfRecorder.stop(drv)
+    perf_samples.extend(recorder.samples)
+    request.node.user_properties.append(("perf_metrics", recorder.samples))
@@ -3,3 +3,11 @@ ADMIN = {
     "email": "admin@pos.com",
     "password": "admin",
 }
+
+# Key localStorage yang dipakai aplikasi (sama dengan stand-in di data/local_app)
+STORAGE_KEYS = {
+    "user": "pos_user",
+    "cart": "pos_cart",
+    "products": "pos_products",
+    "transactions": "pos_transactions",
+}
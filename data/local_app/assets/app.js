@@ -0,0 +1,690 @@
+/*
+ * Stand-in lokal untuk Simple POS (https://simple-pos-pwdk.netlify.app/).
+ * Struktur DOM dan class mengikuti locator di pages/*.py; state disimpan
+ * di localStorage seperti aplikasi aslinya.
+ */
+(function () {
+  "use strict";
+
+  var KEYS = {
+    user: "pos_user",
+    cart: "pos_cart",
+    products: "pos_products",
+    transactions: "pos_transactions",
+  };
+
+  var ADMIN = { email: "admin@pos.com", password: "admin", name: "Admin" };
+
+  var PRODUCTS = [
+    { id: 1, name: "Wireless Headphones", category: "Electronics", price: 99.99, cost: 60, stock: 15 },
+    { id: 2, name: "Smart Watch", category: "Electronics", price: 199.99, cost: 120, stock: 8 },
+    { id: 3, name: "Bluetooth Speaker", category: "Electronics", price: 59.99, cost: 35, stock: 20 },
+    { id: 4, name: "Cotton T-Shirt", category: "Clothing", price: 19.99, cost: 8, stock: 50 },
+    { id: 5, name: "Denim Jeans", category: "Clothing", price: 49.99, cost: 25, stock: 30 },
+    { id: 6, name: "Coffee Beans", category: "Food & Beverage", price: 14.99, cost: 7, stock: 5 },
+    { id: 7, name: "Green Tea", category: "Food & Beverage", price: 9.99, cost: 4, stock: 40 },
+    { id: 8, name: "JavaScript Guide", category: "Books", price: 39.99, cost: 20, stock: 12 },
+    { id: 9, name: "Python Cookbook", category: "Books", price: 44.99, cost: 22, stock: 10 },
+    { id: 10, name: "Desk Lamp", category: "Home", price: 29.99, cost: 15, stock: 0 },
+  ];
+
+  var ROUTES = ["/login", "/pos", "/transactions", "/reports"];
+
+  // -------------------------
+  // Storage
+  // -------------------------
+  function load(key, fallback) {
+    try {
+      var raw = localStorage.getItem(key);
+      return raw ? JSON.parse(raw) : fallback;
+    } catch (e) {
+      return fallback;
+    }
+  }
+
+  function save(key, value) {
+    localStorage.setItem(key, JSON.stringify(value));
+  }
+
+  function products() {
+    var stored = load(KEYS.products, null);
+    if (!stored) {
+      save(KEYS.products, PRODUCTS);
+      stored = PRODUCTS;
+    }
+    return stored;
+  }
+
+  function cart() {
+    return load(KEYS.cart, []);
+  }
+
+  function transactions() {
+    return load(KEYS.transactions, []);
+  }
+
+  // -------------------------
+  // Helpers
+  // -------------------------
+  function esc(value) {
+    return String(value)
+      .replace(/&/g, "&amp;")
+      .replace(/</g, "&lt;")
+      .replace(/>/g, "&gt;")
+      .replace(/"/g, "&quot;")
+      .replace(/'/g, "&#39;");
+  }
+
+  function money(value) {
+    return "$" + Number(value).toFixed(2);
+  }
+
+  function pad(n) {
+    return (n < 10 ? "0" : "") + n;
+  }
+
+  function dateKey(d) {
+    return d.getFullYear() + "-" + pad(d.getMonth() + 1) + "-" + pad(d.getDate());
+  }
+
+  function txId(d) {
+    return (
+      "TXN-" + d.getFullYear() + pad(d.getMonth() + 1) + pad(d.getDate()) +
+      "-" + pad(d.getHours()) + pad(d.getMinutes()) + pad(d.getSeconds())
+    );
+  }
+
+  function root() {
+    return document.getElementById("root");
+  }
+
+  // -------------------------
+  // Routing
+  // -------------------------
+  function currentPath() {
+    var path = window.location.pathname.replace(/\/+$/, "") || "/";
+    return ROUTES.indexOf(path) === -1 ? "/" : path;
+  }
+
+  function navigate(path) {
+    if (window.location.pathname !== path) {
+      window.history.pushState({}, "", path);
+    }
+    render();
+  }
+
+  function render() {
+    var path = currentPath();
+    var user = load(KEYS.user, null);
+    if (!user && path !== "/login") {
+      return navigate("/login");
+    }
+    if (user && (path === "/" || path === "/login")) {
+      return navigate("/pos");
+    }
+    if (path === "/login") return renderLogin();
+    if (path === "/transactions") return renderTransactions();
+    if (path === "/reports") return renderReports();
+    return renderPos();
+  }
+
+  window.addEventListener("popstate", render);
+
+  // -------------------------
+  // Login
+  // -------------------------
+  function renderLogin() {
+    root().innerHTML =
+      '<div class="flex h-screen">' +
+      '<main class="flex-1 p-6">' +
+      '<div class="shadow-lg p-6">' +
+      '<h2 class="text-3xl">Welcome back</h2>' +
+      '<p>Sign in to your POS account</p>' +
+      '<div id="login-error"></div>' +
+      '<form id="login-form">' +
+      '<label>Email <input type="email" name="email" /></label>' +
+      '<label>Password <input type="password" name="password" /></label>' +
+      '<button type="submit">Sign In</button>' +
+      "</form>" +
+      "</div>" +
+      "</main>" +
+      "</div>";
+
+    document.getElementById("login-form").addEventListener("submit", function (ev) {
+      ev.preventDefault();
+      var email = ev.target.email.value.trim();
+      var password = ev.target.password.value;
+      if (email === ADMIN.email && password === ADMIN.password) {
+        save(KEYS.user, { email: ADMIN.email, name: ADMIN.name });
+        navigate("/pos");
+      } else {
+        document.getElementById("login-error").innerHTML =
+          '<div class="bg-red-50 border border-red-200 text-red-600 px-4 py-2">Invalid credentials</div>';
+      }
+    });
+  }
+
+  // -------------------------
+  // Layout
+  // -------------------------
+  function layout(content) {
+    var menu = [
+      ["/pos", "Point of Sale"],
+      ["/transactions", "Transactions"],
+      ["/reports", "Reports"],
+    ];
+    var nav = menu
+      .map(function (m) {
+        return '<button data-route="' + m[0] + '"><span>' + m[1] + "</span></button>";
+      })
+      .join("");
+    root().innerHTML =
+      '<div class="flex h-screen">' +
+      '<main class="flex-1">' + content + "</main>" +
+      '<aside class="w-64 border p-4"><nav>' + nav +
+      '<button data-action="logout"><span>Sign Out</span></button>' +
+      "</nav></aside>" +
+      "</div>";
+
+    root().querySelectorAll("aside button[data-route]").forEach(function (btn) {
+      btn.addEventListener("click", function () {
+        navigate(btn.getAttribute("data-route"));
+      });
+    });
+    root().querySelector("aside button[data-action='logout']").addEventListener("click", function () {
+      localStorage.removeItem(KEYS.user);
+      navigate("/login");
+    });
+  }
+
+  // -------------------------
+  // POS
+  // -------------------------
+  var posState = { query: "", category: "", checkout: null };
+
+  function renderPos() {
+    var categories = [];
+    products().forEach(function (p) {
+      if (categories.indexOf(p.category) === -1) categories.push(p.category);
+    });
+    var options = ['<option value="">All Categories</option>']
+      .concat(
+        categories.map(function (c) {
+          return '<option value="' + esc(c) + '">' + esc(c) + "</option>";
+        })
+      )
+      .join("");
+
+    layout(
+      '<div class="grid grid-cols-1 lg:grid-cols-3 gap-6 p-6">' +
+      '<div class="lg:col-span-2">' +
+      '<h1 class="text-2xl font-bold">POS System</h1>' +
+      '<div class="flex gap-4">' +
+      '<input type="text" placeholder="Search products..." class="px-4 py-2 border" />' +
+      '<select class="px-4 py-2 border">' + options + "</select>" +
+      "</div>" +
+      '<div id="product-grid" class="grid grid-cols-1 md:grid-cols-3 gap-4"></div>' +
+      "</div>" +
+      '<div class="lg:col-span-1">' +
+      '<div id="cart" class="shadow-lg p-6"></div>' +
+      "</div>" +
+      "</div>" +
+      '<div id="checkout-root"></div>'
+    );
+
+    var search = root().querySelector("input[placeholder='Search products...']");
+    var select = root().querySelector("select");
+    search.value = posState.query;
+    select.value = posState.category;
+    search.addEventListener("input", function () {
+      posState.query = search.value;
+      renderProductGrid();
+    });
+    select.addEventListener("change", function () {
+      posState.category = select.value;
+      renderProductGrid();
+    });
+
+    renderProductGrid();
+    renderCart();
+    renderCheckout();
+  }
+
+  function cartQty(productId) {
+    var item = cart().filter(function (i) {
+      return i.id === productId;
+    })[0];
+    return item ? item.quantity : 0;
+  }
+
+  function renderProductGrid() {
+    var grid = document.getElementById("product-grid");
+    if (!grid) return;
+    var q = posState.query.trim().toLowerCase();
+    var list = products().filter(function (p) {
+      return (!q || p.name.toLowerCase().indexOf(q) !== -1) &&
+        (!posState.category || p.category === posState.category);
+    });
+    if (!list.length) {
+      grid.innerHTML = "<p>No products found</p>";
+      return;
+    }
+    grid.innerHTML = list
+      .map(function (p) {
+        var disabled = p.stock <= 0 || cartQty(p.id) >= p.stock;
+        return (
+          '<div class="shadow-md p-4" data-product-id="' + p.id + '">' +
+          "<h3>" + esc(p.name) + "</h3>" +
+          '<span class="text-sm">' + esc(p.category) + "</span> " +
+          "<span>" + money(p.price) + "</span> " +
+          '<span class="text-sm">Stock: ' + p.stock + "</span>" +
+          "<button" + (disabled ? " disabled" : "") + "><span>Add to Cart</span></button>" +
+          "</div>"
+        );
+      })
+      .join("");
+    grid.querySelectorAll("div[data-product-id] button").forEach(function (btn) {
+      btn.addEventListener("click", function () {
+        addToCart(Number(btn.parentNode.getAttribute("data-product-id")));
+      });
+    });
+  }
+
+  function addToCart(productId) {
+    var product = products().filter(function (p) {
+      return p.id === productId;
+    })[0];
+    var items = cart();
+    var item = items.filter(function (i) {
+      return i.id === productId;
+    })[0];
+    if (item) {
+      if (item.quantity < product.stock) item.quantity += 1;
+    } else if (product.stock > 0) {
+      items.push({ id: product.id, name: product.name, price: product.price, quantity: 1 });
+    }
+    save(KEYS.cart, items);
+    renderCart();
+    renderProductGrid();
+  }
+
+  function updateQty(productId, delta) {
+    var stock = {};
+    products().forEach(function (p) {
+      stock[p.id] = p.stock;
+    });
+    var items = cart()
+      .map(function (i) {
+        if (i.id === productId) {
+          i.quantity = Math.min(i.quantity + delta, stock[i.id]);
+        }
+        return i;
+      })
+      .filter(function (i) {
+        return i.quantity > 0;
+      });
+    save(KEYS.cart, items);
+    renderCart();
+    renderProductGrid();
+  }
+
+  function cartTotal(items) {
+    return items.reduce(function (sum, i) {
+      return sum + i.price * i.quantity;
+    }, 0);
+  }
+
+  function renderCart() {
+    var box = document.getElementById("cart");
+    if (!box) return;
+    var items = cart();
+    var stock = {};
+    products().forEach(function (p) {
+      stock[p.id] = p.stock;
+    });
+
+    var body;
+    if (!items.length) {
+      body = '<div class="py-2"><p class="text-gray-500">Your cart is empty</p></div>';
+    } else {
+      body =
+        "<div>" +
+        items
+          .map(function (i) {
+            return (
+              '<div class="flex gap-2" data-product-id="' + i.id + '">' +
+              "<div><h3>" + esc(i.name) + '</h3><span class="text-sm">' + money(i.price) + "</span></div>" +
+              '<div class="flex gap-2">' +
+              '<div class="flex gap-2">' +
+              '<button data-action="decrease">-</button>' +
+              "<span>" + i.quantity + "</span>" +
+              '<button data-action="increase"' + (i.quantity >= stock[i.id] ? " disabled" : "") + ">+</button>" +
+              "</div>" +
+              '<button data-action="remove">Remove</button>' +
+              "</div>" +
+              "</div>"
+            );
+          })
+          .join("") +
+        "</div>";
+    }
+
+    box.innerHTML =
+      '<div><h2 class="text-2xl">Current Order</h2></div>' +
+      "<div>" + body + "</div>" +
+      '<div><span>Total: </span><span id="cart-total">' + money(cartTotal(items)) + "</span>" +
+      "<button" + (items.length ? "" : " disabled") + ' data-action="checkout">Checkout</button></div>';
+
+    box.querySelectorAll("div[data-product-id] button").forEach(function (btn) {
+      var row = btn.closest("div[data-product-id]");
+      var id = Number(row.getAttribute("data-product-id"));
+      btn.addEventListener("click", function () {
+        var action = btn.getAttribute("data-action");
+        if (action === "increase") updateQty(id, 1);
+        if (action === "decrease") updateQty(id, -1);
+        if (action === "remove") updateQty(id, -Infinity);
+      });
+    });
+    box.querySelector("button[data-action='checkout']").addEventListener("click", function () {
+      posState.checkout = { name: "", email: "", payment: "Cash" };
+      renderCheckout();
+    });
+  }
+
+  function renderCheckout() {
+    var holder = document.getElementById("checkout-root");
+    if (!holder) return;
+    var state = posState.checkout;
+    if (!state) {
+      holder.innerHTML = "";
+      return;
+    }
+    var methods = ["Cash", "Card", "Digital"];
+    holder.innerHTML =
+      '<div class="fixed inset-0 modal-backdrop">' +
+      '<div class="modal">' +
+      '<h2 class="text-2xl">Checkout</h2>' +
+      '<p>Total: <span id="checkout-total">' + money(cartTotal(cart())) + "</span></p>" +
+      '<input type="text" placeholder="Enter customer name" class="px-4 py-2 border" />' +
+      '<input type="email" placeholder="Enter customer email" class="px-4 py-2 border" />' +
+      '<div class="flex gap-2">' +
+      methods
+        .map(function (m) {
+          return '<button data-method="' + m + '"' + (state.payment === m ? ' class="selected"' : "") +
+            "><span>" + m + "</span></button>";
+        })
+        .join("") +
+      "</div>" +
+      '<button data-action="complete" disabled>Complete Transaction</button>' +
+      '<button data-action="cancel">Cancel</button>' +
+      "</div>" +
+      "</div>";
+
+    var name = holder.querySelector("input[placeholder='Enter customer name']");
+    var email = holder.querySelector("input[placeholder='Enter customer email']");
+    var complete = holder.querySelector("button[data-action='complete']");
+    function sync() {
+      state.name = name.value;
+      state.email = email.value;
+      complete.disabled = !(state.name.trim() && state.email.trim() && state.payment);
+    }
+    name.addEventListener("input", sync);
+    email.addEventListener("input", sync);
+    holder.querySelectorAll("button[data-method]").forEach(function (btn) {
+      btn.addEventListener("click", function () {
+        state.payment = btn.getAttribute("data-method");
+        holder.querySelectorAll("button[data-method]").forEach(function (b) {
+          b.className = b === btn ? "selected" : "";
+        });
+        sync();
+      });
+    });
+    holder.querySelector("button[data-action='cancel']").addEventListener("click", function () {
+      posState.checkout = null;
+      renderCheckout();
+    });
+    complete.addEventListener("click", function () {
+      var tx = completeTransaction(state);
+      posState.checkout = null;
+      renderPos();
+      window.alert("Transaction completed successfully! Transaction ID: " + tx.id);
+    });
+  }
+
+  function completeTransaction(state) {
+    var now = new Date();
+    var items = cart();
+    var tx = {
+      id: txId(now),
+      date: now.toISOString(),
+      customer: { name: state.name.trim(), email: state.email.trim() },
+      items: items.map(function (i) {
+        return { id: i.id, name: i.name, price: i.price, quantity: i.quantity };
+      }),
+      total: Math.round(cartTotal(items) * 100) / 100,
+      paymentMethod: state.payment,
+    };
+    var all = transactions();
+    all.push(tx);
+    save(KEYS.transactions, all);
+    save(KEYS.cart, []);
+    return tx;
+  }
+
+  // -------------------------
+  // Transactions
+  // -------------------------
+  var txState = { period: "all", query: "" };
+
+  function inPeriod(date, period, now) {
+    var start;
+    if (period === "today") {
+      start = new Date(now.getFullYear(), now.getMonth(), now.getDate());
+    } else if (period === "7d") {
+      start = new Date(now.getTime() - 7 * 86400000);
+    } else if (period === "30d") {
+      start = new Date(now.getTime() - 30 * 86400000);
+    } else if (period === "month") {
+      start = new Date(now.getFullYear(), now.getMonth(), 1);
+    } else if (period === "year") {
+      start = new Date(now.getFullYear(), 0, 1);
+    } else {
+      return true;
+    }
+    return date >= start && date <= now;
+  }
+
+  function renderTransactions() {
+    layout(
+      '<div class="p-6">' +
+      '<h1 class="text-2xl font-bold">Transactions</h1>' +
+      '<div class="flex gap-4">' +
+      '<input type="text" placeholder="Search by transaction ID..." class="px-4 py-2 border" />' +
+      '<select class="px-4 py-2 border">' +
+      '<option value="all">All Time</option>' +
+      '<option value="today">Today</option>' +
+      '<option value="7d">Last 7 Days</option>' +
+      '<option value="30d">Last 30 Days</option>' +
+      "</select>" +
+      "</div>" +
+      '<div id="transactions-table"></div>' +
+      "</div>"
+    );
+    var search = root().querySelector("input[placeholder='Search by transaction ID...']");
+    var select = root().querySelector("select");
+    search.value = txState.query;
+    select.value = txState.period;
+    search.addEventListener("input", function () {
+      txState.query = search.value;
+      renderTransactionTable();
+    });
+    select.addEventListener("change", function () {
+      txState.period = select.value;
+      renderTransactionTable();
+    });
+    renderTransactionTable();
+  }
+
+  function renderTransactionTable() {
+    var box = document.getElementById("transactions-table");
+    if (!box) return;
+    var now = new Date();
+    var q = txState.query.trim().toLowerCase();
+    var rows = transactions().filter(function (tx) {
+      return inPeriod(new Date(tx.date), txState.period, now) &&
+        (!q || tx.id.toLowerCase().indexOf(q) !== -1);
+    });
+    if (!rows.length) {
+      box.innerHTML = "<p>No transactions found</p>";
+      return;
+    }
+    box.innerHTML =
+      "<table><thead><tr>" +
+      "<th>Transaction ID</th><th>Date</th><th>Customer</th><th>Items</th><th>Payment</th><th>Total</th>" +
+      "</tr></thead><tbody>" +
+      rows
+        .map(function (tx) {
+          var qty = tx.items.reduce(function (s, i) {
+            return s + i.quantity;
+          }, 0);
+          return (
+            "<tr>" +
+            "<td>" + esc(tx.id) + "</td>" +
+            "<td>" + esc(new Date(tx.date).toLocaleString()) + "</td>" +
+            "<td>" + esc(tx.customer.name) + "<br/>" + esc(tx.customer.email) + "</td>" +
+            "<td>" + qty + " items</td>" +
+            "<td>" + esc(tx.paymentMethod) + "</td>" +
+            "<td>" + money(tx.total) + "</td>" +
+            "</tr>"
+          );
+        })
+        .join("") +
+      "</tbody></table>";
+  }
+
+  // -------------------------
+  // Reports
+  // -------------------------
+  var reportState = { period: "today" };
+
+  function renderReports() {
+    layout(
+      '<div class="p-6">' +
+      '<h1 class="text-2xl font-bold">Sales Reports</h1>' +
+      "<p>Track your business performance and sales analytics</p>" +
+      '<select class="px-4 py-2 border">' +
+      '<option value="today">Today</option>' +
+      '<option value="7d">Last 7 Days</option>' +
+      '<option value="month">This Month</option>' +
+      '<option value="year">This Year</option>' +
+      "</select>" +
+      '<div id="report-body"></div>' +
+      "</div>"
+    );
+    var select = root().querySelector("select");
+    select.value = reportState.period;
+    select.addEventListener("change", function () {
+      reportState.period = select.value;
+      renderReportBody();
+    });
+    renderReportBody();
+  }
+
+  function renderReportBody() {
+    var box = document.getElementById("report-body");
+    if (!box) return;
+    var now = new Date();
+    var cost = {};
+    products().forEach(function (p) {
+      cost[p.id] = p.cost;
+    });
+    var txs = transactions().filter(function (tx) {
+      return inPeriod(new Date(tx.date), reportState.period, now);
+    });
+
+    var revenue = 0;
+    var profit = 0;
+    var customers = {};
+    var daily = {};
+    var top = {};
+    txs.forEach(function (tx) {
+      revenue += tx.total;
+      customers[tx.customer.email] = true;
+      var day = dateKey(new Date(tx.date));
+      daily[day] = (daily[day] || 0) + tx.total;
+      tx.items.forEach(function (i) {
+        profit += (i.price - (cost[i.id] || 0)) * i.quantity;
+        var entry = top[i.name] || (top[i.name] = { name: i.name, sold: 0, total: 0 });
+        entry.sold += i.quantity;
+        entry.total += i.price * i.quantity;
+      });
+    });
+
+    var cards = [
+      ["Total Revenue", money(revenue)],
+      ["Total Orders", String(txs.length)],
+      ["Total Customers", String(Object.keys(customers).length)],
+      ["Total Profit", money(profit)],
+    ];
+    var days = Object.keys(daily).sort();
+    var topList = Object.keys(top)
+      .map(function (k) {
+        return top[k];
+      })
+      .sort(function (a, b) {
+        return b.total - a.total;
+      })
+      .slice(0, 5);
+
+    box.innerHTML =
+      '<div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6">' +
+      cards
+        .map(function (c) {
+          return (
+            '<div class="shadow-lg p-6">' +
+            '<p class="text-sm font-medium">' + c[0] + "</p>" +
+            '<p class="text-2xl font-semibold">' + c[1] + "</p>" +
+            "</div>"
+          );
+        })
+        .join("") +
+      "</div>" +
+      '<div class="grid grid-cols-1 lg:grid-cols-3 gap-6">' +
+      '<div class="shadow-lg p-6">' +
+      "<h3>Daily Sales</h3>" +
+      (days.length
+        ? days
+            .map(function (d) {
+              return (
+                '<div class="flex gap-4">' +
+                '<span class="text-sm text-gray-600">' + d + "</span>" +
+                '<span class="text-sm font-medium">' + money(daily[d]) + "</span>" +
+                "</div>"
+              );
+            })
+            .join("")
+        : "<p>No sales data for this period</p>") +
+      "</div>" +
+      '<div class="shadow-lg p-6">' +
+      "<h3>Top Products</h3>" +
+      (topList.length
+        ? topList
+            .map(function (t) {
+              return (
+                '<div class="flex gap-4">' +
+                "<div>" +
+                '<p class="font-medium text-gray-900">' + esc(t.name) + "</p>" +
+                '<p class="text-sm text-gray-500">' + t.sold + " sold</p>" +
+                "</div>" +
+                '<p class="font-semibold text-green-600">' + money(t.total) + "</p>" +
+                "</div>"
+              );
+            })
+            .join("")
+        : "<p>No product data for this period</p>") +
+      "</div>" +
+      "</div>";
+  }
+
+  render();
+})();
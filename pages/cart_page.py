@@ -1,10 +1,12 @@
 import logging
-import time
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from util.sidebar import Sidebar
+from pages.locators import CartLocators
+from pages.transactions_page import TransactionsPage
+from util.cart_state import CartState
+from util.commands import CommandCounter
+from util.element_cache import ElementCache
+from util.perf_metrics import perf_action
+from util.waits import AdaptiveWait, DomWaiter, probe
 import re
 
 logger = logging.getLogger(__name__)
@@ -12,37 +14,35 @@ logger = logging.getLogger(__name__)
 class CartPage:
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
-        # Lokator absolute cart (item pertama)
-        self.cart_item = "//*[@id='root']/div/main/div/div[2]/div/div[2]/div/div[1]"
-        self.qty_span = f"{self.cart_item}/div[2]/div/span"
-        self.btn_increase = f"{self.cart_item}/div[2]/div/button[2]"
-        self.btn_decrease = f"{self.cart_item}/div[2]/div/button[1]"
-        self.btn_remove = f"{self.cart_item}/div[2]/button"
+        self.wait = AdaptiveWait(driver, 10)
+        self.dom = DomWaiter(driver)
+        self.elements = ElementCache.for_driver(driver)
+        # Lokator absolute cart (item pertama), lihat pages/locators.py
+        self.cart_item = CartLocators.CART_ITEM[1]
+        self.qty_span = CartLocators.QTY_SPAN[1]
+        self.btn_increase = CartLocators.BTN_INCREASE[1]
+        self.btn_decrease = CartLocators.BTN_DECREASE[1]
+        self.btn_remove = CartLocators.BTN_REMOVE[1]
+        self.cart_items = CartLocators.CART_ITEMS[1]
 
         # Empty state
-        self.empty_title = "//*[@id='root']/div/main/div/div[2]/div/div/h2"
-        self.empty_desc = "//*[@id='root']/div/main/div/div[2]/div/div/p"
+        self.empty_title = CartLocators.EMPTY_TITLE[1]
+        self.empty_desc = CartLocators.EMPTY_DESC[1]
 
     # =========================
     # Cart Item Handling
     # =========================
     def find_product_in_cart(self):
         """Cek apakah ada produk di cart (item pertama)."""
-        try:
-            self.driver.find_element(By.XPATH, self.cart_item)
-            return True
-        except NoSuchElementException:
-            return False
+        return bool(probe(self.driver, CartLocators.CART_ITEM))
 
     def get_cart_items_count(self):
         """Hitung jumlah item di cart (pakai div.cart-item)."""
-        items = self.driver.find_elements(By.XPATH, "//*[@id='root']/div/main/div/div[2]/div/div[2]/div/div")
-        return len(items)
+        return len(probe(self.driver, CartLocators.CART_ITEMS))
 
     def get_cart_items(self):
         """Return semua elemen item cart."""
-        return self.driver.find_elements(By.XPATH, "//*[@id='root']/div/main/div/div[2]/div/div[2]/div/div")
+        return probe(self.driver, CartLocators.CART_ITEMS)
 
     # =========================
     # Quantity Handling
@@ -50,7 +50,7 @@ class CartPage:
     def get_quantity(self):
         """Ambil quantity produk pertama di cart."""
         try:
-            qty_text = self.driver.find_element(By.XPATH, self.qty_span).text.strip()
+            qty_text = self.elements.use(CartLocators.QTY_SPAN, lambda el: el.text).strip()
             qty = int(qty_text)
             logger.info(f"[get_quantity] ✅ Quantity saat ini: {qty}")
             return qty
@@ -58,46 +58,82 @@ class CartPage:
             logger.error(f"[get_quantity] ❌ Error: {e}")
             return 0
 
+    def _click_and_wait_qty(self, name, locator):
+        """Klik tombol lalu tunggu text quantity berubah (atau item hilang)."""
+        before = self.dom.snapshot(self.qty_span)
+        self.elements.use(locator, lambda el: el.click())
+        self.dom.until(name, "text_changed", self.qty_span, before["text"])
+
     def increase_quantity(self):
         """Klik tombol + sekali."""
-        btn = self.driver.find_element(By.XPATH, self.btn_increase)
-        btn.click()
-        time.sleep(0.3)
+        self._click_and_wait_qty("cart.increase_quantity", CartLocators.BTN_INCREASE)
 
     def decrease_quantity(self):
         """Klik tombol - sekali."""
-        btn = self.driver.find_element(By.XPATH, self.btn_decrease)
-        btn.click()
-        time.sleep(0.3)
+        self._click_and_wait_qty("cart.decrease_quantity", CartLocators.BTN_DECREASE)
 
     def increase_quantity_to_max(self, max_clicks=50):
         """Klik tombol + sampai disabled."""
         qty = self.get_quantity()
         for _ in range(max_clicks):
-            btn = self.driver.find_element(By.XPATH, self.btn_increase)
-            if btn.get_attribute("disabled"):
+            if self.elements.use(CartLocators.BTN_INCREASE, lambda el: el.get_attribute("disabled")):
                 logger.info("[increase_quantity_to_max] ✅ Tombol + sudah disabled")
                 break
-            btn.click()
-            time.sleep(0.3)
+            self._click_and_wait_qty("cart.increase_quantity_to_max", CartLocators.BTN_INCREASE)
             qty = self.get_quantity()
+        else:
+            logger.warning(f"[increase_quantity_to_max] ⚠️ Berhenti di {max_clicks} klik, tombol + belum disabled")
         return qty
 
+    def probe_stock_limit(self, product_name, ui_steps=2):
+        """
+        Mode cepat untuk cek batas stok: ambil stok dari data aplikasi, seed cart
+        ke (stok - ui_steps), lalu klik + sisanya lewat UI sampai tombol disabled.
+        `disabled` selalu dibaca dari DOM setelah langkah terakhir (juga tanpa klik UI).
+        Return dict: ceiling, quantity, clicks, disabled, round_trips.
+        """
+        with CommandCounter(self.driver) as counter:
+            state = CartState(self.driver)
+            product = next(
+                (p for p in state.products() if p["name"].lower() == product_name.lower()), None
+            )
+            if product is None:
+                raise AssertionError(f"Produk '{product_name}' tidak ada di data aplikasi")
+
+            ceiling = int(product["stock"])
+            clicks = 0
+            if ceiling > 0:
+                state.seed([(product["name"], max(ceiling - ui_steps, 1))])
+                while clicks <= ui_steps and not self.is_increase_disabled():
+                    self.increase_quantity()
+                    clicks += 1
+            qty = self.get_quantity()
+            disabled = self.is_increase_disabled()
+
+        result = {
+            "ceiling": ceiling,
+            "quantity": qty,
+            "clicks": clicks,
+            "disabled": disabled,
+            "round_trips": counter.count,
+        }
+        logger.info(f"[probe_stock_limit] ✅ {product_name}: {result}")
+        return result
+
     def decrease_quantity_to_zero(self):
         """Klik tombol - sampai produk hilang dari cart."""
         qty = self.get_quantity()
         logger.info(f"[decrease_quantity_to_zero] Mulai decrease dari qty={qty}")
         while self.find_product_in_cart():
-            btn = self.driver.find_element(By.XPATH, self.btn_decrease)
-            btn.click()
-            time.sleep(0.2)
+            self._click_and_wait_qty("cart.decrease_quantity_to_zero", CartLocators.BTN_DECREASE)
         logger.info("[decrease_quantity_to_zero] ✅ Produk sudah hilang dari cart")
 
     def is_increase_disabled(self):
-        """Cek apakah tombol + disabled."""
+        """Cek apakah tombol + disabled (atribut disabled atau is_enabled() dari DOM)."""
         try:
-            btn = self.driver.find_element(By.XPATH, self.btn_increase)
-            disabled = btn.get_attribute("disabled") is not None
+            disabled = self.elements.use(
+                CartLocators.BTN_INCREASE, lambda el: el.get_attribute("disabled") is not None or not el.is_enabled()
+            )
             logger.info(f"[is_increase_disabled] ✅ Disabled: {disabled}")
             return disabled
         except Exception as e:
@@ -110,9 +146,11 @@ class CartPage:
     def remove_product(self):
         """Klik tombol remove (trash)"""
         try:
-            self.driver.find_element(By.XPATH, self.btn_remove).click()
+            before = self.dom.snapshot(self.cart_items)
+            self.elements.use(CartLocators.BTN_REMOVE, lambda el: el.click())
+            self.elements.invalidate()
+            self.dom.until("cart.remove_product", "count_changed", self.cart_items, before["count"])
             logger.info("[remove_product] ✅ Produk dihapus dari cart")
-            time.sleep(0.5)
         except Exception as e:
             logger.error(f"[remove_product] ❌ Error: {e}")
 
@@ -120,13 +158,12 @@ class CartPage:
         """Hapus semua produk di cart kalau ada."""
         while self.find_product_in_cart():
             self.remove_product()
-            time.sleep(0.5)
         logger.info("[clear_cart_if_not_empty] ✅ Cart sudah kosong")
     
     def get_cart_empty_state(self):
         """Ambil teks empty state di cart (misal: 'Your cart is empty')."""
         try:
-            text = self.driver.find_element(By.CSS_SELECTOR, "p.text-gray-500").text.strip()
+            text = self.driver.find_element(*CartLocators.EMPTY_STATE_TEXT).text.strip()
             logger.info(f"[get_cart_empty_state] 📝 Empty state: '{text}'")
             return text
         except Exception as e:
@@ -136,48 +173,41 @@ class CartPage:
 
     def try_remove_when_empty(self):
         """Coba klik remove meskipun cart kosong (negative test)."""
-        try:
-            self.driver.find_element(By.XPATH, self.btn_remove).click()
+        buttons = probe(self.driver, CartLocators.BTN_REMOVE)
+        if buttons:
+            buttons[0].click()
             logger.warning("[try_remove_when_empty] ⚠️ Berhasil klik remove padahal cart kosong!")
-        except NoSuchElementException:
+        else:
             logger.info("[try_remove_when_empty] ✅ Tidak ada tombol remove (cart kosong)")
 
 
     # Checkout
 
+    @perf_action
     def checkout(self):
-        self.wait.until(
-            EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Checkout')]"))
-        ).click()
+        self.wait.until(EC.element_to_be_clickable(CartLocators.CHECKOUT_BUTTON)).click()
 
     def fill_customer_info(self, name, email):
         name_input = self.wait.until(
-            EC.visibility_of_element_located(
-                (By.CSS_SELECTOR, "input[placeholder='Enter customer name']")
-            )
+            EC.visibility_of_element_located(CartLocators.CUSTOMER_NAME_INPUT), name="checkout.customer_name"
         )
         name_input.clear()
         name_input.send_keys(name)
 
         email_input = self.wait.until(
-            EC.visibility_of_element_located(
-                (By.CSS_SELECTOR, "input[placeholder='Enter customer email']")
-            )
+            EC.visibility_of_element_located(CartLocators.CUSTOMER_EMAIL_INPUT), name="checkout.customer_email"
         )
         email_input.clear()
         email_input.send_keys(email)
 
     def select_payment_method(self, method="Cash"):
         self.wait.until(
-            EC.element_to_be_clickable(
-                (By.XPATH, f"//button[.//span[normalize-space()='{method}']]")
-            )
+            EC.element_to_be_clickable(CartLocators.PAYMENT_METHOD_BUTTON(method=method))
         ).click()
 
+    @perf_action
     def complete_transaction(self):
-        self.wait.until(
-            EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Complete Transaction')]"))
-        ).click()
+        self.wait.until(EC.element_to_be_clickable(CartLocators.COMPLETE_TRANSACTION_BUTTON)).click()
 
     def get_transaction_alert_and_id(self):
         """Ambil teks alert dan TXID dari alert browser."""
@@ -192,38 +222,28 @@ class CartPage:
         txid = match.group(0) if match else None
         return alert_text, txid
     
+    @perf_action
     def check_transactions_on_transaction_page(self, txid=None):
-        """Cek apakah transaksi (by TXID) muncul di halaman Transactions."""
+        """
+        Cek apakah transaksi (by TXID) muncul di halaman Transactions.
+        Tabel dibaca sekali lewat TransactionsPage (tidak per baris).
+        """
         try:
-            # Pakai helper sidebar
-            sidebar = Sidebar(self.driver)
-            sidebar.go_to_transactions()
-
-            # Tunggu heading Transactions muncul
-            self.wait.until(
-                EC.visibility_of_element_located((By.XPATH, "//h1[contains(., 'Transactions')]"))
-            )
-
-            # Tunggu tabel muncul
-            self.wait.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr"))
-            )
-
-            rows = self.driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
-            if not rows:
+            tp = TransactionsPage(self.driver)
+            tp.open()
+            index = tp.load()
+            if not index:
                 logger.warning("[check_transactions_on_transaction_page] ⚠️ Tidak ada transaksi di tabel")
                 return False
 
             if txid:
-                for row in rows:
-                    if txid in row.text:
-                        logger.info(f"[check_transactions_on_transaction_page] ✅ Transaksi {txid} ditemukan di tabel")
-                        return True
+                if tp.contains(txid):
+                    logger.info(f"[check_transactions_on_transaction_page] ✅ Transaksi {txid} ditemukan di tabel")
+                    return True
                 logger.error(f"[check_transactions_on_transaction_page] ❌ Transaksi {txid} TIDAK ditemukan")
                 return False
-            else:
-                last_row = rows[-1].text
-                logger.info(f"[check_transactions_on_transaction_page] ✅ Transaksi terakhir: {last_row}")
+
+            logger.info(f"[check_transactions_on_transaction_page] ✅ Transaksi terakhir: {tp.rows()[-1]}")
             return True
 
         except Exception as e:
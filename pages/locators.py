@@ -0,0 +1,128 @@
+"""
+Registry locator terpusat untuk semua page object.
+Locator statis berupa tuple (By, value); locator berparameter berupa
+LocatorTemplate yang meng-quote parameter dengan aman untuk XPath.
+"""
+from functools import lru_cache
+
+from selenium.webdriver.common.by import By
+
+
+def xpath_literal(value):
+    """Quote string untuk XPath 1.0 (aman untuk ' dan " sekaligus)."""
+    value = str(value)
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{p}'" for p in parts) + ")"
+
+
+class LocatorTemplate:
+    """
+    Locator berparameter. Placeholder `{name}` diisi sebagai literal XPath,
+    hasilnya di-cache supaya tidak di-build ulang tiap pemanggilan.
+    """
+
+    def __init__(self, by, template):
+        self.by = by
+        self.template = template
+
+    def __call__(self, **params):
+        return self._compile(tuple(sorted(params.items())))
+
+    @lru_cache(maxsize=256)
+    def _compile(self, params):
+        quoted = {key: xpath_literal(value) for key, value in params}
+        return (self.by, self.template.format(**quoted))
+
+    def __repr__(self):
+        return f"LocatorTemplate({self.by!r}, {self.template!r})"
+
+
+class LoginLocators:
+    EMAIL_INPUT = (By.CSS_SELECTOR, "input[type='email']")
+    PASSWORD_INPUT = (By.CSS_SELECTOR, "input[type='password']")
+    LOGIN_BUTTON = (By.CSS_SELECTOR, "button[type='submit']")
+    # Indikator sesudah login sukses - header POS System
+    DASHBOARD_INDICATOR = (By.CSS_SELECTOR, "h1.text-2xl.font-bold")
+    # Indikator error login (utama)
+    LOGIN_ERROR = (By.CSS_SELECTOR, ".bg-red-50.border.border-red-200.text-red-600")
+    # Fallback kalau markup banner error berubah
+    LOGIN_ERROR_FALLBACKS = (
+        (By.CSS_SELECTOR, "[role='alert']"),
+        (By.CSS_SELECTOR, "#login-error > *"),
+    )
+
+
+class ProductsLocators:
+    SEARCH_BOX = (By.CSS_SELECTOR, "input[placeholder='Search products...']")
+    CATEGORY_DROPDOWN = (By.CSS_SELECTOR, "select.px-4.py-2.border")
+    NO_PRODUCTS_MSG = (By.XPATH, "//p[normalize-space()='No products found']")
+    CART_PANEL = (By.XPATH, "//div[contains(@class,'lg:col-span-1')]")
+    CART_EMPTY_MSG = (By.XPATH, "//div[contains(@class,'lg:col-span-1')]//p[normalize-space()='Your cart is empty']")
+    PRODUCT_CARD = (By.XPATH, "//h3[normalize-space()]")
+    ADD_TO_CART_BUTTON = (By.XPATH, "//button[.//span[normalize-space()='Add to Cart']]")
+    CARD_ADD_TO_CART_BUTTON = (By.XPATH, ".//button[.//span[normalize-space()='Add to Cart']]")
+
+    PRODUCT_TITLE = LocatorTemplate(By.XPATH, "//h3[normalize-space()={name}]")
+    PRODUCT_CARD_BY_NAME = LocatorTemplate(
+        By.XPATH, "//h3[normalize-space()={name}]/ancestor::div[contains(@class,'shadow-md')]"
+    )
+    CART_PRODUCT_TITLE = LocatorTemplate(
+        By.XPATH, "//div[contains(@class,'lg:col-span-1')]//h3[normalize-space()={name}]"
+    )
+
+
+class CartLocators:
+    # Lokator absolute cart (item pertama)
+    CART_ITEMS = (By.XPATH, "//*[@id='root']/div/main/div/div[2]/div/div[2]/div/div")
+    CART_ITEM = (By.XPATH, "//*[@id='root']/div/main/div/div[2]/div/div[2]/div/div[1]")
+    QTY_SPAN = (By.XPATH, f"{CART_ITEM[1]}/div[2]/div/span")
+    BTN_INCREASE = (By.XPATH, f"{CART_ITEM[1]}/div[2]/div/button[2]")
+    BTN_DECREASE = (By.XPATH, f"{CART_ITEM[1]}/div[2]/div/button[1]")
+    BTN_REMOVE = (By.XPATH, f"{CART_ITEM[1]}/div[2]/button")
+
+    # Empty state
+    EMPTY_TITLE = (By.XPATH, "//*[@id='root']/div/main/div/div[2]/div/div/h2")
+    EMPTY_DESC = (By.XPATH, "//*[@id='root']/div/main/div/div[2]/div/div/p")
+    EMPTY_STATE_TEXT = (By.CSS_SELECTOR, "p.text-gray-500")
+
+    # Checkout
+    CHECKOUT_BUTTON = (By.XPATH, "//button[contains(., 'Checkout')]")
+    CUSTOMER_NAME_INPUT = (By.CSS_SELECTOR, "input[placeholder='Enter customer name']")
+    CUSTOMER_EMAIL_INPUT = (By.CSS_SELECTOR, "input[placeholder='Enter customer email']")
+    COMPLETE_TRANSACTION_BUTTON = (By.XPATH, "//button[contains(., 'Complete Transaction')]")
+    PAYMENT_METHOD_BUTTON = LocatorTemplate(By.XPATH, "//button[.//span[normalize-space()={method}]]")
+
+
+class TransactionsLocators:
+    HEADER = (By.XPATH, "//h1[contains(., 'Transactions')]")
+    TABLE = (By.XPATH, "//table")
+    ROWS = (By.CSS_SELECTOR, "table tbody tr")
+    FIRST_ROW_ID = (By.XPATH, "//table/tbody/tr[1]/td[1]")
+    EMPTY_STATE = (By.XPATH, "//p[normalize-space()='No transactions found']")
+    SEARCH_BOX = (By.CSS_SELECTOR, "input[placeholder='Search by transaction ID...']")
+    # Pagination belum ada di app; dipakai otomatis kalau nanti ditambahkan
+    NEXT_PAGE = (By.XPATH, "//button[normalize-space()='Next' or @aria-label='Next page' or @rel='next']")
+
+
+class ReportLocators:
+    HEADER_TITLE = (By.XPATH, "//h1[normalize-space()='Sales Reports']")
+    HEADER_DESC = (By.XPATH, "//p[contains(text(),'Track your business performance')]")
+    FILTER_DROPDOWN = (By.TAG_NAME, "select")
+    FILTER_OPTIONS = (By.TAG_NAME, "option")
+    SUMMARY_CARDS = (By.CSS_SELECTOR, "div.grid.grid-cols-1.md\\:grid-cols-2.lg\\:grid-cols-4.gap-6 > div")
+
+
+class SidebarLocators:
+    MENU_BUTTON = LocatorTemplate(By.XPATH, "//span[normalize-space()={menu}]/ancestor::button")
+
+
+class RouteLocators:
+    # Indikator siap per halaman tujuan navigasi (lihat util/navigation.py)
+    POS_READY = (By.XPATH, "//h1[normalize-space()='POS System']")
+    TRANSACTIONS_READY = TransactionsLocators.HEADER
+    REPORTS_READY = ReportLocators.HEADER_TITLE
+    LOGIN_READY = LoginLocators.EMAIL_INPUT
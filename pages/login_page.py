@@ -1,99 +1,125 @@
 # pages/login_page.py
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from pages.locators import LoginLocators
+from util.element_cache import ElementCache
+from util.perf_metrics import perf_action
+from util.waits import AdaptiveWait, DomWaiter
 
 
 class LoginPage:
     def __init__(self, driver, base_url=None, timeout: int = 10):
         self.driver = driver
         self.base_url = base_url.rstrip("/") if base_url else None
-        self.wait = WebDriverWait(driver, timeout)
+        self.wait = AdaptiveWait(driver, timeout)
+        self.timeout = timeout
+        self.dom = DomWaiter(driver, timeout=timeout)
 
-        # Locators (sesuaikan dengan AUT)
-        self.email_input = (By.CSS_SELECTOR, "input[type='email']")
-        self.password_input = (By.CSS_SELECTOR, "input[type='password']")
-        self.login_button = (By.CSS_SELECTOR, "button[type='submit']")
+        # Locators (sesuaikan dengan AUT, lihat pages/locators.py)
+        self.email_input = LoginLocators.EMAIL_INPUT
+        self.password_input = LoginLocators.PASSWORD_INPUT
+        self.login_button = LoginLocators.LOGIN_BUTTON
 
         # Indikator sesudah login sukses - header POS System
-        self.dashboard_indicator = (By.CSS_SELECTOR, "h1.text-2xl.font-bold")
+        self.dashboard_indicator = LoginLocators.DASHBOARD_INDICATOR
 
-        # Indikator error login (utama)
-        self.login_error = (By.CSS_SELECTOR, ".bg-red-50.border.border-red-200.text-red-600")
+        # Indikator error login (utama + fallback)
+        self.login_error = LoginLocators.LOGIN_ERROR
+        self.error_locators = (self.login_error, *LoginLocators.LOGIN_ERROR_FALLBACKS)
+
+        # Semua kemungkinan hasil submit, ditunggu sekaligus (urutan = prioritas)
+        self.outcomes = [("dashboard", self.dashboard_indicator)] + [("error", loc) for loc in self.error_locators]
 
     # -------------------------
     # Navigation
     # -------------------------
+    @perf_action
     def open(self):
         """Buka halaman login menggunakan base_url."""
         if self.base_url:
             self.driver.get(self.base_url)
+            ElementCache.for_driver(self.driver).invalidate()
         else:
             raise ValueError("base_url not set")
 
+    @perf_action
     def visit(self, url):
         """Visit URL spesifik (biasa dipakai dari fixture test)."""
         self.driver.get(url)
+        ElementCache.for_driver(self.driver).invalidate()
 
     # -------------------------
     # Actions
     # -------------------------
-    def login(self, email: str, password: str):
-        """Isi form login dan submit."""
-        email_el = self.wait.until(EC.visibility_of_element_located(self.email_input))
+    @perf_action
+    def login(self, email: str, password: str, wait: bool = True):
+        """
+        Isi form login dan submit. Dengan wait=True tunggu hasilnya (dashboard atau
+        error, mana yang muncul duluan) dan return "dashboard" / "error" / None (timeout).
+        """
+        email_el = self.wait.until(EC.visibility_of_element_located(self.email_input), name="login.email_input")
         email_el.clear()
         email_el.send_keys(email)
 
-        pass_el = self.wait.until(EC.visibility_of_element_located(self.password_input))
+        pass_el = self.wait.until(EC.visibility_of_element_located(self.password_input), name="login.password_input")
         pass_el.clear()
         pass_el.send_keys(password)
 
-        login_btn = self.wait.until(EC.element_to_be_clickable(self.login_button))
+        login_btn = self.wait.until(EC.element_to_be_clickable(self.login_button), name="login.submit_button")
         login_btn.click()
+        if wait:
+            return self.wait_for_outcome()[0]
+
+    def wait_for_outcome(self, timeout=None):
+        """
+        Tunggu dashboard ATAU banner error (semua locator sekaligus, satu timeout).
+        Return (nama, WebElement) atau (None, None) kalau tidak ada yang muncul.
+        """
+        return self.dom.first_of("login.outcome", self.outcomes, timeout=timeout)
 
     # -------------------------
     # Assertions / Getters
     # -------------------------
     def wait_no_error(self):
         """Pastikan tidak ada error (untuk login sukses)."""
-        try:
-            self.wait.until(EC.invisibility_of_element_located(self.login_error))
-            return True
-        except Exception:
-            raise AssertionError("Login gagal - error masih muncul")
+        outcome, el = self.wait_for_outcome()
+        if outcome == "error":
+            raise AssertionError(f"Login gagal - error masih muncul: {el.text.strip()!r}")
+        return True
 
     def get_pos_header_text(self):
         """Ambil teks header setelah login sukses."""
         header = self.wait.until(EC.visibility_of_element_located(self.dashboard_indicator))
         return header.text
 
+    @perf_action
     def assert_logged_in(self, expected_header="POS System"):
         """Pastikan login sukses dan header sesuai."""
-        self.wait_no_error()
-        actual_header = self.get_pos_header_text()
+        outcome, el = self.wait_for_outcome()
+        if outcome == "error":
+            raise AssertionError(f"Login gagal - error muncul: {el.text.strip()!r}")
+        if outcome is None:
+            raise AssertionError(f"Login gagal - dashboard tidak muncul dalam {self.timeout}s")
+        actual_header = el.text
         assert actual_header == expected_header, (
             f"Header mismatch. expected={expected_header!r}, actual={actual_header!r}"
         )
 
     # -------------------------
-    # Error helpers (baru)
+    # Error helpers
     # -------------------------
     def error_element(self, timeout: int = 10):
         """
-        Cari elemen error menggunakan locator utama, jika gagal coba fallback list.
-        Return WebElement jika ketemu, raise Timeout kalau tidak.
+        Tunggu banner error (locator utama + fallback) sekaligus dengan dashboard.
+        Return WebElement error; raise TimeoutException kalau dalam `timeout` detik
+        tidak ada error, termasuk kalau yang muncul justru dashboard (login sukses).
         """
-        try:
-            return self.wait.until(EC.visibility_of_element_located(self.login_error))
-        except Exception:
-            # Coba beberapa fallback yang umum dipakai UI
-            for loc in self._error_locators_fallback:
-                try:
-                    return self.wait.until(EC.visibility_of_element_located(loc))
-                except Exception:
-                    continue
-            # Kalau tetap tidak ketemu, naikkan lagi exception terakhir
-            raise
+        outcome, el = self.wait_for_outcome(timeout=timeout)
+        if outcome != "error":
+            raise TimeoutException(
+                f"Error login tidak muncul dalam {timeout}s (hasil: {outcome or 'tidak ada'})"
+            )
+        return el
 
     def get_error_message(self, timeout: int = 10) -> str:
         """
@@ -108,7 +134,7 @@ class LoginPage:
         Cek cepat apakah error terlihat tanpa melempar exception.
         """
         try:
-            el = self.error_element(timeout=timeout)
-            return el.is_displayed()
-        except Exception:
+            self.error_element(timeout=timeout)
+            return True
+        except TimeoutException:
             return False
@@ -1,62 +1,69 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait, Select
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.webdriver.support.ui import Select
+from selenium.common.exceptions import TimeoutException
 import logging
+from pages.locators import ProductsLocators
+from util.element_cache import ElementCache
+from util.perf_metrics import perf_action
+from util.waits import AdaptiveWait, DomWaiter, probe
 
 logger = logging.getLogger(__name__)
 
 class ProductsPage:
-    SEARCH_BOX = (By.CSS_SELECTOR, "input[placeholder='Search products...']")
-    CATEGORY_DROPDOWN = (By.CSS_SELECTOR, "select.px-4.py-2.border")
-    NO_PRODUCTS_MSG = (By.XPATH, "//p[normalize-space()='No products found']")
-    CART_EMPTY_MSG = (By.XPATH, "//div[contains(@class,'lg:col-span-1')]//p[normalize-space()='Your cart is empty']")
-    PRODUCT_CARD = "//h3[normalize-space()]"
+    SEARCH_BOX = ProductsLocators.SEARCH_BOX
+    CATEGORY_DROPDOWN = ProductsLocators.CATEGORY_DROPDOWN
+    NO_PRODUCTS_MSG = ProductsLocators.NO_PRODUCTS_MSG
+    CART_EMPTY_MSG = ProductsLocators.CART_EMPTY_MSG
+    CART_PANEL = ProductsLocators.CART_PANEL[1]
+    PRODUCT_CARD = ProductsLocators.PRODUCT_CARD[1]
 
     def __init__(self, driver, timeout=10):
         self.driver = driver
-        self.wait = WebDriverWait(driver, timeout)
+        self.wait = AdaptiveWait(driver, timeout)
+        self.dom = DomWaiter(driver)
+        self.elements = ElementCache.for_driver(driver)
 
     def is_no_products_found(self):
-        try:
-            return self.driver.find_element(*self.NO_PRODUCTS_MSG).is_displayed()
-        except NoSuchElementException:
-            return False
+        found = probe(self.driver, self.NO_PRODUCTS_MSG)
+        return bool(found) and found[0].is_displayed()
 
     def assert_product_visible(self, product_name):
         try:
             self.wait.until(
-                EC.visibility_of_element_located((By.XPATH, f"//h3[normalize-space()='{product_name}']"))
+                EC.visibility_of_element_located(ProductsLocators.PRODUCT_TITLE(name=product_name))
             )
         except TimeoutException:
             raise AssertionError(f"Produk '{product_name}' tidak ditemukan di hasil pencarian")
 
     def find_product_card(self, product_name):
         return self.wait.until(
-            EC.presence_of_element_located(
-                (By.XPATH, f"//h3[normalize-space()='{product_name}']/ancestor::div[contains(@class,'shadow-md')]")
-            )
+            EC.presence_of_element_located(ProductsLocators.PRODUCT_CARD_BY_NAME(name=product_name))
         )
 
+    @perf_action
     def search_product(self, product_name):
         logger.info(f"[search_product] Mencari produk: {product_name}")
         
         # Find and clear search box
-        search_box = self.wait.until(EC.visibility_of_element_located(self.SEARCH_BOX))
-        search_box.clear()
-        search_box.send_keys(product_name)
+        def type_query(search_box):
+            search_box.clear()
+            search_box.send_keys(product_name)
+
+        self.elements.use(self.SEARCH_BOX, type_query, wait=self.wait, name="products.search_box")
         logger.info(f"[search_product] Input '{product_name}' ke search box")
 
         # Wait for search results
         try:
             # Wait for either product cards or no products message
             self.wait.until(
-                lambda d: len(d.find_elements(By.XPATH, self.PRODUCT_CARD)) > 0 or 
-                          self.is_no_products_found()
+                lambda d: len(probe(d, (By.XPATH, self.PRODUCT_CARD))) > 0 or 
+                          self.is_no_products_found(),
+                name="products.search_results",
             )
             
             # Check if products found
-            products_found = len(self.driver.find_elements(By.XPATH, self.PRODUCT_CARD))
+            products_found = len(probe(self.driver, (By.XPATH, self.PRODUCT_CARD)))
             if products_found > 0:
                 logger.info(f"[search_product] ✅ Ditemukan {products_found} produk")
             else:
@@ -66,6 +73,7 @@ class ProductsPage:
             logger.error(f"[search_product] ❌ Timeout: Hasil pencarian tidak muncul")
             raise AssertionError(f"Hasil pencarian untuk '{product_name}' tidak muncul dalam waktu tunggu")
 
+    @perf_action
     def add_to_cart(self, product_name):
         logger.info(f"[add_to_cart] Menambahkan '{product_name}' ke cart")
         
@@ -75,16 +83,15 @@ class ProductsPage:
             logger.info(f"[add_to_cart] ✅ Product card ditemukan")
             
             # Find Add to Cart button
-            add_btn = card.find_element(By.XPATH, ".//button[.//span[normalize-space()='Add to Cart']]")
+            add_btn = card.find_element(*ProductsLocators.CARD_ADD_TO_CART_BUTTON)
             logger.info(f"[add_to_cart] ✅ Add to Cart button ditemukan")
             
-            # Click button
+            # Click button, lalu tunggu panel cart berubah
+            before = self.dom.snapshot(self.CART_PANEL)
             add_btn.click()
             logger.info(f"[add_to_cart] ✅ Add to Cart button diklik")
-            
-            # Wait a bit for UI to update
-            import time
-            time.sleep(2)
+            self.dom.until("products.add_to_cart", "text_changed", self.CART_PANEL, before["text"])
+            self.elements.invalidate()
             
         except Exception as e:
             logger.error(f"[add_to_cart] ❌ Error: {str(e)}")
@@ -93,13 +100,12 @@ class ProductsPage:
     def filter_by_category(self, category_name):
         dropdown = self.wait.until(EC.element_to_be_clickable(self.CATEGORY_DROPDOWN))
         Select(dropdown).select_by_visible_text(category_name)
+        self.elements.invalidate()
 
     def is_product_in_cart(self, product_name):
         try:
             self.wait.until(
-                EC.visibility_of_element_located(
-                    (By.XPATH, f"//div[contains(@class,'lg:col-span-1')]//h3[normalize-space()='{product_name}']")
-                )
+                EC.visibility_of_element_located(ProductsLocators.CART_PRODUCT_TITLE(name=product_name))
             )
             return True
         except TimeoutException:
@@ -107,14 +113,12 @@ class ProductsPage:
 
     def is_add_to_cart_disabled(self, product_name):
         card = self.find_product_card(product_name)
-        btn = card.find_element(By.XPATH, ".//button[.//span[normalize-space()='Add to Cart']]")
+        btn = card.find_element(*ProductsLocators.CARD_ADD_TO_CART_BUTTON)
         return not btn.is_enabled()
 
     def has_add_to_cart_button(self):
-        return len(self.driver.find_elements(By.XPATH, "//button[.//span[normalize-space()='Add to Cart']]")) > 0
+        return len(probe(self.driver, ProductsLocators.ADD_TO_CART_BUTTON)) > 0
 
     def is_cart_empty(self):
-        try:
-            return self.driver.find_element(*self.CART_EMPTY_MSG).is_displayed()
-        except NoSuchElementException:
-            return False
+        found = probe(self.driver, self.CART_EMPTY_MSG)
+        return bool(found) and found[0].is_displayed()
@@ -1,26 +1,74 @@
 import logging
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+from pages.locators import ReportLocators
+from util.element_cache import ElementCache
+from util.perf_metrics import perf_action
+from util.waits import AdaptiveWait
 
 logger = logging.getLogger(__name__)
 
 class ReportPage:
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = AdaptiveWait(driver, 10)
+        self._snapshot = None
+        self.elements = ElementCache.for_driver(driver)
 
     # --- Locators ---
-    HEADER_TITLE = (By.XPATH, "//h1[normalize-space()='Sales Reports']")
-    HEADER_DESC = (By.XPATH, "//p[contains(text(),'Track your business performance')]")
-    FILTER_DROPDOWN = (By.TAG_NAME, "select")
-    FILTER_OPTIONS = (By.TAG_NAME, "option")
+    HEADER_TITLE = ReportLocators.HEADER_TITLE
+    HEADER_DESC = ReportLocators.HEADER_DESC
+    FILTER_DROPDOWN = ReportLocators.FILTER_DROPDOWN
+    FILTER_OPTIONS = ReportLocators.FILTER_OPTIONS
 
-    SUMMARY_CARDS = (By.CSS_SELECTOR, "div.grid.grid-cols-1.md\\:grid-cols-2.lg\\:grid-cols-4.gap-6 > div")
+    SUMMARY_CARDS = ReportLocators.SUMMARY_CARDS
+
+    # Satu round trip untuk seluruh data report: cards, daily sales, top products
+    SNAPSHOT_JS = """
+    var cardsSel = arguments[0], dailyTitle = arguments[1], topTitle = arguments[2];
+    function text(n) { return n ? n.innerText.trim() : ''; }
+    function all(root, sel) { return Array.prototype.slice.call(root.querySelectorAll(sel)); }
+    function section(title) {
+        var h = document.evaluate("//h3[normalize-space()='" + title + "']", document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        return h ? h.parentNode : null;
+    }
+    function isEmpty(root, marker) {
+        return all(root, 'p').some(function (p) { return p.textContent.indexOf(marker) !== -1; });
+    }
+
+    var cards = [];
+    all(document, cardsSel).forEach(function (card) {
+        var label = card.querySelector('p.text-sm.font-medium');
+        var value = card.querySelector('p.text-2xl.font-semibold');
+        if (label && value) cards.push([text(label), text(value)]);
+    });
+
+    var daily = [];
+    var dailyRoot = section(dailyTitle);
+    if (dailyRoot && !isEmpty(dailyRoot, 'No sales data')) {
+        var dates = all(dailyRoot, 'span.text-sm.text-gray-600').map(text);
+        var values = all(dailyRoot, 'span.text-sm.font-medium').map(text);
+        for (var i = 0; i < Math.min(dates.length, values.length); i++) daily.push([dates[i], values[i]]);
+    }
+
+    var top = [];
+    var topRoot = section(topTitle);
+    if (topRoot && !isEmpty(topRoot, 'No product data')) {
+        var names = all(topRoot, 'p.font-medium.text-gray-900').map(text);
+        var solds = all(topRoot, 'p.text-sm.text-gray-500').map(text);
+        var totals = all(topRoot, 'p.font-semibold.text-green-600').map(text);
+        var n = Math.min(names.length, solds.length, totals.length);
+        for (var j = 0; j < n; j++) top.push([names[j], solds[j], totals[j]]);
+    }
+
+    return { cards: cards, daily: daily, top: top };
+    """
 
     # --- Actions ---
+    @perf_action
     def wait_for_page(self):
         """Tunggu sampai halaman report tampil."""
+        self._snapshot = None
         self.wait.until(EC.visibility_of_element_located(self.HEADER_TITLE))
         logger.info("✅ Halaman Reports terbuka.")
 
@@ -30,51 +78,49 @@ class ReportPage:
         return title, desc
 
     def get_filter_options(self):
-        dropdown = self.driver.find_element(*self.FILTER_DROPDOWN)
-        options = dropdown.find_elements(*self.FILTER_OPTIONS)
+        options = self.elements.use(self.FILTER_DROPDOWN, lambda el: el.find_elements(*self.FILTER_OPTIONS))
         return [opt.text for opt in options]
 
+    @perf_action
     def select_filter(self, value):
-        dropdown = self.driver.find_element(*self.FILTER_DROPDOWN)
-        for option in dropdown.find_elements(*self.FILTER_OPTIONS):
+        options = self.elements.use(self.FILTER_DROPDOWN, lambda el: el.find_elements(*self.FILTER_OPTIONS))
+        for option in options:
             if option.text.strip().lower() == value.lower():
                 option.click()
+                self._snapshot = None
+                self.elements.invalidate()
                 logger.info(f"🔍 Filter dipilih: {value}")
                 break
 
+    def get_snapshot(self, refresh=False):
+        """
+        Ambil summary cards, daily sales, dan top products dalam satu execute_script.
+        Hasil di-cache sampai filter diganti (select_filter) atau refresh=True.
+        """
+        if self._snapshot is None or refresh:
+            self._snapshot = self.driver.execute_script(
+                self.SNAPSHOT_JS, self.SUMMARY_CARDS[1], "Daily Sales", "Top Products"
+            )
+            logger.info(
+                f"📸 Snapshot report: {len(self._snapshot['cards'])} cards, "
+                f"{len(self._snapshot['daily'])} daily, {len(self._snapshot['top'])} top products"
+            )
+        return self._snapshot
+
     def get_summary_cards(self):
-        cards = self.driver.find_elements(*self.SUMMARY_CARDS)
-        result = []
-        for card in cards:
-            try:
-                label = card.find_element(By.CSS_SELECTOR, "p.text-sm.font-medium").text
-                value = card.find_element(By.CSS_SELECTOR, "p.text-2xl.font-semibold").text
-                result.append((label, value))
-            except Exception as e:
-                logger.warning(f"⚠️ Gagal membaca card ringkasan: {e}")
+        result = [tuple(card) for card in self.get_snapshot()["cards"]]
         if not result:
             logger.warning("⚠️ Tidak ada data di summary cards.")
         return result
 
     def get_daily_sales(self):
-        container = self.driver.find_element(By.XPATH, "//h3[normalize-space()='Daily Sales']/..")
-        empty_text = container.find_elements(By.XPATH, ".//p[contains(text(),'No sales data')]")
-        if empty_text:
+        daily = self.get_snapshot()["daily"]
+        if not daily:
             logger.info("ℹ️ Daily Sales kosong")
-            return []
-        dates = [d.text for d in container.find_elements(By.CSS_SELECTOR, "span.text-sm.text-gray-600")]
-        values = [v.text for v in container.find_elements(By.CSS_SELECTOR, "span.text-sm.font-medium")]
-        return list(zip(dates, values))
-
+        return [tuple(item) for item in daily]
 
     def get_top_products(self):
-        container = self.driver.find_element(By.XPATH, "//h3[normalize-space()='Top Products']/..")
-        empty_text = container.find_elements(By.XPATH, ".//p[contains(text(),'No product data')]")
-        if empty_text:
+        top = self.get_snapshot()["top"]
+        if not top:
             logger.info("ℹ️ Top Products kosong")
-            return []
-        names = [n.text for n in container.find_elements(By.CSS_SELECTOR, "p.font-medium.text-gray-900")]
-        solds = [s.text for s in container.find_elements(By.CSS_SELECTOR, "p.text-sm.text-gray-500")]
-        totals = [t.text for t in container.find_elements(By.CSS_SELECTOR, "p.font-semibold.text-green-600")]
-        return list(zip(names, solds, totals))
-
+        return [tuple(item) for item in top]
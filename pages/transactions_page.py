@@ -0,0 +1,156 @@
+import logging
+import re
+from selenium.webdriver.support import expected_conditions as EC
+from pages.locators import TransactionsLocators
+from util.element_cache import ElementCache
+from util.navigation import Navigator
+from util.perf_metrics import perf_action
+from util.waits import AdaptiveWait, DomWaiter
+
+logger = logging.getLogger(__name__)
+
+TXID_PATTERN = re.compile(r"TXN-\d{8}-\d{6}")
+
+
+class TransactionsPage:
+    """
+    Halaman Transactions. Seluruh tabel dibaca dalam satu execute_async_script per
+    halaman lalu di-index per TXID, jadi waktu lookup tidak tumbuh dengan jumlah baris.
+    TXID diambil dari teks baris (bukan posisi kolom); TXID yang tidak ada di index
+    masih dicari lewat substring di teks baris, seperti pengecekan lama per baris.
+    """
+
+    # Baca header + semua baris. Kalau tbody ada di container yang bisa di-scroll
+    # (tabel virtualised), scroll sampai habis sambil mengumpulkan baris unik.
+    TABLE_JS = """
+    var nextXpath = arguments[0], done = arguments[arguments.length - 1];
+    var table = document.querySelector('table');
+    function hasNext() {
+        var btn = document.evaluate(nextXpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        return !!btn && !btn.disabled && btn.getAttribute('aria-disabled') !== 'true';
+    }
+    if (!table) { done({ headers: [], rows: [], next: false }); return; }
+    var headers = Array.prototype.map.call(table.querySelectorAll('thead th'), function (th) {
+        return th.innerText.trim();
+    });
+    var seen = {}, rows = [];
+    function collect() {
+        Array.prototype.forEach.call(table.querySelectorAll('tbody tr'), function (tr) {
+            var cells = Array.prototype.map.call(tr.cells, function (td) { return td.innerText.trim(); });
+            var key = cells.join('\t');
+            if (cells.length && !seen[key]) { seen[key] = true; rows.push(cells); }
+        });
+    }
+    function scroller(el) {
+        for (; el && el !== document.body; el = el.parentElement) {
+            var overflow = getComputedStyle(el).overflowY;
+            if ((overflow === 'auto' || overflow === 'scroll') && el.scrollHeight > el.clientHeight + 1) return el;
+        }
+        return null;
+    }
+    collect();
+    var box = scroller(table.tBodies[0] || table);
+    if (!box) { done({ headers: headers, rows: rows, next: hasNext() }); return; }
+    var last = -1;
+    (function step() {
+        if (box.scrollTop === last) {
+            done({ headers: headers, rows: rows, next: hasNext(), virtualised: true });
+            return;
+        }
+        last = box.scrollTop;
+        box.scrollTop = last + box.clientHeight;
+        setTimeout(function () { collect(); step(); }, 50);
+    })();
+    """
+
+    def __init__(self, driver, timeout=10, max_pages=100):
+        self.driver = driver
+        self.wait = AdaptiveWait(driver, timeout)
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self.dom = DomWaiter(driver)
+        self.elements = ElementCache.for_driver(driver)
+        self._rows = None
+        self._index = None
+        self._texts = None
+
+    # --- Navigation ---
+    def open(self):
+        """Buka halaman Transactions (Navigator, mode default) lalu tunggu tabel (atau empty state)."""
+        Navigator.for_driver(self.driver, self.timeout).go_to_transactions()
+        self.wait_for_page()
+
+    def wait_for_page(self):
+        self._rows = self._index = self._texts = None
+        self.wait.until(EC.visibility_of_element_located(TransactionsLocators.HEADER))
+        self.dom.until(
+            "transactions.table",
+            "present",
+            f"{TransactionsLocators.TABLE[1]} | {TransactionsLocators.EMPTY_STATE[1]}",
+            timeout=self.timeout,
+        )
+
+    # --- Data ---
+    @perf_action
+    def load(self, refresh=False):
+        """
+        Index {TXID: {kolom: nilai}} dari seluruh tabel (semua halaman kalau ada pagination).
+        Key = TXID yang ditemukan di teks baris, atau sel pertama kalau tidak ada;
+        tabel tanpa <thead> memakai nomor kolom ("0", "1", ...) sebagai nama kolom.
+        Di-cache sampai refresh=True atau halaman dibuka ulang.
+        """
+        if self._index is not None and not refresh:
+            return self._index
+
+        rows, index, texts = [], {}, []
+        for page in range(1, self.max_pages + 1):
+            data = self.driver.execute_async_script(self.TABLE_JS, TransactionsLocators.NEXT_PAGE[1])
+            headers = data["headers"]
+            for cells in data["rows"]:
+                row = dict(zip(headers or [str(i) for i in range(len(cells))], cells))
+                text = " ".join(cells)
+                match = TXID_PATTERN.search(text)
+                index.setdefault(match.group(0) if match else cells[0], row)
+                rows.append(row)
+                texts.append((text, row))
+            if not data["next"]:
+                break
+            self._next_page()
+        else:
+            logger.warning(f"[TransactionsPage.load] ⚠️ Berhenti di {self.max_pages} halaman")
+
+        self._rows = rows
+        self._index = index
+        self._texts = texts
+        logger.info(f"[TransactionsPage.load] ✅ {len(self._index)} transaksi dibaca dari {page} halaman")
+        return self._index
+
+    def _next_page(self):
+        first_id = TransactionsLocators.FIRST_ROW_ID[1]
+        before = self.dom.snapshot(first_id)
+        self.elements.use(TransactionsLocators.NEXT_PAGE, lambda el: el.click())
+        self.elements.invalidate()
+        self.dom.until("transactions.next_page", "text_changed", first_id, before["text"])
+
+    def rows(self):
+        """Semua baris (urutan tabel) sebagai list dict."""
+        self.load()
+        return self._rows
+
+    def get(self, txid):
+        """Baris untuk `txid` (index, lalu substring teks baris), atau None kalau tidak ada."""
+        row = self.load().get(txid)
+        if row is None:
+            row = next((row for text, row in self._texts if txid in text), None)
+        return row
+
+    def contains(self, txid):
+        return self.get(txid) is not None
+
+    def verify(self, txids):
+        """Cek banyak TXID sekaligus (satu kali baca tabel). Return {txid: ketemu?}."""
+        return {txid: self.contains(txid) for txid in txids}
+
+    def missing(self, txids):
+        """TXID yang tidak ada di tabel."""
+        return [txid for txid, found in self.verify(txids).items() if not found]
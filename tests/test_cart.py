@@ -1,10 +1,9 @@
 import logging
 import pytest
-from selenium.webdriver.support.ui import WebDriverWait
-from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
 from pages.cart_page import CartPage
 from util.helper import take_screenshot
+from util.waits import AdaptiveWait
 
 # =======================
 # LOGGER CONFIG
@@ -18,31 +17,30 @@ logger.setLevel(logging.WARNING)  # default: hanya WARNING ke atas yang tampil
 # FIXTURES
 # =======================
 @pytest.fixture
-def login_and_empty_cart(driver, app_url, creds):
+def login_and_empty_cart(logged_in, cart_state):
     """Login dan pastikan cart kosong."""
-    lp = LoginPage(driver)
-    lp.visit(app_url)
-    lp.login(creds["email"], creds["password"])
-    lp.wait_no_error()
-
+    driver = logged_in
+    cart_state.clear()
     cp = CartPage(driver)
-    cp.clear_cart_if_not_empty()
     assert cp.get_cart_items_count() == 0, "Cart harus kosong"
     return cp
 
 
 @pytest.fixture
-def login_add_product(driver, app_url, creds, request):
-    """Login, kosongkan cart, lalu tambah produk tertentu."""
-    product = request.param
+def login_clear_cart_for_seed(logged_in, cart_state):
+    """Login dan kosongkan cart tanpa reload: test men-seed cart langsung (seed me-reload halaman)."""
+    cart_state.clear(reload=False)
+    return CartPage(logged_in)
 
-    lp = LoginPage(driver)
-    lp.visit(app_url)
-    lp.login(creds["email"], creds["password"])
-    lp.wait_no_error()
 
+@pytest.fixture
+def login_add_product(logged_in, cart_state, request):
+    """Login, kosongkan cart, lalu tambah produk tertentu (lewat UI)."""
+    product = request.param
+    driver = logged_in
+
+    cart_state.clear()
     cp = CartPage(driver)
-    cp.clear_cart_if_not_empty()
     assert cp.get_cart_items_count() == 0, "Cart harus kosong sebelum tambah produk"
 
     pp = ProductsPage(driver)
@@ -50,7 +48,7 @@ def login_add_product(driver, app_url, creds, request):
     pp.add_to_cart(product)
 
     # Tunggu hingga cart terupdate (lebih stabil dari time.sleep)
-    WebDriverWait(driver, 5).until(lambda d: cp.get_cart_items_count() > 0)
+    AdaptiveWait(driver, 5).until(lambda d: cp.get_cart_items_count() > 0, name="test_cart.cart_updated")
 
     return cp
 
@@ -100,11 +98,12 @@ def test_cart_empty_state(login_and_empty_cart, driver):
 
 @pytest.mark.cart
 @pytest.mark.negative
-@pytest.mark.parametrize("login_add_product", ["Coffee Beans"], indirect=True)
-def test_increase_quantity_until_disabled(login_add_product, driver):
-    cp = login_add_product
-    cp.increase_quantity_to_max()
-    assert cp.is_increase_disabled(), "Tombol + harus disabled di stok max"
+def test_increase_quantity_until_disabled(login_clear_cart_for_seed, driver):
+    cp = login_clear_cart_for_seed
+    result = cp.probe_stock_limit("Coffee Beans")
+    assert result["ceiling"] > 0, f"Stok Coffee Beans habis, tombol + tidak bisa dicek: {result}"
+    assert result["disabled"], "Tombol + harus disabled di stok max"
+    assert result["quantity"] == result["ceiling"], f"Quantity harus berhenti di stok: {result}"
     take_screenshot(driver, "increase_until_disabled", folder="screenshots/cart")
 
 
@@ -1,12 +1,10 @@
 import logging
 import pytest
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from pages.login_page import LoginPage
-from pages.products_page import ProductsPage
 from pages.cart_page import CartPage
 from util.helper import take_screenshot
+from util.waits import AdaptiveWait
 
 logger = logging.getLogger(__name__)
 
@@ -30,19 +28,11 @@ payment_methods = ["Cash", "Card", "Digital"]
     "name,email,expected,case_id", checkout_cases, ids=[c[3] for c in checkout_cases]
 )
 @pytest.mark.parametrize("payment", payment_methods, ids=payment_methods)
-def test_checkout(driver, app_url, creds, name, email, expected, case_id, payment):
+def test_checkout(driver, cart_state, name, email, expected, case_id, payment):
     """Checkout dengan kombinasi input (nama/email) dan metode pembayaran."""
 
-    # ==== Login ====
-    lp = LoginPage(driver)
-    lp.visit(app_url)
-    lp.login(creds["email"], creds["password"])
-    lp.assert_logged_in()
-
-    # ==== Tambah produk ====
-    pp = ProductsPage(driver)
-    pp.search_product("Wireless Headphones")
-    pp.add_to_cart("Wireless Headphones")
+    # ==== Tambah produk (seed langsung ke state, bukan lewat UI) ====
+    cart_state.seed([("Wireless Headphones", 1)])
 
     cp = CartPage(driver)
     cp.checkout()
@@ -72,10 +62,11 @@ def test_checkout(driver, app_url, creds, name, email, expected, case_id, paymen
     # ==== Negative Case (expected=False) ====
     else:
         try:
-            btn = WebDriverWait(driver, 3).until(
+            btn = AdaptiveWait(driver, 3).until(
                 EC.presence_of_element_located(
                     (By.XPATH, "//button[contains(., 'Complete Transaction')]")
-                )
+                ),
+                name="test_checkout.complete_button",
             )
             if btn.is_enabled():
                 btn.click()
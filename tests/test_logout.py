@@ -1,18 +1,13 @@
 from datetime import datetime
 import pytest
-from pages.login_page import LoginPage
 from util.sidebar import Sidebar
 from selenium.webdriver.common.by import By
 from util.helper import take_screenshot
 import os
 
 @pytest.mark.logout
-def test_logout_with_screenshot(driver, app_url, creds):
-    lp = LoginPage(driver)
-    lp.visit(app_url)
-    lp.login(creds["email"], creds["password"])
-    lp.assert_logged_in()
-
+@pytest.mark.usefixtures("logged_in")
+def test_logout_with_screenshot(driver):
     take_screenshot(driver, "before-logout", folder="screenshots/logout")
 
     sidebar = Sidebar(driver)
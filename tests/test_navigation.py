@@ -0,0 +1,47 @@
+import pytest
+from urllib.parse import urlsplit
+from selenium.webdriver.common.by import By
+from util.navigation import MODES, ROUTES, Navigator
+from util.waits import WaitMetrics
+
+HEADINGS = {"pos": "POS System", "transactions": "Transactions", "reports": "Sales Reports"}
+
+
+def _path(driver):
+    return urlsplit(driver.current_url).path.rstrip("/") or "/"
+
+
+def _assert_reached_without_fallback(metrics, route, mode):
+    """Mode yang diminta sendiri yang sampai (history tidak diam-diam fallback ke url)"""
+    assert not metrics.timeouts, f"{route} via {mode} tidak siap: {dict(metrics.timeouts)}"
+    assert list(metrics.latencies) == [f"{route}.{mode}"]
+
+
+@pytest.mark.navigation
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("route", ["transactions", "reports", "pos"])
+@pytest.mark.usefixtures("logged_in")
+def test_navigate_to_route(driver, route, mode):
+    """Positive test: setiap route bisa dibuka lewat klik sidebar maupun deep link"""
+    metrics = WaitMetrics()
+    Navigator(driver, metrics=metrics).go(route, mode)
+
+    _assert_reached_without_fallback(metrics, route, mode)
+    assert _path(driver) == ROUTES[route].path
+    assert driver.find_element(*ROUTES[route].ready).is_displayed()
+    assert HEADINGS[route] in driver.find_element(By.TAG_NAME, "h1").text
+
+
+@pytest.mark.navigation
+@pytest.mark.logout
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.usefixtures("logged_in")
+def test_navigate_logout(driver, mode):
+    """Positive test: Sign Out lewat semua mode navigasi kembali ke halaman login"""
+    metrics = WaitMetrics()
+    Navigator(driver, metrics=metrics).logout(mode)
+
+    _assert_reached_without_fallback(metrics, "logout", mode)
+    assert _path(driver) == ROUTES["logout"].path
+    assert driver.find_element(*ROUTES["logout"].ready).is_displayed()
+    assert "welcome back" in driver.find_element(By.TAG_NAME, "body").text.lower()
@@ -0,0 +1,133 @@
+import html
+import json
+import os
+import subprocess
+import sys
+import pytest
+from util.parallel import assign_shards, collect, merge_folders, merge_html_reports
+
+NODE_IDS = [
+    "tests/test_reports.py::test_reports_page_summary_and_data[Today]",
+    "tests/test_reports.py::test_reports_page_summary_and_data[Last 7 Days]",
+    "tests/test_reports.py::test_reports_page_summary_and_data[This Year]",
+    "tests/test_cart.py::test_add_product[Wireless Headphones]",
+    "tests/test_cart.py::test_add_product[Coffee Beans]",
+    "tests/test_login.py::test_login_valid",
+]
+
+
+def _report(tests, passed, failed, error=0):
+    """Report pytest-html v4 minimal: data-jsonblob + span outcome + run-count."""
+    blob = html.escape(json.dumps({"tests": tests}), quote=True)
+    return (
+        f'<div id="data-container" data-jsonblob="{blob}"></div>'
+        f'<p class="run-count">{passed + failed + error} tests took 00:00:10.</p>'
+        f'<span class="passed">{passed} Passed,</span>'
+        f'<span class="failed">{failed} Failed,</span>'
+        f'<span class="error">{error} Errors,</span>'
+        f'<input data-test-result="failed" disabled/>'
+    )
+
+
+# ---------------- assign_shards ---------------- #
+@pytest.mark.parametrize("workers", [1, 2, 4, 6])
+def test_assign_shards_covers_every_node_once(workers):
+    """Setiap node id (termasuk yang berisi spasi) masuk tepat satu shard"""
+    shards, loads = assign_shards(NODE_IDS, {}, workers)
+
+    sharded = [node_id for shard in shards for node_id in shard]
+    assert sorted(sharded) == sorted(NODE_IDS)
+    assert len(shards) == len(loads) == workers
+
+
+def test_assign_shards_longest_first_balances_load():
+    """Test terpanjang dapat worker sendiri, sisanya diratakan"""
+    durations = {NODE_IDS[0]: 60.0, NODE_IDS[1]: 20.0, NODE_IDS[2]: 20.0, NODE_IDS[3]: 20.0}
+    shards, loads = assign_shards(NODE_IDS[:4], durations, 2)
+
+    assert [NODE_IDS[0]] in shards
+    assert loads == [60.0, 60.0]
+
+
+def test_assign_shards_unknown_tests_use_median():
+    """Test tanpa histori memakai median durasi yang diketahui"""
+    durations = {NODE_IDS[0]: 1.0, NODE_IDS[1]: 3.0, NODE_IDS[2]: 5.0}
+    _, loads = assign_shards(NODE_IDS[:4], durations, 1)
+
+    assert loads == [1.0 + 3.0 + 5.0 + 3.0]
+
+
+def test_shard_file_keeps_node_ids_with_spaces(tmp_path):
+    """Worker memilih node id parametrize yang berisi spasi dari shard file"""
+    node_id = "tests/test_reports.py::test_reports_page_summary_and_data[This Year]"
+    shard_file = tmp_path / "shard.json"
+    shard_file.write_text(json.dumps([node_id]), encoding="utf-8")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    out = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "-o", "log_cli=false", "tests/test_reports.py"],
+        cwd=root,
+        env=dict(os.environ, PWDK_SHARD_FILE=str(shard_file)),
+        capture_output=True,
+        text=True,
+    )
+
+    assert out.returncode == 0, out.stdout + out.stderr
+    assert [line for line in out.stdout.splitlines() if "::" in line] == [node_id]
+
+
+# ---------------- collect ---------------- #
+def test_collect_fails_loudly_on_broken_module(tmp_path):
+    """Modul test dengan syntax error tidak boleh hilang diam-diam dari run paralel"""
+    (tmp_path / "test_broken.py").write_text("def test_x(:\n    pass\n", encoding="utf-8")
+    (tmp_path / "test_ok.py").write_text("def test_ok():\n    pass\n", encoding="utf-8")
+
+    with pytest.raises(RuntimeError, match="test_broken.py"):
+        collect([str(tmp_path), "-p", "no:cacheprovider", "--rootdir", str(tmp_path), "-c", os.devnull])
+
+
+def test_collect_without_tests_returns_empty(tmp_path):
+    (tmp_path / "test_empty.py").write_text("X = 1\n", encoding="utf-8")
+
+    assert collect([str(tmp_path), "-p", "no:cacheprovider", "--rootdir", str(tmp_path), "-c", os.devnull]) == []
+
+
+# ---------------- merge ---------------- #
+def test_merge_html_reports_combines_tests_and_counts(tmp_path):
+    """Report worker digabung: semua test + jumlah outcome dijumlahkan"""
+    first = tmp_path / "worker-0.html"
+    second = tmp_path / "worker-1.html"
+    first.write_text(_report({"a": [{"result": "Passed"}]}, passed=1, failed=0), encoding="utf-8")
+    second.write_text(_report({"b": [{"result": "Failed"}], "c": [{"result": "Error"}]}, 0, 1, 1), encoding="utf-8")
+    target = tmp_path / "report.html"
+
+    counts = merge_html_reports([str(first), str(second), str(tmp_path / "missing.html")], str(target), 75)
+
+    merged = target.read_text(encoding="utf-8")
+    data = json.loads(html.unescape(merged.split('data-jsonblob="')[1].split('"')[0]))
+    assert counts == {"passed": 1, "failed": 1, "error": 1}
+    assert set(data["tests"]) == {"a", "b", "c"}
+    assert '<span class="passed">1 ' in merged
+    assert '<span class="error">1 ' in merged
+    assert 'data-test-result="failed" disabled' not in merged
+    assert "3 tests took 00:01:15 (2 workers)." in merged
+
+
+def test_merge_html_reports_without_reports_returns_none(tmp_path):
+    assert merge_html_reports([str(tmp_path / "none.html")], str(tmp_path / "report.html"), 1) is None
+
+
+def test_merge_folders_copies_files_and_appends_index(tmp_path):
+    """Screenshot worker di-copy; index.jsonl digabung, bukan ditimpa"""
+    for i in range(2):
+        folder = tmp_path / f"worker-{i}" / "screenshots" / "cart"
+        folder.mkdir(parents=True)
+        (folder / f"shot{i}.png").write_bytes(b"png")
+        (folder / "index.jsonl").write_text(json.dumps({"name": f"shot{i}"}) + "\n", encoding="utf-8")
+    target = tmp_path / "merged"
+
+    merge_folders([str(tmp_path / f"worker-{i}" / "screenshots") for i in range(3)], str(target))
+
+    assert sorted(os.listdir(target / "cart")) == ["index.jsonl", "shot0.png", "shot1.png"]
+    lines = (target / "cart" / "index.jsonl").read_text(encoding="utf-8").splitlines()
+    assert sorted(json.loads(line)["name"] for line in lines) == ["shot0", "shot1"]
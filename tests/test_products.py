@@ -1,6 +1,5 @@
 import logging
 import pytest
-from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
 from util.helper import take_screenshot
 
@@ -10,13 +9,9 @@ logger = logging.getLogger(__name__)
 # FIXTURE LOGIN
 # =========================
 @pytest.fixture
-def login_and_pos(driver, app_url, creds):
+def login_and_pos(logged_in):
     """Login lalu masuk ke halaman POS"""
-    lp = LoginPage(driver)
-    lp.visit(app_url)
-    lp.login(creds["email"], creds["password"])
-    lp.assert_logged_in()
-    return ProductsPage(driver)
+    return ProductsPage(logged_in)
 
 # =========================
 # POSITIVE CASES
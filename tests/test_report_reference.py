@@ -0,0 +1,110 @@
+import pytest
+from datetime import datetime, timezone
+from util.report_reference import ReportReference, diff_report
+
+PRODUCTS = [
+    {"id": 1, "name": "Coffee Beans", "price": 10, "cost": 5},
+    {"id": 2, "name": "Green Tea", "price": 4, "cost": 1},
+]
+# Jam lokal mesin test, sama seperti browser headless
+NOW = datetime(2026, 10, 18, 12, 0, 0)
+
+
+def _tx(moment, email, *items):
+    lines = [{"id": p["id"], "name": p["name"], "price": p["price"], "quantity": qty} for p, qty in items]
+    return {
+        "id": moment.strftime("TXN-%Y%m%d-%H%M%S"),
+        "date": moment.astimezone(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+        "customer": {"name": email.split("@")[0], "email": email},
+        "items": lines,
+        "total": sum(line["price"] * line["quantity"] for line in lines),
+        "paymentMethod": "Cash",
+    }
+
+
+COFFEE, TEA = PRODUCTS
+TRANSACTIONS = [
+    _tx(datetime(2025, 12, 31, 23, 59, 59), "a@x.com", (COFFEE, 1)),   # tahun lalu
+    _tx(datetime(2026, 9, 30, 23, 59, 59), "d@x.com", (COFFEE, 5)),    # sebelum awal bulan
+    _tx(datetime(2026, 10, 1, 0, 0, 0), "c@x.com", (TEA, 1)),          # tepat awal bulan
+    _tx(datetime(2026, 10, 11, 11, 59, 59), "a@x.com", (COFFEE, 1)),   # 1 detik sebelum 7x24 jam
+    _tx(datetime(2026, 10, 11, 12, 0, 0), "b@x.com", (TEA, 3)),        # tepat now - 7x24 jam
+    _tx(datetime(2026, 10, 17, 23, 59, 59), "b@x.com", (TEA, 1)),      # 1 detik sebelum hari ini
+    _tx(datetime(2026, 10, 18, 0, 0, 0), "a@x.com", (COFFEE, 2), (TEA, 1)),  # tepat awal hari ini
+    _tx(datetime(2026, 10, 18, 13, 0, 0), "e@x.com", (COFFEE, 9)),     # setelah now: tidak dihitung
+]
+
+EXPECTED = {
+    "Today": {
+        "cards": {"Total Revenue": 24.0, "Total Orders": 1, "Total Customers": 1, "Total Profit": 13.0},
+        "daily": {"2026-10-18": 24.0},
+        "top": [("Coffee Beans", 2, 20.0), ("Green Tea", 1, 4.0)],
+    },
+    "Last 7 Days": {
+        "cards": {"Total Revenue": 40.0, "Total Orders": 3, "Total Customers": 2, "Total Profit": 25.0},
+        "daily": {"2026-10-11": 12.0, "2026-10-17": 4.0, "2026-10-18": 24.0},
+        # Revenue seri: urutan kemunculan pertama di periode (Green Tea lebih dulu)
+        "top": [("Green Tea", 5, 20.0), ("Coffee Beans", 2, 20.0)],
+    },
+    "This Month": {
+        "cards": {"Total Revenue": 54.0, "Total Orders": 5, "Total Customers": 3, "Total Profit": 33.0},
+        "daily": {"2026-10-01": 4.0, "2026-10-11": 22.0, "2026-10-17": 4.0, "2026-10-18": 24.0},
+        "top": [("Coffee Beans", 3, 30.0), ("Green Tea", 6, 24.0)],
+    },
+    "This Year": {
+        "cards": {"Total Revenue": 104.0, "Total Orders": 6, "Total Customers": 4, "Total Profit": 58.0},
+        "daily": {"2026-09-30": 50.0, "2026-10-01": 4.0, "2026-10-11": 22.0, "2026-10-17": 4.0, "2026-10-18": 24.0},
+        "top": [("Coffee Beans", 8, 80.0), ("Green Tea", 6, 24.0)],
+    },
+}
+
+
+@pytest.fixture
+def reference():
+    return ReportReference(TRANSACTIONS, PRODUCTS, int(NOW.timestamp() * 1000))
+
+
+def _ui(expected):
+    """Bentuk data seperti hasil getter ReportPage (teks UI)."""
+    cards = [(label, f"${value:,.2f}" if "Orders" not in label and "Customers" not in label else str(value))
+             for label, value in expected["cards"].items()]
+    daily = [(date, f"${value:,.2f}") for date, value in expected["daily"].items()]
+    top = [(name, f"{sold} sold", f"${total:,.2f}") for name, sold, total in expected["top"]]
+    return cards, daily, top
+
+
+@pytest.mark.parametrize("filter_label", list(EXPECTED))
+def test_aggregate_per_filter_including_window_edges(reference, filter_label):
+    """Batas periode inklusif di awal, transaksi setelah 'now' tidak dihitung"""
+    assert reference.aggregate(filter_label) == EXPECTED[filter_label]
+
+
+def test_aggregate_without_transactions():
+    result = ReportReference([], PRODUCTS, int(NOW.timestamp() * 1000)).aggregate("This Year")
+
+    assert result["cards"] == {"Total Revenue": 0.0, "Total Orders": 0, "Total Customers": 0, "Total Profit": 0.0}
+    assert result["daily"] == {} and result["top"] == []
+
+
+def test_diff_report_matching_ui_has_no_mismatch(reference):
+    expected = reference.aggregate("This Month")
+
+    assert diff_report(expected, *_ui(expected)) == []
+
+
+def test_diff_report_lists_every_mismatch(reference):
+    expected = reference.aggregate("Last 7 Days")
+    cards, daily, top = _ui(expected)
+    cards[1] = ("Total Orders", "4")
+    daily = daily[1:] + [("2026-10-12", "$1.00")]
+    top = list(reversed(top))
+
+    mismatches = diff_report(expected, cards, daily, top)
+
+    assert "card 'Total Orders': UI=4 expected=3.00" in mismatches
+    assert "daily 2026-10-11: UI=None expected=12.0" in mismatches
+    assert "daily 2026-10-12: UI=1.0 expected=None" in mismatches
+    assert [m for m in mismatches if m.startswith("top #")] == [
+        "top #1: UI=('Coffee Beans', 2, 20.0) expected=('Green Tea', 5, 20.0)",
+        "top #2: UI=('Green Tea', 5, 20.0) expected=('Coffee Beans', 2, 20.0)",
+    ]
@@ -1,21 +1,32 @@
 import pytest
-from pages.login_page import LoginPage
 from pages.report_page import ReportPage
-from util.sidebar import Sidebar
+from util.element_cache import ElementCache
+from util.report_reference import ReportReference, diff_report
+from util.navigation import Navigator
+from util.tx_generator import TransactionSeeder
+
+
+@pytest.fixture
+def seeded_transactions(logged_in):
+    """
+    Isi pos_transactions dengan data sintetis yang deterministik: setahun lebih
+    (This Year / This Month / Last 7 Days) + beberapa menit terakhir (Today).
+    """
+    seeder = TransactionSeeder(logged_in)
+    assert seeder.seed(300, span_days=400, seed=1)["ok"]
+    assert seeder.seed(30, span_days=0.01, seed=2, append=True)["ok"]
+    logged_in.refresh()
+    ElementCache.for_driver(logged_in).invalidate()
+    return logged_in
+
 
 @pytest.mark.reports
-def test_reports_page_header_and_filters(driver, app_url, creds):
+@pytest.mark.usefixtures("logged_in")
+def test_reports_page_header_and_filters(driver):
     """Positive test: login, header, dan filter muncul sesuai requirement"""
 
-    # Login
-    lp = LoginPage(driver)
-    lp.visit(app_url)
-    lp.login(creds["email"], creds["password"])
-    lp.assert_logged_in()
-
     # Navigasi ke Reports
-    sidebar = Sidebar(driver)
-    sidebar.go_to_reports()
+    Navigator.for_driver(driver).go_to_reports()
 
     rp = ReportPage(driver)
     rp.wait_for_page()
@@ -34,18 +45,13 @@ def test_reports_page_header_and_filters(driver, app_url, creds):
 
 @pytest.mark.reports
 @pytest.mark.parametrize("filter_value", ["Today", "Last 7 Days", "This Month", "This Year"])
-def test_reports_page_summary_and_data(driver, app_url, creds, filter_value):
+@pytest.mark.perf_budget("ReportPage.select_filter", duration_ms=2000, long_tasks=2)
+@pytest.mark.usefixtures("seeded_transactions")
+def test_reports_page_summary_and_data(driver, filter_value):
     """Positive test: setiap filter menampilkan summary cards, daily sales, top products"""
 
-    # Login
-    lp = LoginPage(driver)
-    lp.visit(app_url)
-    lp.login(creds["email"], creds["password"])
-    lp.assert_logged_in()
-
     # Navigasi ke Reports
-    sidebar = Sidebar(driver)
-    sidebar.go_to_reports()
+    Navigator.for_driver(driver).go_to_reports()
 
     rp = ReportPage(driver)
     rp.wait_for_page()
@@ -65,18 +71,19 @@ def test_reports_page_summary_and_data(driver, app_url, creds, filter_value):
     top_products = rp.get_top_products()
     assert all(len(item) == 3 for item in top_products)  # (nama produk, sold, total revenue)
 
+    # --- Bandingkan dengan agregasi independen dari pos_transactions ---
+    expected = ReportReference.from_browser(driver).aggregate(filter_value)
+    assert expected["cards"]["Total Orders"] > 0, f"Data seed tidak mencakup periode '{filter_value}'"
+    mismatches = diff_report(expected, summary, daily_sales, top_products)
+    assert not mismatches, f"BUG: Report '{filter_value}' tidak sesuai data transaksi: {mismatches}"
+
 
 # ---------------- NEGATIVE CASES ---------------- #
 @pytest.mark.reports
-def test_reports_missing_filter(driver, app_url, creds):
+@pytest.mark.usefixtures("logged_in")
+def test_reports_missing_filter(driver):
     """Negative test: jika filter kurang dari 4 maka dianggap bug"""
-    lp = LoginPage(driver)
-    lp.visit(app_url)
-    lp.login(creds["email"], creds["password"])
-    lp.assert_logged_in()
-
-    sidebar = Sidebar(driver)
-    sidebar.go_to_reports()
+    Navigator.for_driver(driver).go_to_reports()
 
     rp = ReportPage(driver)
     rp.wait_for_page()
@@ -86,16 +93,11 @@ def test_reports_missing_filter(driver, app_url, creds):
 
 
 @pytest.mark.reports
-def test_reports_summary_card_incorrect(driver, app_url, creds):
+@pytest.mark.usefixtures("logged_in")
+def test_reports_summary_card_incorrect(driver):
     """Negative test: jumlah summary card tidak sesuai"""
 
-    lp = LoginPage(driver)
-    lp.visit(app_url)
-    lp.login(creds["email"], creds["password"])
-    lp.assert_logged_in()
-
-    sidebar = Sidebar(driver)
-    sidebar.go_to_reports()
+    Navigator.for_driver(driver).go_to_reports()
 
     rp = ReportPage(driver)
     rp.wait_for_page()
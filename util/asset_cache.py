@@ -0,0 +1,349 @@
+"""
+Cache aset statis lewat intersepsi CDP Fetch: response GET (HTML/JS/CSS/font/gambar)
+disimpan di disk secara content-addressed (sha256), di-index per URL + ETag, lalu
+request berikutnya dilayani langsung dari disk tanpa network.
+
+Mode:
+- online (default): entry cache direvalidasi ke server dengan If-None-Match /
+  If-Modified-Since; 304 -> body dilayani dari disk, 200 -> cache diperbarui.
+  Aset (selain dokumen HTML) cukup direvalidasi sekali per sesi, jadi
+  /assets/app.js tanpa hash di nama file tetap ikut ter-deploy.
+- offline: semua dilayani dari cache; request yang belum pernah tersimpan digagalkan.
+- block_third_party: request ke host selain host aplikasi (font, analytics) diblokir.
+
+Listener CDP jalan di thread terpisah (trio, lewat modul bidi Selenium).
+Diaktifkan dari conftest dengan --asset-cache=DIR.
+"""
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+import weakref
+from urllib.parse import urlsplit
+
+import trio
+from selenium.webdriver.common.bidi import cdp
+
+from util.driver_provider import file_lock
+
+logger = logging.getLogger(__name__)
+
+CACHEABLE_TYPES = {"Document", "Script", "Stylesheet", "Font", "Image"}
+# Header yang tidak valid lagi karena body disimpan dalam bentuk sudah di-decode
+DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class AssetCache:
+    def __init__(self, root, app_url, offline=False, block_third_party=False):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.index_file = os.path.join(root, "index.json")
+        self.app_host = urlsplit(app_url).netloc
+        self.offline = offline
+        self.block_third_party = block_third_party
+        self.stats = {
+            "served": 0,
+            "bytes_saved": 0,
+            "stored": 0,
+            "bytes_stored": 0,
+            "revalidated": 0,
+            "blocked": 0,
+            "missed_offline": 0,
+        }
+        self._lock = threading.Lock()
+        self._interceptors = weakref.WeakKeyDictionary()
+        # URL yang sudah disimpan / direvalidasi di sesi ini: dilayani dari disk tanpa tanya server
+        self._fresh = set()
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self.index = self._load_index()
+
+    # -------------------------
+    # Disk
+    # -------------------------
+    def _load_index(self):
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def lookup(self, url):
+        """Return (entry, body) dari cache, atau (None, None) kalau belum ada / file hilang."""
+        with self._lock:
+            entry = self.index.get(url)
+        if entry is None:
+            return None, None
+        try:
+            with open(self._object_path(entry["sha256"]), "rb") as f:
+                return entry, f.read()
+        except OSError:
+            return None, None
+
+    def validators(self, url):
+        """Header conditional request untuk revalidasi entry `url` (kosong kalau tidak ada)."""
+        with self._lock:
+            entry = self.index.get(url) or {}
+        if not entry or not os.path.exists(self._object_path(entry["sha256"])):
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def mark_fresh(self, url):
+        with self._lock:
+            self._fresh.add(url)
+            self.stats["revalidated"] += 1
+
+    def store(self, url, status, headers, body):
+        etag = next((value for name, value in headers if name.lower() == "etag"), None)
+        last_modified = next((value for name, value in headers if name.lower() == "last-modified"), None)
+        with self._lock:
+            current = self.index.get(url)
+            self._fresh.add(url)
+        if current and etag and current.get("etag") == etag:
+            return current
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(body)
+            os.replace(tmp, path)
+        entry = {
+            "sha256": digest,
+            "etag": etag,
+            "last_modified": last_modified,
+            "status": status,
+            "size": len(body),
+            "headers": [[name, value] for name, value in headers if name.lower() not in DROP_HEADERS],
+        }
+        with self._lock:
+            self.index[url] = entry
+            self.stats["stored"] += 1
+            self.stats["bytes_stored"] += len(body)
+        return entry
+
+    def save_index(self):
+        """Gabungkan index ke disk (aman untuk worker paralel yang berbagi cache)."""
+        with file_lock(self.index_file + ".lock"):
+            merged = self._load_index()
+            with self._lock:
+                merged.update(self.index)
+            tmp = f"{self.index_file}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(merged, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.index_file)
+
+    # -------------------------
+    # Keputusan per request
+    # -------------------------
+    def is_third_party(self, url):
+        host = urlsplit(url).netloc
+        return bool(host) and host != self.app_host
+
+    def decide(self, method, url, resource_type):
+        """Return salah satu: "block", "serve", "revalidate", "fail", "store", "pass"."""
+        if url.startswith("data:"):
+            return "pass"
+        if self.block_third_party and self.is_third_party(url):
+            return "block"
+        cacheable = method == "GET" and resource_type in CACHEABLE_TYPES
+        if not cacheable:
+            return "fail" if self.offline else "pass"
+        if url not in self.index:
+            return "fail" if self.offline else "store"
+        if self.offline or (url in self._fresh and resource_type != "Document"):
+            return "serve"
+        return "revalidate" if self.validators(url) else "store"
+
+    def record(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    # -------------------------
+    # Driver
+    # -------------------------
+    def attach(self, driver):
+        """Pasang interceptor ke tab aktif driver (no-op kalau sudah terpasang di tab itu)."""
+        handle = driver.current_window_handle
+        current = self._interceptors.get(driver)
+        if current is not None and current.handle == handle and current.alive:
+            return current
+        if current is not None:
+            current.stop()
+        interceptor = FetchInterceptor(driver, self, handle)
+        if interceptor.start():
+            self._interceptors[driver] = interceptor
+            return interceptor
+        return None
+
+    def detach(self, driver):
+        interceptor = self._interceptors.pop(driver, None)
+        if interceptor is not None:
+            interceptor.stop()
+
+    def close(self):
+        for interceptor in list(self._interceptors.values()):
+            interceptor.stop()
+        self._interceptors.clear()
+        self.save_index()
+
+    def summary(self):
+        s = self.stats
+        return (
+            f"served={s['served']} ({s['bytes_saved'] / 1024:.0f} KiB dihemat), "
+            f"stored={s['stored']} ({s['bytes_stored'] / 1024:.0f} KiB), revalidated={s['revalidated']}, "
+            f"blocked={s['blocked']}, "
+            f"missed_offline={s['missed_offline']}, entries={len(self.index)}"
+        )
+
+
+class FetchInterceptor:
+    """Satu koneksi CDP (thread + trio loop) yang meng-handle Fetch.requestPaused untuk satu tab."""
+
+    def __init__(self, driver, cache, handle, startup_timeout=10):
+        self.driver = driver
+        self.cache = cache
+        self.handle = handle
+        self.startup_timeout = startup_timeout
+        self._ready = threading.Event()
+        self._thread = None
+        self._token = None
+        self._cancel_scope = None
+        self._revalidating = {}
+        self.error = None
+
+    @property
+    def alive(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        try:
+            version, ws_url = self.driver._get_cdp_details()
+        except Exception as e:
+            logger.warning(f"[AssetCache] ⚠️ CDP tidak tersedia, cache dilewati: {e}")
+            return False
+        self._thread = threading.Thread(
+            target=trio.run, args=(self._main, version, ws_url), name="asset-cache-cdp", daemon=True
+        )
+        self._thread.start()
+        if not self._ready.wait(self.startup_timeout) or self.error is not None:
+            logger.warning(f"[AssetCache] ⚠️ Interceptor CDP gagal start, cache dilewati: {self.error}")
+            return False
+        return True
+
+    def stop(self):
+        if self.alive and self._token is not None:
+            try:
+                trio.from_thread.run_sync(self._cancel_scope.cancel, trio_token=self._token)
+            except trio.RunFinishedError:
+                pass
+            self._thread.join(timeout=5)
+
+    async def _main(self, version, ws_url):
+        try:
+            devtools = cdp.import_devtools(version)
+            async with cdp.open_cdp(ws_url) as conn:
+                # ChromeDriver memakai targetId sebagai window handle
+                async with conn.open_session(devtools.target.TargetID(self.handle)) as session:
+                    pattern = devtools.fetch.RequestPattern(url_pattern="*")
+                    await session.execute(devtools.fetch.enable(patterns=[pattern]))
+                    events = session.listen(devtools.fetch.RequestPaused, buffer_size=100)
+                    async with trio.open_nursery() as nursery:
+                        self._cancel_scope = nursery.cancel_scope
+                        self._token = trio.lowlevel.current_trio_token()
+                        self._ready.set()
+                        async for event in events:
+                            nursery.start_soon(self._handle, session, devtools, event)
+        except Exception as e:  # koneksi putus saat driver di-quit, atau CDP tidak tersedia
+            self.error = e
+            logger.debug(f"[AssetCache] Interceptor berhenti: {e}")
+        finally:
+            self._ready.set()
+
+    async def _handle(self, session, devtools, event):
+        fetch = devtools.fetch
+        request = event.request
+        try:
+            if event.response_status_code is not None or event.response_error_reason is not None:
+                await self._store_response(session, devtools, event)
+                return
+
+            action = self.cache.decide(request.method, request.url, event.resource_type.value)
+            if action == "block":
+                self.cache.record("blocked")
+                await session.execute(
+                    fetch.fail_request(event.request_id, devtools.network.ErrorReason.BLOCKED_BY_CLIENT)
+                )
+            elif action == "serve":
+                if not await self._serve(session, fetch, event.request_id, request.url):
+                    await session.execute(fetch.continue_request(event.request_id, intercept_response=True))
+            elif action == "revalidate":
+                conditional = self.cache.validators(request.url)
+                headers = [
+                    fetch.HeaderEntry(name, value)
+                    for name, value in (request.headers or {}).items()
+                    if name.lower() not in ("if-none-match", "if-modified-since")
+                ]
+                headers += [fetch.HeaderEntry(name, value) for name, value in conditional.items()]
+                self._revalidating[event.request_id] = request.url
+                await session.execute(
+                    fetch.continue_request(event.request_id, headers=headers, intercept_response=True)
+                )
+            elif action == "fail":
+                self.cache.record("missed_offline")
+                await session.execute(
+                    fetch.fail_request(event.request_id, devtools.network.ErrorReason.INTERNET_DISCONNECTED)
+                )
+            else:
+                await session.execute(
+                    fetch.continue_request(event.request_id, intercept_response=action == "store")
+                )
+        except Exception as e:
+            # Request yang di-pause harus tetap dilanjutkan, kalau tidak halaman menggantung
+            logger.debug(f"[AssetCache] Handler gagal untuk {request.url}: {e}")
+            try:
+                await session.execute(fetch.continue_request(event.request_id))
+            except Exception:
+                pass
+
+    async def _serve(self, session, fetch, request_id, url):
+        """Fulfill request dari disk. Return False kalau entry / file-nya tidak ada."""
+        entry, body = self.cache.lookup(url)
+        if body is None:
+            return False
+        self.cache.record("served")
+        self.cache.record("bytes_saved", len(body))
+        await session.execute(
+            fetch.fulfill_request(
+                request_id,
+                entry["status"],
+                response_headers=[fetch.HeaderEntry(name, value) for name, value in entry["headers"]],
+                body=base64.b64encode(body).decode("ascii"),
+            )
+        )
+        return True
+
+    async def _store_response(self, session, devtools, event):
+        fetch = devtools.fetch
+        revalidated = self._revalidating.pop(event.request_id, None)
+        if revalidated and event.response_status_code == 304:
+            # Tidak berubah di server: body dari disk, sisa sesi tidak perlu tanya lagi
+            self.cache.mark_fresh(revalidated)
+            if await self._serve(session, fetch, event.request_id, revalidated):
+                return
+        if event.response_status_code == 200:
+            body, encoded = await session.execute(fetch.get_response_body(event.request_id))
+            data = base64.b64decode(body) if encoded else body.encode("utf-8")
+            headers = [(h.name, h.value) for h in event.response_headers or []]
+            self.cache.store(event.request.url, 200, headers, data)
+        await session.execute(fetch.continue_response(event.request_id))
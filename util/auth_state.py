@@ -0,0 +1,68 @@
+import logging
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from pages.login_page import LoginPage
+from util.element_cache import ElementCache
+
+logger = logging.getLogger(__name__)
+
+
+class AuthSnapshot:
+    """
+    Snapshot state login (localStorage + cookies) yang diambil sekali per sesi,
+    lalu di-inject ke browser lain supaya test tidak perlu lewat form login.
+    """
+
+    def __init__(self, local_storage, cookies):
+        self.local_storage = local_storage
+        self.cookies = cookies
+
+    @classmethod
+    def capture(cls, driver, base_url, creds):
+        """Login lewat form sekali, lalu simpan localStorage dan cookies."""
+        lp = LoginPage(driver)
+        lp.visit(base_url)
+        lp.login(creds["email"], creds["password"])
+        lp.assert_logged_in()
+
+        local_storage = driver.execute_script(
+            "var out = {};"
+            "for (var i = 0; i < localStorage.length; i++) {"
+            "  var k = localStorage.key(i); out[k] = localStorage.getItem(k);"
+            "}"
+            "return out;"
+        )
+        cookies = driver.get_cookies()
+        logger.info(
+            f"[AuthSnapshot.capture] ✅ {len(local_storage)} key localStorage, {len(cookies)} cookies"
+        )
+        return cls(local_storage, cookies)
+
+    def restore(self, driver, base_url):
+        """
+        Inject snapshot ke driver lalu reload halaman utama.
+        Return True kalau header POS muncul (login berhasil dipulihkan).
+        """
+        if not driver.current_url.startswith(base_url.rstrip("/")):
+            driver.get(base_url)
+
+        driver.execute_script(
+            "var items = arguments[0];"
+            "for (var k in items) { localStorage.setItem(k, items[k]); }",
+            self.local_storage,
+        )
+        for cookie in self.cookies:
+            try:
+                driver.add_cookie(cookie)
+            except WebDriverException as e:
+                logger.warning(f"[AuthSnapshot.restore] ⚠️ Cookie {cookie.get('name')} gagal: {e}")
+        driver.get(base_url)
+        ElementCache.for_driver(driver).invalidate()
+
+        try:
+            LoginPage(driver).get_pos_header_text()
+            return True
+        except TimeoutException:
+            logger.warning("[AuthSnapshot.restore] ⚠️ Snapshot tidak memulihkan login")
+            return False
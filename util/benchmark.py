@@ -0,0 +1,147 @@
+"""
+Helper benchmark untuk operasi page object: ukur latency (median, p95),
+round trip WebDriver, dan alokasi memori Python; simpan sebagai JSON dan
+bandingkan dua hasil dengan threshold regresi.
+
+Contoh:
+    pytest benchmarks -m benchmark --bench-out=reports/bench.json
+    python -m util.benchmark base.json head.json --threshold 0.15
+"""
+import argparse
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from util.commands import CommandCounter
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile (values tidak perlu terurut)."""
+    ordered = sorted(values)
+    rank = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+class Benchmark:
+    def __init__(self, driver, rounds=10, warmup=1):
+        self.driver = driver
+        self.rounds = rounds
+        self.warmup = warmup
+        self.results = {}
+
+    def measure(self, name, operation, setup=None):
+        """
+        Jalankan `operation` sebanyak warmup + rounds (setup dipanggil sebelum
+        setiap putaran, tidak ikut diukur), plus satu putaran dengan tracemalloc.
+        """
+        timings = []
+        round_trips = []
+        for i in range(self.warmup + self.rounds):
+            if setup:
+                setup()
+            with CommandCounter(self.driver) as counter:
+                start = time.perf_counter()
+                operation()
+                elapsed = time.perf_counter() - start
+            if i >= self.warmup:
+                timings.append(elapsed)
+                round_trips.append(counter.count)
+
+        # Alokasi diukur terpisah supaya overhead tracemalloc tidak masuk ke timing
+        if setup:
+            setup()
+        tracemalloc.start()
+        try:
+            operation()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        result = {
+            "rounds": len(timings),
+            "median": statistics.median(timings),
+            "p95": percentile(timings, 95),
+            "mean": statistics.fmean(timings),
+            "min": min(timings),
+            "round_trips": statistics.median(round_trips),
+            "alloc_peak_kb": round(peak / 1024, 2),
+        }
+        self.results[name] = result
+        logger.info(
+            f"[Benchmark] {name}: median={result['median'] * 1000:.1f}ms "
+            f"p95={result['p95'] * 1000:.1f}ms round_trips={result['round_trips']}"
+        )
+        return result
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_results(results, path):
+    import selenium
+
+    payload = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "selenium": selenium.__version__,
+        },
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+    return path
+
+
+def compare(base, head, threshold=0.1, metric="median"):
+    """
+    Bandingkan dua hasil benchmark. Return list (nama, base, head, perubahan, regresi?)
+    untuk operasi yang ada di keduanya.
+    """
+    rows = []
+    for name in sorted(set(base["results"]) & set(head["results"])):
+        old = base["results"][name][metric]
+        new = head["results"][name][metric]
+        change = (new - old) / old if old else 0.0
+        rows.append((name, old, new, change, change > threshold))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bandingkan dua hasil benchmark JSON.")
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Batas regresi relatif (0.1 = 10%%).")
+    parser.add_argument("--metric", default="median", choices=["median", "p95", "mean", "min"])
+    args = parser.parse_args(argv)
+
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.head, encoding="utf-8") as f:
+        head = json.load(f)
+
+    rows = compare(base, head, args.threshold, args.metric)
+    print(f"{'operation':<32}{'base (ms)':>12}{'head (ms)':>12}{'change':>10}")
+    for name, old, new, change, regressed in rows:
+        flag = "  ❌ REGRESI" if regressed else ""
+        print(f"{name:<32}{old * 1000:>12.1f}{new * 1000:>12.1f}{change:>+10.1%}{flag}")
+    return 1 if any(row[4] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
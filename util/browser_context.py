@@ -0,0 +1,72 @@
+"""
+Isolasi per test lewat CDP browser context (seperti jendela incognito):
+localStorage, cookies dan cache terpisah, tapi tetap di dalam Chrome yang sama.
+Dipakai fixture `driver` dengan --browser-context.
+"""
+import logging
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from util.element_cache import ElementCache
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserContext:
+    # False setelah CDP gagal sekali; test berikutnya langsung fallback
+    supported = True
+    stats = {"created": 0, "create_time": 0.0, "dispose_time": 0.0}
+
+    def __init__(self, driver, context_id, handle, home_handle):
+        self.driver = driver
+        self.context_id = context_id
+        self.handle = handle
+        self.home_handle = home_handle
+
+    @classmethod
+    def open(cls, driver, url="about:blank"):
+        """
+        Buat browser context baru + satu tab di dalamnya lalu switch ke tab itu.
+        Return None kalau driver tidak mendukung CDP.
+        """
+        if not cls.supported or not hasattr(driver, "execute_cdp_cmd"):
+            cls.supported = False
+            return None
+        start = time.perf_counter()
+        try:
+            home = driver.current_window_handle
+            context_id = driver.execute_cdp_cmd("Target.createBrowserContext", {})["browserContextId"]
+            target = driver.execute_cdp_cmd(
+                "Target.createTarget", {"url": url, "browserContextId": context_id}
+            )
+            # ChromeDriver memakai targetId sebagai window handle
+            driver.switch_to.window(target["targetId"])
+        except (WebDriverException, KeyError) as e:
+            logger.warning(f"[BrowserContext] ⚠️ CDP tidak tersedia, fallback ke process-per-test: {e}")
+            cls.supported = False
+            return None
+        ElementCache.for_driver(driver).invalidate()
+        cls.stats["created"] += 1
+        cls.stats["create_time"] += time.perf_counter() - start
+        return cls(driver, context_id, target["targetId"], home)
+
+    def close(self):
+        """Buang context (semua tab, storage, cookies, cache-nya) dan kembali ke tab awal."""
+        start = time.perf_counter()
+        try:
+            self.driver.switch_to.window(self.home_handle)
+            self.driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": self.context_id})
+        finally:
+            ElementCache.for_driver(self.driver).invalidate()
+            self.stats["dispose_time"] += time.perf_counter() - start
+
+    @classmethod
+    def summary(cls):
+        created = cls.stats["created"]
+        if not created:
+            return "created=0"
+        return (
+            f"created={created}, avg_create={cls.stats['create_time'] / created * 1000:.0f}ms, "
+            f"avg_dispose={cls.stats['dispose_time'] / created * 1000:.0f}ms"
+        )
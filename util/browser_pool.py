@@ -0,0 +1,124 @@
+import logging
+import time
+from collections import deque
+
+from selenium.common.exceptions import WebDriverException
+
+from util.element_cache import ElementCache
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """
+    Pool driver Chrome yang dipakai ulang antar test (scope session).
+    Driver di-reset (storage, cookies, URL) sebelum dipinjam lagi dan
+    di-recycle kalau crash atau sudah dipakai `max_uses` kali. Proses chromedriver
+    yang mati tidak muncul sebagai WebDriverException (urllib3 MaxRetryError /
+    ConnectionError), jadi health check, reset dan quit menangkap semua Exception.
+    """
+
+    def __init__(self, factory, max_uses=25):
+        self.factory = factory
+        self.max_uses = max_uses
+        self._idle = deque()
+        self._uses = {}
+        self.stats = {
+            "launches": 0,
+            "reuses": 0,
+            "recycled": 0,
+            "launch_time": 0.0,
+        }
+
+    # -------------------------
+    # Lifecycle
+    # -------------------------
+    def _launch(self):
+        start = time.perf_counter()
+        drv = self.factory()
+        self.stats["launch_time"] += time.perf_counter() - start
+        self.stats["launches"] += 1
+        self._uses[id(drv)] = 0
+        logger.info(f"[BrowserPool] 🚀 Launch driver baru (total={self.stats['launches']})")
+        return drv
+
+    def _quit(self, drv):
+        self._uses.pop(id(drv), None)
+        try:
+            drv.quit()
+        except Exception:
+            pass
+
+    def acquire(self):
+        """Ambil driver sehat dari pool, atau launch baru kalau tidak ada."""
+        while self._idle:
+            drv = self._idle.popleft()
+            if self.is_healthy(drv):
+                self.stats["reuses"] += 1
+                self._uses[id(drv)] += 1
+                return drv
+            logger.warning("[BrowserPool] ⚠️ Driver tidak sehat, di-recycle")
+            self.stats["recycled"] += 1
+            self._quit(drv)
+        drv = self._launch()
+        self._uses[id(drv)] += 1
+        return drv
+
+    def release(self, drv, reset_url=None):
+        """Kembalikan driver ke pool setelah di-reset."""
+        if self._uses.get(id(drv), 0) >= self.max_uses:
+            logger.info(f"[BrowserPool] ♻️ Driver mencapai {self.max_uses} pemakaian, di-recycle")
+            self.stats["recycled"] += 1
+            self._quit(drv)
+            return
+        try:
+            self.reset(drv, reset_url)
+        except Exception as e:
+            logger.warning(f"[BrowserPool] ⚠️ Reset gagal, driver di-recycle: {type(e).__name__}: {e}")
+            self.stats["recycled"] += 1
+            self._quit(drv)
+            return
+        self._idle.append(drv)
+
+    def discard(self, drv):
+        """Keluarkan driver dari pool tanpa dipakai ulang (state-nya tidak bisa dipercaya)."""
+        self.stats["recycled"] += 1
+        self._quit(drv)
+
+    def close_all(self):
+        while self._idle:
+            self._quit(self._idle.popleft())
+
+    # -------------------------
+    # State
+    # -------------------------
+    @staticmethod
+    def reset(drv, url=None):
+        """Bersihkan localStorage, sessionStorage, cookies lalu kembali ke URL awal."""
+        try:
+            drv.switch_to.alert.dismiss()
+        except WebDriverException:
+            pass
+        if drv.current_url.startswith("http"):
+            drv.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        drv.delete_all_cookies()
+        if url:
+            drv.get(url)
+        ElementCache.for_driver(drv).invalidate()
+
+    @staticmethod
+    def is_healthy(drv):
+        """Health check: session masih hidup dan bisa eksekusi script."""
+        try:
+            return drv.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def summary(self):
+        launches = self.stats["launches"]
+        avg = self.stats["launch_time"] / launches if launches else 0.0
+        return (
+            f"launches={launches}, reuses={self.stats['reuses']} "
+            f"(launch dihemat), recycled={self.stats['recycled']}, "
+            f"avg_launch={avg:.2f}s, est_saved={avg * self.stats['reuses']:.1f}s"
+        )
@@ -0,0 +1,77 @@
+import logging
+
+from data.config import STORAGE_KEYS
+from util.element_cache import ElementCache
+
+logger = logging.getLogger(__name__)
+
+
+class CartState:
+    """
+    Baca/tulis cart aplikasi langsung di localStorage (tanpa klik UI).
+    Dipakai untuk precondition test; test cart level UI tetap pakai CartPage.
+    """
+
+    _SEED_JS = """
+    var cartKey = arguments[0], productsKey = arguments[1], wanted = arguments[2];
+    var products = JSON.parse(localStorage.getItem(productsKey) || '[]');
+    var byName = {};
+    products.forEach(function (p) { byName[p.name.toLowerCase()] = p; });
+    var cart = [], missing = [];
+    wanted.forEach(function (w) {
+        var p = byName[String(w[0]).toLowerCase()];
+        if (!p) { missing.push(w[0]); return; }
+        cart.push({ id: p.id, name: p.name, price: p.price, quantity: w[1] });
+    });
+    if (missing.length) return { missing: missing };
+    localStorage.setItem(cartKey, JSON.stringify(cart));
+    return { cart: cart };
+    """
+
+    def __init__(self, driver, keys=STORAGE_KEYS):
+        self.driver = driver
+        self.cart_key = keys["cart"]
+        self.products_key = keys["products"]
+
+    def _reload(self):
+        # SPA baca localStorage saat load, jadi perlu refresh supaya UI sinkron
+        self.driver.refresh()
+        ElementCache.for_driver(self.driver).invalidate()
+
+    def read(self):
+        """Return isi cart sebagai list dict (id, name, price, quantity)."""
+        return self.driver.execute_script(
+            "return JSON.parse(localStorage.getItem(arguments[0]) || '[]');", self.cart_key
+        )
+
+    def items(self):
+        """Return cart sebagai list (nama produk, qty)."""
+        return [(item["name"], item["quantity"]) for item in self.read()]
+
+    def products(self):
+        """Katalog produk yang disimpan aplikasi (termasuk stok)."""
+        return self.driver.execute_script(
+            "return JSON.parse(localStorage.getItem(arguments[0]) || '[]');", self.products_key
+        )
+
+    def seed(self, items, reload=True):
+        """
+        Isi cart sekaligus dari list (nama produk, qty) dalam satu execute_script.
+        Raise ValueError kalau ada produk yang tidak dikenal aplikasi.
+        """
+        result = self.driver.execute_script(
+            self._SEED_JS, self.cart_key, self.products_key, [list(item) for item in items]
+        )
+        if result.get("missing"):
+            raise ValueError(f"Produk tidak ada di katalog aplikasi: {result['missing']}")
+        if reload:
+            self._reload()
+        logger.info(f"[CartState.seed] ✅ Cart di-seed: {items}")
+        return result["cart"]
+
+    def clear(self, reload=True):
+        """Kosongkan cart dalam satu execute_script."""
+        self.driver.execute_script("localStorage.setItem(arguments[0], '[]');", self.cart_key)
+        if reload:
+            self._reload()
+        logger.info("[CartState.clear] ✅ Cart dikosongkan")
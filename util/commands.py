@@ -0,0 +1,41 @@
+"""
+Hitung WebDriver command (round trip HTTP ke driver) di satu blok kode.
+Semua command, termasuk dari WebElement, lewat `driver.execute`.
+"""
+
+
+class CommandCounter:
+    """
+    Context manager: bungkus `driver.execute` sementara dan hitung command.
+
+        with CommandCounter(driver) as counter:
+            ...
+        counter.count
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.count = 0
+        self.commands = []
+        self._original = None
+        self._wrapped = False
+
+    def __enter__(self):
+        # Kalau sudah dibungkus counter lain (nested), pulihkan wrapper itu nanti
+        self._wrapped = "execute" in vars(self.driver)
+        self._original = self.driver.execute
+
+        def execute(driver_command, params=None):
+            self.count += 1
+            self.commands.append(driver_command)
+            return self._original(driver_command, params)
+
+        self.driver.execute = execute
+        return self
+
+    def __exit__(self, *exc):
+        if self._wrapped:
+            self.driver.execute = self._original
+        else:
+            # Hapus wrapper instance supaya method class asli dipakai lagi
+            del self.driver.execute
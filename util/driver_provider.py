@@ -0,0 +1,199 @@
+"""
+Resolusi binary chromedriver sekali per sesi (dan sekali per mesin lewat cache).
+
+Urutan:
+1. Path eksplisit (--chromedriver atau env CHROMEDRIVER_PATH)
+2. chromedriver di PATH (CI sudah meng-install lewat setup-chromedriver)
+3. Cache mesin (~/.cache/pwdk/chromedriver.json) kalau binary-nya masih ada dan
+   major version Chrome yang ter-install masih sama dengan saat di-cache
+4. ChromeDriverManager().install() di bawah lockfile, lalu hasilnya di-cache
+
+Langkah 4 satu-satunya yang bisa menyentuh network; worker paralel menunggu
+lock dan memakai hasil worker pertama. Kalau Chrome tetap menolak chromedriver
+dari cache (session not created), cache dibuang dan di-resolve ulang sekali.
+"""
+import json
+import logging
+import os
+import shutil
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+logger = logging.getLogger(__name__)
+
+IMPLICIT_WAIT = 5
+CACHE_DIR = os.environ.get("PWDK_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "pwdk"))
+
+
+def _is_executable(path):
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def chrome_major_version():
+    """Major version Chrome yang ter-install (mis. "128"), None kalau tidak terdeteksi."""
+    try:
+        from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+        version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        return None
+    return version.split(".")[0] if version else None
+
+
+@contextmanager
+def file_lock(path, timeout=120, stale_after=300):
+    """
+    Lock antar proses berbasis file (O_CREAT | O_EXCL), jalan di Linux & Windows.
+    Lock yang lebih tua dari `stale_after` detik dianggap sisa proses yang mati.
+    """
+    start = time.monotonic()
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(path) > stale_after:
+                    os.remove(path)
+                    continue
+            except FileNotFoundError:
+                continue
+            if time.monotonic() - start > timeout:
+                raise TimeoutError(f"Lock {path} tidak dilepas dalam {timeout}s")
+            time.sleep(0.2)
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        yield
+    finally:
+        os.close(fd)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class ChromeDriverProvider:
+    """Resolve path chromedriver satu kali; panggilan berikutnya memakai hasil yang sama."""
+
+    def __init__(self, explicit_path=None, cache_dir=CACHE_DIR):
+        self.explicit_path = explicit_path or os.environ.get("CHROMEDRIVER_PATH")
+        self.cache_dir = cache_dir
+        self.cache_file = os.path.join(cache_dir, "chromedriver.json")
+        self.lock_file = os.path.join(cache_dir, "chromedriver.lock")
+        self._path = None
+        self._chrome_major = False
+        self.source = None
+        self.resolve_time = 0.0
+
+    def path(self):
+        if self._path is None:
+            start = time.perf_counter()
+            self._path, self.source = self._resolve()
+            self.resolve_time = time.perf_counter() - start
+            logger.info(
+                f"[ChromeDriverProvider] ✅ chromedriver ({self.source}) {self._path} "
+                f"di-resolve dalam {self.resolve_time:.2f}s"
+            )
+        return self._path
+
+    def chrome_major(self):
+        if self._chrome_major is False:
+            self._chrome_major = chrome_major_version()
+        return self._chrome_major
+
+    def invalidate(self):
+        """Buang cache mesin + hasil resolve sesi ini (chromedriver dari cache ditolak Chrome)."""
+        try:
+            os.remove(self.cache_file)
+        except FileNotFoundError:
+            pass
+        logger.warning(f"[ChromeDriverProvider] ⚠️ Cache chromedriver {self._path} dibuang, resolve ulang")
+        self._path = None
+        self.source = None
+
+    def _resolve(self):
+        if self.explicit_path:
+            if not _is_executable(self.explicit_path):
+                raise FileNotFoundError(f"chromedriver tidak ditemukan / tidak executable: {self.explicit_path}")
+            return self.explicit_path, "explicit"
+
+        on_path = shutil.which("chromedriver")
+        if on_path:
+            return on_path, "PATH"
+
+        cached = self._read_cache()
+        if cached:
+            return cached, "cache"
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with file_lock(self.lock_file):
+            # Worker lain mungkin sudah selesai download selama kita menunggu lock
+            cached = self._read_cache()
+            if cached:
+                return cached, "cache"
+            from webdriver_manager.chrome import ChromeDriverManager
+
+            installed = ChromeDriverManager().install()
+            self._write_cache(installed)
+            return installed, "webdriver-manager"
+
+    def _read_cache(self):
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        path = entry.get("path")
+        if not _is_executable(path):
+            return None
+        major = self.chrome_major()
+        if major and entry.get("chrome_major") != major:
+            logger.info(
+                f"[ChromeDriverProvider] Cache untuk Chrome {entry.get('chrome_major')}, "
+                f"ter-install Chrome {major}: resolve ulang"
+            )
+            return None
+        return path
+
+    def _write_cache(self, path):
+        tmp = f"{self.cache_file}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"path": path, "chrome_major": self.chrome_major(), "resolved_at": time.time()}, f)
+        os.replace(tmp, self.cache_file)
+
+    def summary(self):
+        return f"source={self.source}, path={self._path}, resolve={self.resolve_time:.2f}s"
+
+
+def create_driver(provider):
+    """Launch Chrome headless dengan chromedriver dari `provider`."""
+    opts = Options()
+
+    # Jalankan headless jika tidak perlu lihat browser
+    opts.add_argument("--headless=new")  # Comment kalau mau lihat browser
+    opts.add_argument("--window-size=1440,1080")
+    opts.add_experimental_option("excludeSwitches", ["enable-logging"])
+    # Optimisasi startup
+    opts.add_argument("--disable-extensions")
+    opts.add_argument("--disable-gpu")
+    opts.add_argument("--log-level=3")
+    opts.add_argument("--no-sandbox")
+    opts.add_argument("--disable-dev-shm-usage")
+
+    start = time.perf_counter()
+    try:
+        drv = webdriver.Chrome(service=Service(provider.path()), options=opts)
+    except SessionNotCreatedException:
+        if provider.source != "cache":
+            raise
+        # Chrome ter-update tapi versinya tidak terdeteksi: cache basi, coba sekali lagi
+        provider.invalidate()
+        drv = webdriver.Chrome(service=Service(provider.path()), options=opts)
+    logger.info(f"🚀 Chrome launch dalam {time.perf_counter() - start:.2f}s")
+    drv.implicitly_wait(IMPLICIT_WAIT)
+    return drv
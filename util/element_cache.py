@@ -0,0 +1,82 @@
+"""
+Cache WebElement per driver: elemen yang sama dipakai ulang sampai ada navigasi
+(invalidate) atau StaleElementReferenceException, dengan counter hit/miss.
+"""
+import logging
+import weakref
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.support import expected_conditions as EC
+
+logger = logging.getLogger(__name__)
+
+
+class ElementCacheStats:
+    """Counter hit/miss/stale; di-reset per test oleh conftest."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    def as_dict(self):
+        return {"hits": self.hits, "misses": self.misses, "stale": self.stale}
+
+
+ELEMENT_CACHE_STATS = ElementCacheStats()
+
+_caches = weakref.WeakKeyDictionary()
+
+
+class ElementCache:
+    def __init__(self, driver, stats=ELEMENT_CACHE_STATS):
+        self.driver = driver
+        self.stats = stats
+        self._elements = {}
+
+    @classmethod
+    def for_driver(cls, driver):
+        """Satu cache per driver, dipakai bersama oleh semua page object."""
+        cache = _caches.get(driver)
+        if cache is None:
+            cache = _caches[driver] = cls(driver)
+        return cache
+
+    def invalidate(self):
+        """Buang semua handle (dipanggil setelah navigasi / re-render besar)."""
+        self._elements.clear()
+
+    def find(self, locator, wait=None, name=None):
+        """
+        Ambil elemen dari cache, atau cari (pakai `wait` kalau ada, untuk
+        menunggu elemen visible; `name` = nama wait untuk AdaptiveWait) lalu simpan.
+        """
+        element = self._elements.get(locator)
+        if element is not None:
+            self.stats.hits += 1
+            return element
+
+        self.stats.misses += 1
+        if wait is not None:
+            condition = EC.visibility_of_element_located(locator)
+            element = wait.until(condition, name=name) if name else wait.until(condition)
+        else:
+            element = self.driver.find_element(*locator)
+        self._elements[locator] = element
+        return element
+
+    def use(self, locator, action, wait=None, name=None):
+        """
+        Jalankan `action(element)`; kalau handle sudah stale,
+        cari ulang sekali lalu ulangi action.
+        """
+        try:
+            return action(self.find(locator, wait, name))
+        except StaleElementReferenceException:
+            self.stats.stale += 1
+            self._elements.pop(locator, None)
+            logger.debug(f"[ElementCache] Handle stale, cari ulang: {locator}")
+            return action(self.find(locator, wait, name))
@@ -0,0 +1,144 @@
+"""
+Capture khusus test gagal: selama test berjalan, setiap aksi WebDriver (klik,
+ketik, navigasi) diikuti snapshot murah (DOM atau screenshot) yang disimpan di
+ring buffer berukuran K di memori. Test lulus -> buffer dibuang tanpa menulis apa pun.
+Test gagal -> K frame terakhir + page source + screenshot saat gagal ditulis ke
+disk dan ditempel ke report HTML.
+
+Mode default "off" tidak merekam frame (snapshot per aksi = satu round trip
+tambahan, ikut terhitung di benchmark); page source + screenshot saat gagal tetap
+diambil lazily hanya untuk test yang gagal.
+"""
+import base64
+import json
+import logging
+import os
+import re
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+
+logger = logging.getLogger(__name__)
+
+MODES = ("off", "dom", "screenshot")
+ACTION_COMMANDS = {
+    Command.CLICK_ELEMENT,
+    Command.SEND_KEYS_TO_ELEMENT,
+    Command.CLEAR_ELEMENT,
+    Command.GET,
+    Command.REFRESH,
+    Command.GO_BACK,
+    Command.GO_FORWARD,
+}
+MAX_DOM_CHARS = 200_000
+
+_DOM_JS = """
+return [location.href, document.title, document.documentElement.outerHTML.slice(0, arguments[0])];
+"""
+
+
+class FrameRecorder:
+    """Ring buffer frame terakhir untuk satu driver selama satu test."""
+
+    def __init__(self, mode="off", frames=5):
+        if mode not in MODES:
+            raise ValueError(f"Mode capture tidak dikenal: {mode} (pilihan: {', '.join(MODES)})")
+        self.mode = mode
+        self.frames = deque(maxlen=max(frames, 1))
+        self.captured = 0
+        self.capture_time = 0.0
+        self._execute = None
+        self.driver = None
+
+    @contextmanager
+    def track(self, driver):
+        """Pasang wrapper di driver.execute; dilepas lagi di akhir test."""
+        self.driver = driver
+        if self.mode == "off":
+            yield self
+            return
+        wrapped = "execute" in vars(driver)
+        original_execute = driver.execute
+        self._execute = original_execute
+
+        def execute(driver_command, params=None):
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                if driver_command in ACTION_COMMANDS:
+                    self._snapshot(driver_command)
+
+        driver.execute = execute
+        try:
+            yield self
+        finally:
+            if wrapped:
+                driver.execute = original_execute
+            else:
+                del driver.execute
+            self._execute = None
+
+    def _snapshot(self, command):
+        start = time.perf_counter()
+        frame = {"command": command, "time": time.time()}
+        try:
+            if self.mode == "screenshot":
+                frame["png"] = self._execute(Command.SCREENSHOT)["value"]
+            else:
+                url, title, html = self._execute(Command.W3C_EXECUTE_SCRIPT, {"script": _DOM_JS, "args": [MAX_DOM_CHARS]})["value"]
+                frame.update(url=url, title=title, html=html)
+        except WebDriverException as e:
+            # Mis. alert terbuka setelah klik checkout: catat saja, jangan ganggu test
+            frame["error"] = e.msg or type(e).__name__
+        self.frames.append(frame)
+        self.captured += 1
+        self.capture_time += time.perf_counter() - start
+
+    def dump(self, nodeid, out_dir):
+        """
+        Tulis frame di buffer + kondisi terakhir halaman ke out_dir/<nodeid>/.
+        Return list (label, jenis, isi) untuk ditempel ke report.
+        """
+        driver = self.driver
+        folder = os.path.join(out_dir, re.sub(r"[^\w.-]+", "_", nodeid).strip("_"))
+        os.makedirs(folder, exist_ok=True)
+        attachments = []
+        index = []
+
+        for i, frame in enumerate(self.frames, start=1):
+            label = f"frame {i}/{len(self.frames)} setelah {frame['command']}"
+            entry = {k: v for k, v in frame.items() if k not in ("png", "html")}
+            if "png" in frame:
+                entry["file"] = f"frame_{i:02d}.png"
+                with open(os.path.join(folder, entry["file"]), "wb") as f:
+                    f.write(base64.b64decode(frame["png"]))
+                attachments.append((label, "png", frame["png"]))
+            elif "html" in frame:
+                entry["file"] = f"frame_{i:02d}.html"
+                with open(os.path.join(folder, entry["file"]), "w", encoding="utf-8") as f:
+                    f.write(frame["html"])
+                attachments.append((f"{label} ({frame['url']})", "text", frame["html"]))
+            index.append(entry)
+
+        try:
+            source = driver.page_source
+            with open(os.path.join(folder, "page_source.html"), "w", encoding="utf-8") as f:
+                f.write(source)
+            attachments.append(("page source saat gagal", "text", source))
+            final = driver.get_screenshot_as_base64()
+            with open(os.path.join(folder, "final.png"), "wb") as f:
+                f.write(base64.b64decode(final))
+            attachments.append(("screenshot saat gagal", "png", final))
+        except WebDriverException as e:
+            logger.warning(f"[FrameRecorder.dump] ⚠️ Kondisi akhir halaman tidak bisa diambil: {e.msg}")
+
+        with open(os.path.join(folder, "frames.json"), "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+        logger.info(f"[FrameRecorder.dump] 📸 {len(self.frames)} frame + kondisi akhir ditulis ke {folder}")
+        return attachments
+
+    def clear(self):
+        self.frames.clear()
@@ -1,23 +1,22 @@
-from datetime import datetime
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 import os
+from data.config import BASE_URL, ADMIN
+from util.screenshots import SCREENSHOTS
 
 def base_url():
-    return "https://simple-pos-pwdk.netlify.app/"
+    return BASE_URL
 
 def credentials():
-    return {"email": "admin@pos.com", "password": "admin"}
+    return dict(ADMIN)
 
 def take_screenshot(driver, name, folder="screenshots"):
-    # Buat folder kalau belum ada
-    path = os.path.join(folder)
-    os.makedirs(path, exist_ok=True)
-    
-    # Tambahkan timestamp biar unik
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    file_path = os.path.join(path, f"{name}_{timestamp}.png")
-
-    driver.save_screenshot(file_path)
-    return file_path
+    """
+    Screenshot evidence lewat pipeline asinkron (util/screenshots.py).
+    Return path file content-addressed; nama logis dicatat di <folder>/index.jsonl.
+    Di pytest hanya aktif dengan --evidence (return None kalau tidak).
+    """
+    # Worker paralel punya root sendiri
+    path = os.path.join(os.environ.get("SCREENSHOT_ROOT", ""), folder)
+    return SCREENSHOTS.capture(driver, name, path)
@@ -0,0 +1,94 @@
+"""
+Soak / deteksi leak memori JS: ulangi satu siklus UI N kali, ambil sample heap JS,
+jumlah node DOM dan event listener (CDP, sesudah GC paksa), lalu hitung tren
+pertumbuhan per siklus dengan regresi linear.
+"""
+import csv
+import logging
+import os
+import statistics
+import time
+
+logger = logging.getLogger(__name__)
+
+# Nama metrik CDP Performance.getMetrics -> kolom CSV
+METRICS = {"JSHeapUsedSize": "heap_bytes", "Nodes": "dom_nodes", "JSEventListeners": "listeners"}
+
+
+class HeapSampler:
+    def __init__(self, driver):
+        self.driver = driver
+        self.driver.execute_cdp_cmd("Performance.enable", {})
+
+    def sample(self):
+        """GC paksa lalu baca heap, node dan listener (satu dict per sample)."""
+        self.driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+        metrics = self.driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+        values = {m["name"]: m["value"] for m in metrics}
+        return {column: values.get(name, 0) for name, column in METRICS.items()}
+
+
+class SoakRun:
+    """
+    Jalankan `cycle` sebanyak `cycles` kali dan sample memori setiap `sample_every` siklus.
+    Sample sebelum `warmup` siklus diabaikan saat menghitung tren (JIT, cache awal).
+    """
+
+    def __init__(self, driver, cycles=200, sample_every=10, warmup=10):
+        self.driver = driver
+        self.cycles = cycles
+        self.sample_every = sample_every
+        self.warmup = warmup
+        self.samples = []
+
+    def run(self, cycle):
+        sampler = HeapSampler(self.driver)
+        start = time.perf_counter()
+        self._record(sampler, 0, start)
+        for i in range(1, self.cycles + 1):
+            cycle()
+            if i % self.sample_every == 0 or i == self.cycles:
+                self._record(sampler, i, start)
+        return self.samples
+
+    def _record(self, sampler, cycle_no, start):
+        sample = {"cycle": cycle_no, "elapsed": round(time.perf_counter() - start, 3)}
+        sample.update(sampler.sample())
+        self.samples.append(sample)
+        logger.info(f"[SoakRun] siklus {cycle_no}: {sample}")
+
+    def trend(self):
+        """Slope (kenaikan per siklus) tiap metrik, dari sample sesudah warmup."""
+        points = [s for s in self.samples if s["cycle"] >= self.warmup]
+        if len(points) < 2:
+            points = self.samples
+        if len(points) < 2:
+            return {column: 0.0 for column in METRICS.values()}
+        xs = [s["cycle"] for s in points]
+        return {
+            column: statistics.linear_regression(xs, [s[column] for s in points]).slope
+            for column in METRICS.values()
+        }
+
+    def check(self, max_heap_per_cycle, max_nodes_per_cycle=0.5, max_listeners_per_cycle=0.5):
+        """Return list pelanggaran threshold pertumbuhan per siklus."""
+        slopes = self.trend()
+        limits = {
+            "heap_bytes": max_heap_per_cycle,
+            "dom_nodes": max_nodes_per_cycle,
+            "listeners": max_listeners_per_cycle,
+        }
+        return [
+            f"{column} tumbuh {slopes[column]:.1f}/siklus (batas {limit})"
+            for column, limit in limits.items()
+            if slopes[column] > limit
+        ]
+
+    def write_csv(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=["cycle", "elapsed", *METRICS.values()])
+            writer.writeheader()
+            writer.writerows(self.samples)
+        logger.info(f"[SoakRun] ✅ Time series ditulis ke {path}")
+        return path
@@ -0,0 +1,223 @@
+"""
+Load driver checkout: N sesi Chrome headless paralel (thread pool), masing-masing
+mengulang alur test_checkout: login -> tambah produk -> checkout -> alert + TXID.
+Laporan: throughput checkout/menit, latency per langkah (p50/p90/p95/p99) dan error rate.
+
+Contoh:
+    python -m util.load --sessions 4 --duration 120
+    python -m util.load --sessions 8 --iterations 20 --latency-ms 50 --out reports/load.json
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from data.config import ADMIN
+from pages.cart_page import CartPage
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from util.benchmark import percentile
+from util.browser_pool import BrowserPool
+from util.driver_provider import ChromeDriverProvider, create_driver
+from util.local_app import LocalAppServer
+
+logger = logging.getLogger(__name__)
+
+STEPS = ("login", "add_product", "checkout", "confirm")
+PRODUCT = "Wireless Headphones"
+
+
+class LoadStats:
+    """Kumpulan latency per langkah + error dari semua sesi (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.error_types = defaultdict(int)
+        self.checkouts = 0
+        self.iterations = 0
+
+    def record(self, step, elapsed):
+        with self._lock:
+            self.latencies[step].append(elapsed)
+
+    def finish(self, ok, failed_step=None, error=None):
+        with self._lock:
+            self.iterations += 1
+            if ok:
+                self.checkouts += 1
+            else:
+                self.errors[failed_step] += 1
+                if error is not None:
+                    self.error_types[f"{failed_step}: {type(error).__name__}"] += 1
+
+    def report(self, elapsed, sessions):
+        with self._lock:
+            return self._report(elapsed, sessions)
+
+    def _report(self, elapsed, sessions):
+        steps = {}
+        for step in STEPS:
+            values = self.latencies.get(step)
+            if not values:
+                continue
+            steps[step] = {
+                "count": len(values),
+                **{f"p{p}": round(percentile(values, p) * 1000, 1) for p in (50, 90, 95, 99)},
+            }
+        failed = sum(self.errors.values())
+        return {
+            "sessions": sessions,
+            "elapsed": round(elapsed, 2),
+            "iterations": self.iterations,
+            "checkouts": self.checkouts,
+            "throughput_per_min": round(self.checkouts / elapsed * 60, 2) if elapsed else 0.0,
+            "error_rate": round(failed / self.iterations, 4) if self.iterations else 0.0,
+            "errors": dict(self.errors),
+            "error_types": dict(self.error_types),
+            "steps_ms": steps,
+        }
+
+
+class CheckoutSession:
+    """Satu sesi browser yang mengulang alur checkout sampai deadline / jumlah iterasi."""
+
+    def __init__(self, index, provider, app_url, stats, creds=ADMIN):
+        self.index = index
+        self.provider = provider
+        self.app_url = app_url
+        self.stats = stats
+        self.creds = creds
+
+    def _step(self, name, action):
+        start = time.perf_counter()
+        result = action()
+        self.stats.record(name, time.perf_counter() - start)
+        return result
+
+    def iteration(self, driver):
+        lp = LoginPage(driver)
+        pp = ProductsPage(driver)
+        cp = CartPage(driver)
+
+        def login():
+            lp.visit(self.app_url)
+            lp.login(self.creds["email"], self.creds["password"])
+            lp.assert_logged_in()
+
+        def add_product():
+            pp.search_product(PRODUCT)
+            pp.add_to_cart(PRODUCT)
+
+        def checkout():
+            cp.checkout()
+            cp.fill_customer_info(f"Load User {self.index}", f"load{self.index}@example.com")
+            cp.select_payment_method("Cash")
+            cp.complete_transaction()
+
+        def confirm():
+            _, txid = cp.get_transaction_alert_and_id()
+            if txid is None:
+                raise AssertionError("TXID tidak muncul di alert")
+            return txid
+
+        step = None
+        try:
+            for step, action in zip(STEPS, (login, add_product, checkout, confirm)):
+                self._step(step, action)
+        except Exception as e:
+            # Semua error (assert, WebDriver, timeout helper, urllib3, parsing) = iterasi gagal, sesi lanjut
+            logger.warning(f"[Load] sesi {self.index} gagal di {step}: {type(e).__name__}: {e}")
+            self.stats.finish(False, step, e)
+            return False
+        self.stats.finish(True)
+        return True
+
+    def run(self, deadline=None, iterations=None):
+        driver = None
+        done = 0
+        try:
+            while (iterations is None or done < iterations) and (deadline is None or time.monotonic() < deadline):
+                done += 1
+                try:
+                    if driver is None:
+                        driver = create_driver(self.provider)
+                    # State bersih tiap iterasi: login ulang dari form, cart kosong
+                    BrowserPool.reset(driver)
+                except Exception as e:
+                    # Chrome gagal launch / proses driver mati: catat, launch ulang di iterasi berikutnya
+                    logger.warning(f"[Load] sesi {self.index} driver tidak siap: {type(e).__name__}: {e}")
+                    self.stats.finish(False, "driver", e)
+                    self._quit(driver)
+                    driver = None
+                    time.sleep(1)
+                    continue
+                self.iteration(driver)
+        finally:
+            self._quit(driver)
+
+    @staticmethod
+    def _quit(driver):
+        if driver is None:
+            return
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+def run(sessions, app_url, provider, duration=None, iterations=None):
+    stats = LoadStats()
+    deadline = time.monotonic() + duration if duration else None
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions, thread_name_prefix="load") as pool:
+        futures = [
+            pool.submit(CheckoutSession(i, provider, app_url, stats).run, deadline, iterations)
+            for i in range(sessions)
+        ]
+        for future in futures:
+            future.result()
+    return stats.report(time.perf_counter() - start, sessions)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test alur checkout dengan N sesi browser paralel.")
+    parser.add_argument("--sessions", type=int, default=4)
+    limit = parser.add_mutually_exclusive_group()
+    limit.add_argument("--duration", type=float, default=None, help="Lama run (detik).")
+    limit.add_argument("--iterations", type=int, default=None, help="Jumlah checkout per sesi.")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latency buatan stand-in lokal.")
+    parser.add_argument("--app-url", default=None, help="Pakai server yang sudah jalan, bukan stand-in baru.")
+    parser.add_argument("--chromedriver", default=None)
+    parser.add_argument("--out", default=None, help="Simpan laporan sebagai JSON.")
+    parser.add_argument("--max-error-rate", type=float, default=0.01, help="Exit 1 kalau error rate di atas ini.")
+    args = parser.parse_args(argv)
+    if args.duration is None and args.iterations is None:
+        args.duration = 60.0
+
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    provider = ChromeDriverProvider(args.chromedriver)
+    provider.path()
+
+    if args.app_url:
+        report = run(args.sessions, args.app_url, provider, args.duration, args.iterations)
+    else:
+        with LocalAppServer(latency=args.latency_ms / 1000) as server:
+            report = run(args.sessions, server.url, provider, args.duration, args.iterations)
+
+    print(json.dumps(report, indent=2))
+    if args.out:
+        os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 1 if report["error_rate"] > args.max_error_rate else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
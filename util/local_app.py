@@ -0,0 +1,91 @@
+"""
+Stand-in lokal untuk Simple POS: HTTP server kecil yang menyajikan mock SPA
+di data/local_app, dengan opsi latency buatan per request.
+
+Contoh:
+    python -m util.local_app --port 8000 --latency-ms 150
+"""
+import argparse
+import functools
+import logging
+import os
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "local_app")
+
+
+class _AppHandler(SimpleHTTPRequestHandler):
+    latency = 0.0
+
+    def send_head(self):
+        if self.latency:
+            time.sleep(self.latency)
+        # Fallback SPA: route tanpa ekstensi (/pos, /reports, ...) → index.html
+        path = self.path.split("?", 1)[0].split("#", 1)[0]
+        if not os.path.splitext(path)[1] and not os.path.isfile(self.translate_path(path)):
+            self.path = "/index.html"
+        return super().send_head()
+
+    def end_headers(self):
+        self.send_header("Cache-Control", "no-cache")
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        logger.debug("[LocalAppServer] " + format, *args)
+
+
+class LocalAppServer:
+    """HTTP server di thread background; `url` siap dipakai sebagai app_url."""
+
+    def __init__(self, root=APP_DIR, host="127.0.0.1", port=0, latency=0.0):
+        handler = type("Handler", (_AppHandler,), {"latency": latency})
+        self._httpd = ThreadingHTTPServer((host, port), functools.partial(handler, directory=root))
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"[LocalAppServer] ✅ Serving {APP_DIR} di {self.url}")
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Jalankan stand-in lokal Simple POS.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    server = LocalAppServer(host=args.host, port=args.port, latency=args.latency_ms / 1000)
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
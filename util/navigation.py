@@ -0,0 +1,155 @@
+"""
+Navigasi antar halaman lewat tabel route, lalu tunggu indikator siap halaman
+tujuan saja. Mode default "click" (menu sidebar); deep link langsung ke URL
+tujuan (history API SPA atau load URL penuh) opt-in lewat --nav-mode sampai
+terverifikasi di aplikasi asli (tests/test_navigation.py).
+
+    nav = Navigator.for_driver(driver)
+    nav.go("reports")              # mode default (click)
+    nav.go("transactions", "history")
+"""
+import logging
+import time
+import weakref
+from urllib.parse import urljoin, urlsplit
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+
+from data.config import STORAGE_KEYS
+from pages.locators import RouteLocators
+from util.element_cache import ElementCache
+from util.sidebar import Sidebar
+from util.waits import AdaptiveWait, WaitMetrics, browser_query
+
+logger = logging.getLogger(__name__)
+
+MODES = ("history", "url", "click")
+
+
+class Route:
+    def __init__(self, menu, path, ready, logout=False):
+        self.menu = menu
+        self.path = path
+        self.ready = ready
+        self.logout = logout
+
+
+ROUTES = {
+    "pos": Route("Point of Sale", "/pos", RouteLocators.POS_READY),
+    "transactions": Route("Transactions", "/transactions", RouteLocators.TRANSACTIONS_READY),
+    "reports": Route("Reports", "/reports", RouteLocators.REPORTS_READY),
+    "logout": Route("Sign Out", "/login", RouteLocators.LOGIN_READY, logout=True),
+}
+
+# Batas probe mode history: router yang bereaksi ke popstate render dalam beberapa frame
+HISTORY_PROBE_MS = 300
+
+# pushState + popstate: router SPA render ulang tanpa reload halaman. Lalu cek
+# indikator siap per animation frame, paling lama `limitMs`; false -> router tidak bereaksi.
+_HISTORY_JS = """
+var path = arguments[0], userKey = arguments[1], query = arguments[2], limitMs = arguments[3];
+var done = arguments[arguments.length - 1], start = performance.now();
+if (userKey) localStorage.removeItem(userKey);
+if (location.pathname !== path) history.pushState({}, '', path);
+window.dispatchEvent(new PopStateEvent('popstate', { state: history.state }));
+function ready() {
+    var el = query[0] === 'xpath'
+        ? document.evaluate(query[1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(query[1]);
+    return !!el && el.getClientRects().length > 0;
+}
+(function check() {
+    if (ready()) { done(true); return; }
+    if (performance.now() - start > limitMs) { done(false); return; }
+    requestAnimationFrame(check);
+})();
+"""
+
+_CLEAR_USER_JS = "localStorage.removeItem(arguments[0]);"
+
+# Latency navigasi per route + mode ("reports.history", "pos.click", ...)
+NAV_METRICS = WaitMetrics()
+
+_navigators = weakref.WeakKeyDictionary()
+
+
+class Navigator:
+    default_mode = "click"
+
+    def __init__(self, driver, base_url=None, timeout=10, metrics=NAV_METRICS):
+        self.driver = driver
+        self.base_url = base_url
+        self.timeout = timeout
+        self.metrics = metrics
+        self.wait = AdaptiveWait(driver, timeout)
+        self.sidebar = Sidebar(driver, timeout)
+
+    @classmethod
+    def for_driver(cls, driver, timeout=10):
+        """Satu Navigator per driver (dibuat ulang hanya kalau timeout-nya berbeda)."""
+        nav = _navigators.get(driver)
+        if nav is None or nav.timeout != timeout:
+            nav = _navigators[driver] = cls(driver, timeout=timeout)
+        return nav
+
+    def _origin(self):
+        if self.base_url:
+            return self.base_url
+        parts = urlsplit(self.driver.current_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"base_url tidak bisa ditebak dari {self.driver.current_url!r}, isi base_url")
+        return f"{parts.scheme}://{parts.netloc}/"
+
+    def go(self, name, mode=None):
+        """
+        Pindah ke route `name` (pos, transactions, reports, logout) lalu tunggu
+        indikator siap halaman tujuan. Return latency (detik).
+        """
+        route = ROUTES[name]
+        mode = mode or self.default_mode
+        if mode not in MODES:
+            raise ValueError(f"Mode navigasi tidak dikenal: {mode} (pilihan: {', '.join(MODES)})")
+        user_key = STORAGE_KEYS["user"] if route.logout else None
+
+        start = time.perf_counter()
+        if mode == "history":
+            routed = self.driver.execute_async_script(
+                _HISTORY_JS, route.path, user_key, browser_query(route.ready), HISTORY_PROBE_MS
+            )
+            ElementCache.for_driver(self.driver).invalidate()
+            if not routed:
+                # Router aplikasi tidak bereaksi ke popstate: jangan tunggu timeout penuh, langsung load URL
+                self.metrics.record(f"{name}.{mode}", time.perf_counter() - start, False)
+                logger.warning(f"[Navigator.go] ⚠️ {name} via history API tidak siap, fallback ke URL")
+                return self.go(name, "url")
+        else:
+            if mode == "click":
+                self.sidebar.click_menu(route.menu)
+            else:
+                if user_key:
+                    self.driver.execute_script(_CLEAR_USER_JS, user_key)
+                self.driver.get(urljoin(self._origin(), route.path.lstrip("/")))
+            ElementCache.for_driver(self.driver).invalidate()
+            try:
+                self.wait.until(EC.visibility_of_element_located(route.ready), name=f"route.{name}")
+            except TimeoutException:
+                self.metrics.record(f"{name}.{mode}", time.perf_counter() - start, False)
+                raise
+
+        elapsed = time.perf_counter() - start
+        self.metrics.record(f"{name}.{mode}", elapsed, True)
+        logger.info(f"[Navigator.go] ✅ {name} ({mode}) siap dalam {elapsed * 1000:.0f}ms")
+        return elapsed
+
+    def go_to_pos(self, mode=None):
+        return self.go("pos", mode)
+
+    def go_to_transactions(self, mode=None):
+        return self.go("transactions", mode)
+
+    def go_to_reports(self, mode=None):
+        return self.go("reports", mode)
+
+    def logout(self, mode=None):
+        return self.go("logout", mode)
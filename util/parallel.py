@@ -0,0 +1,260 @@
+"""
+Parallel runner: bagi test ke N worker pytest (masing-masing punya Chrome sendiri)
+berdasarkan durasi run sebelumnya, lalu gabungkan report HTML dan screenshot.
+
+Contoh:
+    python -m util.parallel -n 4 -- -m cart
+"""
+import argparse
+import heapq
+import html
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+
+DURATIONS_FILE = ".test_durations.json"
+DEFAULT_DURATION = 10.0
+NO_TESTS_COLLECTED = 5
+# Outcome yang membuat run gabungan gagal walaupun exit code worker 0
+FAILED_OUTCOMES = ("failed", "error")
+
+DATA_BLOB = re.compile(r'data-jsonblob="([^"]*)"')
+OUTCOME_SPAN = re.compile(r'<span class="(\w+)">(\d+) ')
+RUN_COUNT = re.compile(r'<p class="run-count">[^<]*</p>')
+
+
+# -------------------------
+# Durations
+# -------------------------
+def load_durations(path=DURATIONS_FILE):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(durations, path=DURATIONS_FILE):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(durations, f, indent=2, sort_keys=True)
+
+
+# -------------------------
+# Scheduling
+# -------------------------
+def collect(pytest_args):
+    """
+    Ambil daftar node id lewat `pytest --collect-only -q`. Raise RuntimeError kalau
+    collect gagal (mis. import/syntax error di modul test), supaya modul yang rusak
+    tidak diam-diam hilang dari run paralel.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "-o", "log_cli=false", *pytest_args],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode == NO_TESTS_COLLECTED:
+        return []
+    if proc.returncode != 0:
+        output = "\n".join(part for part in (proc.stdout.strip(), proc.stderr.strip()) if part)
+        raise RuntimeError(f"pytest --collect-only gagal (exit {proc.returncode}):\n{output}")
+    return [line.strip() for line in proc.stdout.splitlines() if "::" in line]
+
+
+def assign_shards(node_ids, durations, workers):
+    """
+    Longest-processing-time first: test terpanjang dulu, selalu ke worker
+    dengan total durasi terkecil. Test tanpa histori pakai median durasi.
+    """
+    known = sorted(durations[n] for n in node_ids if n in durations)
+    fallback = known[len(known) // 2] if known else DEFAULT_DURATION
+    weighted = sorted(((durations.get(n, fallback), n) for n in node_ids), reverse=True)
+
+    heap = [(0.0, i) for i in range(workers)]
+    shards = [[] for _ in range(workers)]
+    for cost, node_id in weighted:
+        load, idx = heapq.heappop(heap)
+        shards[idx].append(node_id)
+        heapq.heappush(heap, (load + cost, idx))
+    loads = sorted(load for load, _ in heap)
+    return shards, loads
+
+
+# -------------------------
+# Report merge
+# -------------------------
+def merge_html_reports(paths, target, wall_time):
+    """
+    Gabungkan beberapa report pytest-html (v4) jadi satu file.
+    Return jumlah test per outcome, atau None kalau tidak ada report yang bisa dibaca.
+    """
+    paths = [p for p in paths if os.path.exists(p)]
+    if not paths:
+        return None
+
+    merged_tests = {}
+    counts = {}
+    base = None
+    base_data = None
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        blob = DATA_BLOB.search(content)
+        if not blob:
+            logger.warning(f"[merge_html_reports] ⚠️ Data report tidak ditemukan di {path}")
+            continue
+        data = json.loads(html.unescape(blob.group(1)))
+        merged_tests.update(data.get("tests", {}))
+        for outcome, value in OUTCOME_SPAN.findall(content):
+            counts[outcome] = counts.get(outcome, 0) + int(value)
+        if base is None:
+            base, base_data = content, data
+
+    if base is None:
+        return None
+
+    base_data["tests"] = merged_tests
+    result = DATA_BLOB.sub(
+        lambda _: f'data-jsonblob="{html.escape(json.dumps(base_data), quote=True)}"', base, count=1
+    )
+    result = OUTCOME_SPAN.sub(lambda m: f'<span class="{m.group(1)}">{counts.get(m.group(1), 0)} ', result)
+    for outcome, value in counts.items():
+        if value:
+            result = result.replace(f'data-test-result="{outcome}" disabled', f'data-test-result="{outcome}" ')
+    ran = sum(counts.get(k, 0) for k in ("passed", "failed", "error", "xpassed", "xfailed"))
+    result = RUN_COUNT.sub(
+        f'<p class="run-count">{ran} tests took {time.strftime("%H:%M:%S", time.gmtime(wall_time))} '
+        f"({len(paths)} workers).</p>",
+        result,
+        count=1,
+    )
+
+    with open(target, "w", encoding="utf-8") as f:
+        f.write(result)
+    return counts
+
+
+def merge_folders(sources, target):
+    """Copy isi beberapa folder screenshot / dump kegagalan ke satu folder artifact."""
+    for src in sources:
+        if not os.path.isdir(src):
+            continue
+        for root, _, files in os.walk(src):
+            dest_dir = os.path.join(target, os.path.relpath(root, src))
+            os.makedirs(dest_dir, exist_ok=True)
+            for name in files:
+                if name.endswith(".jsonl"):
+                    # Index screenshot tiap worker digabung, bukan ditimpa
+                    with open(os.path.join(root, name), encoding="utf-8") as src_f, open(
+                        os.path.join(dest_dir, name), "a", encoding="utf-8"
+                    ) as dest_f:
+                        shutil.copyfileobj(src_f, dest_f)
+                    continue
+                shutil.copy2(os.path.join(root, name), os.path.join(dest_dir, name))
+
+
+# -------------------------
+# Runner
+# -------------------------
+def run(workers, pytest_args, out_dir="reports/parallel", durations_path=DURATIONS_FILE):
+    try:
+        node_ids = collect(pytest_args)
+    except RuntimeError as e:
+        logger.error(f"[parallel] ❌ {e}")
+        return 2
+    if not node_ids:
+        logger.error("[parallel] ❌ Tidak ada test yang ter-collect")
+        return 5
+
+    durations = load_durations(durations_path)
+    workers = max(1, min(workers, len(node_ids)))
+    shards, loads = assign_shards(node_ids, durations, workers)
+    sharded = [node_id for shard in shards for node_id in shard]
+    if len(sharded) != len(node_ids) or set(sharded) != set(node_ids):
+        raise RuntimeError(f"Shard tidak lengkap: {len(sharded)} node id di shard, {len(node_ids)} ter-collect")
+    logger.info(
+        f"[parallel] {len(node_ids)} test → {workers} worker, estimasi wall={loads[-1]:.1f}s "
+        f"(ideal={sum(loads) / workers:.1f}s)"
+    )
+
+    workers_dir = os.path.join(out_dir, "workers")
+    os.makedirs(workers_dir, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix="pwdk-shards-")
+
+    start = time.perf_counter()
+    procs = []
+    for i, shard in enumerate(shards):
+        # JSON, bukan teks per baris/spasi: node id parametrize bisa berisi spasi ("[This Year]")
+        shard_file = os.path.join(tmp_dir, f"shard-{i}.json")
+        with open(shard_file, "w", encoding="utf-8") as f:
+            json.dump(shard, f)
+        env = dict(
+            os.environ,
+            PWDK_WORKER=str(i),
+            PWDK_SHARD_FILE=shard_file,
+            TEST_DURATIONS_FILE=os.path.join(tmp_dir, f"durations-{i}.json"),
+            SCREENSHOT_ROOT=os.path.join(workers_dir, f"worker-{i}"),
+        )
+        cmd = [
+            sys.executable, "-m", "pytest", *pytest_args,
+            f"--html={os.path.join(workers_dir, f'worker-{i}.html')}",
+            "--self-contained-html",
+            "-o", "log_cli=false",
+        ]
+        procs.append(subprocess.Popen(cmd, env=env))
+
+    codes = [p.wait() for p in procs]
+    wall = time.perf_counter() - start
+
+    for i in range(workers):
+        durations.update(load_durations(os.path.join(tmp_dir, f"durations-{i}.json")))
+    save_durations(durations, durations_path)
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    counts = merge_html_reports(
+        [os.path.join(workers_dir, f"worker-{i}.html") for i in range(workers)],
+        os.path.join(out_dir, "report.html"),
+        wall,
+    )
+    merge_folders(
+        [os.path.join(workers_dir, f"worker-{i}", "screenshots") for i in range(workers)],
+        os.path.join(out_dir, "screenshots"),
+    )
+    merge_folders(
+        [os.path.join(workers_dir, f"worker-{i}", "reports", "failures") for i in range(workers)],
+        os.path.join(out_dir, "failures"),
+    )
+    code = max(codes)
+    failures = sum((counts or {}).get(outcome, 0) for outcome in FAILED_OUTCOMES)
+    if failures and code == 0:
+        code = 1
+    logger.info(f"[parallel] ✅ Selesai dalam {wall:.1f}s, exit codes={codes}, failed/error={failures}")
+    return code
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Jalankan suite secara paralel di N worker pytest.")
+    parser.add_argument("-n", "--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--out", default="reports/parallel", help="Folder artifact gabungan.")
+    parser.add_argument("--durations", default=DURATIONS_FILE, help="File histori durasi test.")
+    parser.add_argument("pytest_args", nargs=argparse.REMAINDER, help="Argumen pytest (setelah --).")
+    args = parser.parse_args(argv)
+
+    pytest_args = args.pytest_args
+    if pytest_args[:1] == ["--"]:
+        pytest_args = pytest_args[1:]
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    return run(args.workers, pytest_args, out_dir=args.out, durations_path=args.durations)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
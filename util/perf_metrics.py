@@ -0,0 +1,185 @@
+"""
+Metrik performa frontend per aksi page object: Navigation Timing, Paint Timing/LCP,
+long task (PerformanceObserver) dan CDP Performance.getMetrics.
+
+Aksi page object ditandai dengan decorator `@perf_action`; metrik hanya diambil
+kalau recorder aktif untuk driver itu (--perf-metrics atau marker perf_budget),
+selain itu decorator tidak menambah round trip apa pun.
+"""
+import functools
+import logging
+import time
+import weakref
+
+from selenium.common.exceptions import UnexpectedAlertPresentException, WebDriverException
+
+logger = logging.getLogger(__name__)
+
+_recorders = weakref.WeakKeyDictionary()
+
+# Pasang observer sekali per dokumen (buffered: entry sebelum install ikut terbaca)
+_START_JS = """
+if (!window.__pwdkPerf) {
+    var perf = window.__pwdkPerf = { lcp: null, longTasks: [] };
+    try {
+        new PerformanceObserver(function (list) {
+            list.getEntries().forEach(function (e) { perf.lcp = e.renderTime || e.startTime; });
+        }).observe({ type: 'largest-contentful-paint', buffered: true });
+    } catch (e) {}
+    try {
+        new PerformanceObserver(function (list) {
+            list.getEntries().forEach(function (e) { perf.longTasks.push([e.startTime, e.duration]); });
+        }).observe({ type: 'longtask', buffered: true });
+    } catch (e) {}
+}
+return { origin: performance.timeOrigin, now: performance.now() };
+"""
+
+# Tunggu dua frame (render sesudah aksi sudah di-paint), lalu kumpulkan metrik.
+# Tab di background tidak menjalankan requestAnimationFrame, jadi ada fallback timer.
+_COLLECT_JS = """
+var since = arguments[0], origin = arguments[1], done = arguments[arguments.length - 1];
+if (performance.timeOrigin !== origin) since = 0;
+var finished = false;
+function collect() {
+    if (finished) return;
+    finished = true;
+    var perf = window.__pwdkPerf || { lcp: null, longTasks: [] };
+    var nav = performance.getEntriesByType('navigation')[0];
+    var paint = {};
+    performance.getEntriesByType('paint').forEach(function (p) { paint[p.name] = p.startTime; });
+    var tasks = perf.longTasks.filter(function (t) { return t[0] >= since; });
+    done({
+        origin: performance.timeOrigin,
+        now: performance.now(),
+        nav: nav ? {
+            ttfb: nav.responseStart,
+            dom_content_loaded: nav.domContentLoadedEventEnd,
+            load: nav.loadEventEnd
+        } : null,
+        fcp: paint['first-contentful-paint'] || null,
+        lcp: perf.lcp,
+        long_tasks: tasks.length,
+        long_task_ms: tasks.reduce(function (sum, t) { return sum + t[1]; }, 0)
+    });
+}
+requestAnimationFrame(function () { requestAnimationFrame(collect); });
+setTimeout(collect, 200);
+"""
+
+# Metrik CDP yang dilaporkan sebagai selisih (sebelum vs sesudah aksi)
+CDP_DELTA_METRICS = {
+    "ScriptDuration": "script_ms",
+    "TaskDuration": "task_ms",
+    "LayoutDuration": "layout_ms",
+    "RecalcStyleDuration": "recalc_style_ms",
+    "LayoutCount": "layout_count",
+}
+# Metrik CDP yang dilaporkan apa adanya (kondisi sesudah aksi)
+CDP_ABSOLUTE_METRICS = {"JSHeapUsedSize": "js_heap_bytes", "Nodes": "dom_nodes"}
+
+
+class PerfRecorder:
+    def __init__(self, driver):
+        self.driver = driver
+        self.samples = []
+        self._active = False
+        self._cdp = None
+
+    @classmethod
+    def start(cls, driver):
+        recorder = _recorders[driver] = cls(driver)
+        return recorder
+
+    @staticmethod
+    def stop(driver):
+        return _recorders.pop(driver, None)
+
+    @staticmethod
+    def for_driver(driver):
+        return _recorders.get(driver)
+
+    def _cdp_metrics(self):
+        if self._cdp is False:
+            return {}
+        try:
+            if self._cdp is None:
+                self.driver.execute_cdp_cmd("Performance.enable", {"timeDomain": "threadTicks"})
+                self._cdp = True
+            result = self.driver.execute_cdp_cmd("Performance.getMetrics", {})
+        except (AttributeError, WebDriverException):
+            self._cdp = False
+            return {}
+        return {m["name"]: m["value"] for m in result["metrics"]}
+
+    def measure(self, name, action):
+        """Jalankan `action` dan simpan satu sample metrik dengan nama `name`."""
+        if self._active:
+            return action()
+        self._active = True
+        try:
+            before = self._safe_script(_START_JS) or {}
+            cdp_before = self._cdp_metrics()
+            start = time.perf_counter()
+            result = action()
+            page = self._safe_async_script(_COLLECT_JS, before.get("now", 0), before.get("origin"))
+            sample = {"name": name, "duration_ms": round((time.perf_counter() - start) * 1000, 1)}
+            if page:
+                navigated = page["origin"] != before.get("origin")
+                sample["navigated"] = navigated
+                if navigated and page["nav"]:
+                    sample.update({key: round(value, 1) for key, value in page["nav"].items()})
+                for key in ("fcp", "lcp", "long_task_ms"):
+                    if page[key] is not None:
+                        sample[key] = round(page[key], 1)
+                sample["long_tasks"] = page["long_tasks"]
+            cdp_after = self._cdp_metrics()
+            for metric, key in CDP_DELTA_METRICS.items():
+                if metric in cdp_after and metric in cdp_before:
+                    delta = cdp_after[metric] - cdp_before[metric]
+                    sample[key] = round(delta * 1000, 1) if key.endswith("_ms") else delta
+            for metric, key in CDP_ABSOLUTE_METRICS.items():
+                if metric in cdp_after:
+                    sample[key] = cdp_after[metric]
+            self.samples.append(sample)
+            logger.info(f"[Perf] {name}: {sample['duration_ms']}ms")
+            return result
+        finally:
+            self._active = False
+
+    def _safe_script(self, script, *args):
+        try:
+            return self.driver.execute_script(script, *args)
+        except UnexpectedAlertPresentException:
+            # Alert (mis. sesudah complete transaction) memblokir script; cukup catat durasi
+            return None
+
+    def _safe_async_script(self, script, *args):
+        try:
+            return self.driver.execute_async_script(script, *args)
+        except UnexpectedAlertPresentException:
+            return None
+
+    def check_budget(self, name, **limits):
+        """Return list pelanggaran budget (pakai nilai terburuk dari semua sample `name`)."""
+        violations = []
+        samples = [s for s in self.samples if s["name"] == name]
+        for metric, limit in limits.items():
+            values = [s[metric] for s in samples if metric in s]
+            if values and max(values) > limit:
+                violations.append(f"{name}.{metric}={max(values)} > budget {limit}")
+        return violations
+
+
+def perf_action(func):
+    """Decorator untuk method page object: ukur aksi kalau recorder aktif untuk driver-nya."""
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        recorder = _recorders.get(self.driver)
+        if recorder is None:
+            return func(self, *args, **kwargs)
+        return recorder.measure(name, lambda: func(self, *args, **kwargs))
+
+    return wrapper
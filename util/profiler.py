@@ -0,0 +1,187 @@
+"""
+Profiler WebDriver per test: catat setiap command + durasinya, hitung round trip
+per method page object, dan pisahkan waktu explicit wait (WebDriverWait dan
+DomWaiter), implicit wait, dan sleep.
+Diaktifkan dari conftest dengan --profile-webdriver=DIR.
+"""
+import csv
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+# Modul yang dianggap "page object" untuk atribusi command
+PAGE_OBJECT_MODULES = ("pages.", "util.sidebar", "util.navigation", "util.cart_state", "util.auth_state")
+FIND_COMMANDS = {
+    Command.FIND_ELEMENT,
+    Command.FIND_ELEMENTS,
+    Command.FIND_CHILD_ELEMENT,
+    Command.FIND_CHILD_ELEMENTS,
+}
+
+
+def _page_object_method():
+    """Cari frame page object terluar (paling dekat ke test) di call stack."""
+    frame = sys._getframe(2)
+    found = None
+    while frame is not None:
+        owner = frame.f_locals.get("self")
+        # Cek modul kode juga, supaya wrapper decorator (mis. @perf_action) tidak ikut dihitung
+        if (
+            owner is not None
+            and type(owner).__module__.startswith(PAGE_OBJECT_MODULES)
+            and frame.f_globals.get("__name__", "").startswith(PAGE_OBJECT_MODULES)
+        ):
+            found = f"{type(owner).__name__}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return found or "<test>"
+
+
+class CommandProfile:
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+        self.commands = []
+        self.methods = defaultdict(lambda: {"calls": 0, "time": 0.0})
+        self.explicit_wait = 0.0
+        self.implicit_wait = 0.0
+        self.sleep = 0.0
+        self.duration = 0.0
+
+    def record(self, command, elapsed, method, implicit):
+        self.commands.append({"command": command, "time": round(elapsed, 6), "method": method})
+        stats = self.methods[method]
+        stats["calls"] += 1
+        stats["time"] += elapsed
+        if implicit:
+            self.implicit_wait += elapsed
+
+    def summary(self):
+        command_time = sum(c["time"] for c in self.commands)
+        return {
+            "nodeid": self.nodeid,
+            "duration": round(self.duration, 4),
+            "round_trips": len(self.commands),
+            "command_time": round(command_time, 4),
+            "explicit_wait": round(self.explicit_wait, 4),
+            "implicit_wait": round(self.implicit_wait, 4),
+            "sleep": round(self.sleep, 4),
+        }
+
+
+class WebDriverProfiler:
+    """Kumpulkan profil semua test dalam satu sesi."""
+
+    def __init__(self):
+        self.profiles = []
+
+    @contextmanager
+    def track(self, nodeid, driver):
+        from util.waits import DomWaiter  # util.waits meng-import modul ini
+
+        profile = CommandProfile(nodeid)
+        wrapped = "execute" in vars(driver)
+        original_execute = driver.execute
+        original_until = WebDriverWait.until
+        original_until_not = WebDriverWait.until_not
+        original_dom_until = DomWaiter.until
+        original_first_of = DomWaiter.first_of
+        original_sleep = time.sleep
+        test_thread = threading.current_thread()
+
+        def execute(driver_command, params=None):
+            method = _page_object_method()
+            start = time.perf_counter()
+            implicit = False
+            try:
+                response = original_execute(driver_command, params)
+                if driver_command in FIND_COMMANDS and not (response or {}).get("value"):
+                    implicit = True
+                return response
+            except NoSuchElementException:
+                implicit = driver_command in FIND_COMMANDS
+                raise
+            finally:
+                profile.record(driver_command, time.perf_counter() - start, method, implicit)
+
+        waiting = [0]
+
+        def timed(func, bucket):
+            def wrapper(*args, **kwargs):
+                # Thread lain (mis. server stand-in lokal), polling sleep di dalam wait, dan
+                # wait di dalam wait lain tidak dihitung dua kali
+                if threading.current_thread() is not test_thread or waiting[0]:
+                    return func(*args, **kwargs)
+                if bucket == "explicit_wait":
+                    waiting[0] += 1
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    if bucket == "explicit_wait":
+                        waiting[0] -= 1
+                    setattr(profile, bucket, getattr(profile, bucket) + time.perf_counter() - start)
+            return wrapper
+
+        driver.execute = execute
+        WebDriverWait.until = timed(original_until, "explicit_wait")
+        WebDriverWait.until_not = timed(original_until_not, "explicit_wait")
+        DomWaiter.until = timed(original_dom_until, "explicit_wait")
+        DomWaiter.first_of = timed(original_first_of, "explicit_wait")
+        time.sleep = timed(original_sleep, "sleep")
+        start = time.perf_counter()
+        try:
+            yield profile
+        finally:
+            profile.duration = time.perf_counter() - start
+            time.sleep = original_sleep
+            WebDriverWait.until = original_until
+            WebDriverWait.until_not = original_until_not
+            DomWaiter.until = original_dom_until
+            DomWaiter.first_of = original_first_of
+            if wrapped:
+                driver.execute = original_execute
+            else:
+                del driver.execute
+            self.profiles.append(profile)
+
+    def top_methods(self, n=10):
+        """Method page object dengan total waktu command terbesar."""
+        totals = defaultdict(lambda: {"calls": 0, "time": 0.0})
+        for profile in self.profiles:
+            for method, stats in profile.methods.items():
+                totals[method]["calls"] += stats["calls"]
+                totals[method]["time"] += stats["time"]
+        ranked = sorted(totals.items(), key=lambda item: item[1]["time"], reverse=True)
+        return ranked[:n]
+
+    def write(self, folder):
+        """Tulis profile.json (detail per test) dan summary.csv (satu baris per test)."""
+        os.makedirs(folder, exist_ok=True)
+        details = []
+        for profile in self.profiles:
+            entry = profile.summary()
+            entry["methods"] = {
+                name: {"calls": s["calls"], "time": round(s["time"], 4)} for name, s in profile.methods.items()
+            }
+            entry["commands"] = profile.commands
+            details.append(entry)
+        with open(os.path.join(folder, "profile.json"), "w", encoding="utf-8") as f:
+            json.dump(details, f, indent=2)
+
+        fields = ["nodeid", "duration", "round_trips", "command_time", "explicit_wait", "implicit_wait", "sleep"]
+        with open(os.path.join(folder, "summary.csv"), "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            for profile in self.profiles:
+                writer.writerow(profile.summary())
+        logger.info(f"[WebDriverProfiler] ✅ Profil {len(self.profiles)} test ditulis ke {folder}")
@@ -0,0 +1,161 @@
+"""
+Engine agregasi referensi untuk halaman Reports: hitung revenue, orders, customers,
+profit, daily sales dan top products langsung dari pos_transactions (NumPy,
+columnar) lalu bandingkan dengan angka yang di-scrape ReportPage.
+"""
+import json
+import re
+from datetime import datetime
+
+import numpy as np
+
+from data.config import STORAGE_KEYS
+
+# Label filter di UI -> periode (sama dengan inPeriod() di aplikasi)
+FILTERS = {"Today": "today", "Last 7 Days": "7d", "This Month": "month", "This Year": "year"}
+TOP_PRODUCTS = 5
+
+_READ_JS = """
+return {
+    now: Date.now(),
+    transactions: localStorage.getItem(arguments[0]) || '[]',
+    products: localStorage.getItem(arguments[1]) || '[]'
+};
+"""
+
+
+def parse_money(text):
+    """'$1,234.56' -> 1234.56"""
+    return float(re.sub(r"[^\d.\-]", "", text) or 0)
+
+
+def _iso_to_ms(values):
+    # "2026-10-18T07:48:55.614Z" -> epoch ms (UTC)
+    return np.array([v.rstrip("Z") for v in values], dtype="datetime64[ms]").astype(np.int64)
+
+
+class ReportReference:
+    """Data transaksi dalam bentuk kolom NumPy (satu baris per transaksi / per item)."""
+
+    def __init__(self, transactions, products, now_ms):
+        self.now_ms = now_ms
+        cost_by_id = {p["id"]: p.get("cost", 0) for p in products}
+
+        # Level transaksi
+        self.ts = _iso_to_ms(tx["date"] for tx in transactions) if transactions else np.zeros(0, np.int64)
+        self.total = np.fromiter((tx["total"] for tx in transactions), float, len(transactions))
+        _, self.customer = np.unique([tx["customer"]["email"] for tx in transactions] or [""], return_inverse=True)
+        self.customer = self.customer[: len(transactions)]
+        self.day_names, self.day = self._local_days(self.ts)
+
+        # Level item
+        item_tx, names, price, qty, cost = [], [], [], [], []
+        for i, tx in enumerate(transactions):
+            for item in tx["items"]:
+                item_tx.append(i)
+                names.append(item["name"])
+                price.append(item["price"])
+                qty.append(item["quantity"])
+                cost.append(cost_by_id.get(item["id"], 0))
+        self.item_tx = np.array(item_tx, dtype=np.int64)
+        self.item_price = np.array(price, dtype=float)
+        self.item_qty = np.array(qty, dtype=np.int64)
+        self.item_cost = np.array(cost, dtype=float)
+        self.name_list, self.item_name = np.unique(names or [""], return_inverse=True)
+        self.item_name = self.item_name[: len(names)]
+
+    @classmethod
+    def from_browser(cls, driver, keys=STORAGE_KEYS):
+        """Baca transaksi + katalog produk + jam browser dalam satu execute_script."""
+        data = driver.execute_script(_READ_JS, keys["transactions"], keys["products"])
+        return cls(json.loads(data["transactions"]), json.loads(data["products"]), int(data["now"]))
+
+    @staticmethod
+    def _local_days(ts):
+        """Tanggal lokal (YYYY-MM-DD) per transaksi; offset timezone dihitung per jam unik."""
+        if ts.size == 0:
+            return np.array([], dtype=str), np.zeros(0, np.int64)
+        hours, inverse = np.unique(ts // 3_600_000, return_inverse=True)
+        offsets = np.array(
+            [datetime.fromtimestamp(int(h) * 3600).astimezone().utcoffset().total_seconds() * 1000 for h in hours],
+            dtype=np.int64,
+        )
+        local_days = (ts + offsets[inverse]) // 86_400_000
+        day_numbers, day_index = np.unique(local_days, return_inverse=True)
+        names = (day_numbers.astype("datetime64[D]")).astype(str)
+        return names, day_index
+
+    def _period_start(self, period):
+        if period == "7d":
+            # Seperti aplikasi (Date.now() - 7 * 24 jam), bukan 7 hari kalender: beda sejam saat DST
+            return self.now_ms - 7 * 86_400_000
+        now = datetime.fromtimestamp(self.now_ms / 1000)
+        if period == "today":
+            start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        elif period == "month":
+            start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        elif period == "year":
+            start = now.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+        else:
+            raise ValueError(f"Periode tidak dikenal: {period}")
+        return int(start.timestamp() * 1000)
+
+    def aggregate(self, filter_label):
+        """Hasil yang seharusnya tampil untuk filter UI ("Today", "Last 7 Days", ...)."""
+        mask = (self.ts >= self._period_start(FILTERS[filter_label])) & (self.ts <= self.now_ms)
+        item_mask = mask[self.item_tx] if self.item_tx.size else np.zeros(0, bool)
+
+        price = self.item_price[item_mask]
+        qty = self.item_qty[item_mask]
+        names = self.item_name[item_mask]
+        revenue_items = price * qty
+
+        days = self.day[mask]
+        daily = np.bincount(days, weights=self.total[mask], minlength=len(self.day_names))
+        sold = np.bincount(names, weights=qty, minlength=len(self.name_list))
+        product_revenue = np.bincount(names, weights=revenue_items, minlength=len(self.name_list))
+        # Urut revenue desc; seri -> kemunculan pertama di periode ini (urutan key object + sort stabil di JS)
+        present, first_seen = np.unique(names, return_index=True)
+        order = present[np.lexsort((first_seen, -product_revenue[present]))][:TOP_PRODUCTS]
+
+        return {
+            "cards": {
+                "Total Revenue": float(self.total[mask].sum()),
+                "Total Orders": int(mask.sum()),
+                "Total Customers": int(np.unique(self.customer[mask]).size),
+                "Total Profit": float(((price - self.item_cost[item_mask]) * qty).sum()),
+            },
+            "daily": {str(self.day_names[i]): float(daily[i]) for i in np.unique(days)},
+            "top": [(str(self.name_list[i]), int(sold[i]), float(product_revenue[i])) for i in order],
+        }
+
+
+def diff_report(expected, cards, daily, top, tolerance=0.01):
+    """
+    Bandingkan hasil aggregate() dengan getter ReportPage
+    (get_summary_cards, get_daily_sales, get_top_products). Return list selisih.
+    """
+    diffs = []
+
+    actual_cards = dict(cards)
+    for label, value in expected["cards"].items():
+        if label not in actual_cards:
+            diffs.append(f"card {label!r} tidak ada")
+            continue
+        shown = parse_money(actual_cards[label])
+        if abs(shown - value) > tolerance:
+            diffs.append(f"card {label!r}: UI={actual_cards[label]} expected={value:.2f}")
+
+    actual_daily = {date: parse_money(value) for date, value in daily}
+    for date in sorted(set(expected["daily"]) | set(actual_daily)):
+        want, got = expected["daily"].get(date), actual_daily.get(date)
+        if want is None or got is None or abs(want - got) > tolerance:
+            diffs.append(f"daily {date}: UI={got} expected={want}")
+
+    actual_top = [(name, int(re.sub(r"\D", "", sold) or 0), parse_money(total)) for name, sold, total in top]
+    if len(actual_top) != len(expected["top"]):
+        diffs.append(f"top products: UI={len(actual_top)} item, expected={len(expected['top'])}")
+    for rank, (want, got) in enumerate(zip(expected["top"], actual_top), start=1):
+        if want[0] != got[0] or want[1] != got[1] or abs(want[2] - got[2]) > tolerance:
+            diffs.append(f"top #{rank}: UI={got} expected={want}")
+    return diffs
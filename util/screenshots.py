@@ -0,0 +1,166 @@
+"""
+Pipeline screenshot asinkron: test thread hanya mengambil byte PNG
+(get_screenshot_as_png) dan hash-nya; encode + tulis file jalan di thread pool.
+
+File disimpan content-addressed (<folder>/<sha256[:16]>.<ext>), jadi frame yang
+identik cukup ditulis sekali. Nama logis tiap screenshot dicatat di
+<folder>/index.jsonl. Mode kompres (WebP/JPEG + downscale) butuh Pillow;
+kalau tidak ter-install, file tetap ditulis sebagai PNG.
+"""
+import atexit
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+FORMATS = {"png": "PNG", "webp": "WEBP", "jpeg": "JPEG"}
+
+
+def _encode(png, fmt, scale, quality):
+    """Encode ulang PNG dari browser sesuai format/skala (mode png tanpa skala -> byte apa adanya)."""
+    if fmt == "png" and scale >= 1:
+        return png
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(png))
+    if scale < 1:
+        image = image.resize((max(int(image.width * scale), 1), max(int(image.height * scale), 1)))
+    if fmt == "jpeg":
+        image = image.convert("RGB")
+    out = io.BytesIO()
+    image.save(out, FORMATS[fmt], quality=quality, optimize=True)
+    return out.getvalue()
+
+
+class ScreenshotPipeline:
+    """Antrian screenshot satu sesi (satu instance global: SCREENSHOTS)."""
+
+    def __init__(self, workers=2, fmt="png", scale=1.0, quality=80, enabled=True):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._futures = []
+        self._written = set()
+        self.configure(workers, fmt, scale, quality, enabled)
+        self.reset_stats()
+
+    def configure(self, workers=2, fmt="png", scale=1.0, quality=80, enabled=True):
+        if fmt not in FORMATS:
+            raise ValueError(f"Format screenshot tidak dikenal: {fmt} (pilihan: {', '.join(FORMATS)})")
+        if (fmt != "png" or scale < 1) and not self._has_pillow():
+            logger.warning("[ScreenshotPipeline] ⚠️ Pillow tidak ter-install, screenshot tetap ditulis sebagai PNG")
+            fmt, scale = "png", 1.0
+        self.enabled = enabled
+        self.workers = max(workers, 1)
+        self.fmt = fmt
+        self.scale = scale
+        self.quality = quality
+
+    def reset_stats(self):
+        self.stats = {
+            "captured": 0,
+            "written": 0,
+            "deduplicated": 0,
+            "errors": 0,
+            "bytes_captured": 0,
+            "bytes_written": 0,
+            "capture_time": 0.0,
+            "write_time": 0.0,
+        }
+
+    @staticmethod
+    def _has_pillow():
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="screenshot")
+            atexit.register(self.flush)
+        return self._executor
+
+    def _suffix(self):
+        return f"@{int(self.scale * 100)}" if self.scale < 1 else ""
+
+    def capture(self, driver, name, folder):
+        """
+        Ambil screenshot dan antrikan penulisannya. Return path file (mungkin belum
+        selesai ditulis), atau None kalau pipeline dimatikan (mode evidence off).
+        """
+        if not self.enabled:
+            return None
+        start = time.perf_counter()
+        png = driver.get_screenshot_as_png()
+        digest = hashlib.sha256(png).hexdigest()[:16]
+        path = os.path.join(folder, f"{digest}{self._suffix()}.{self.fmt}")
+        entry = {"name": name, "file": os.path.basename(path), "taken_at": datetime.now().isoformat(timespec="milliseconds")}
+
+        with self._lock:
+            self.stats["captured"] += 1
+            self.stats["bytes_captured"] += len(png)
+            duplicate = path in self._written or os.path.exists(path)
+            if duplicate:
+                self.stats["deduplicated"] += 1
+            else:
+                self._written.add(path)
+            self._futures.append(self._pool().submit(self._write, folder, path, None if duplicate else png, entry))
+            self.stats["capture_time"] += time.perf_counter() - start
+        return path
+
+    def _write(self, folder, path, png, entry):
+        start = time.perf_counter()
+        try:
+            os.makedirs(folder, exist_ok=True)
+            written = 0
+            if png is not None:
+                data = _encode(png, self.fmt, self.scale, self.quality)
+                tmp = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+                written = len(data)
+            with self._lock:
+                with open(os.path.join(folder, "index.jsonl"), "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry) + "\n")
+                if png is not None:
+                    self.stats["written"] += 1
+                    self.stats["bytes_written"] += written
+                self.stats["write_time"] += time.perf_counter() - start
+        except Exception as e:
+            logger.error(f"[ScreenshotPipeline] ❌ Gagal menulis {path}: {e}")
+            with self._lock:
+                self.stats["errors"] += 1
+                self._written.discard(path)
+
+    def flush(self):
+        """Tunggu semua screenshot yang masih antri selesai ditulis."""
+        with self._lock:
+            pending, self._futures = self._futures, []
+        wait(pending)
+        return self.stats
+
+    def shutdown(self):
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def summary(self):
+        s = self.stats
+        return (
+            f"captured={s['captured']}, written={s['written']}, deduplicated={s['deduplicated']}, "
+            f"errors={s['errors']}, bytes={s['bytes_written']}/{s['bytes_captured']}, "
+            f"test thread={s['capture_time']:.3f}s, offloaded dari test thread={s['write_time']:.3f}s"
+        )
+
+
+SCREENSHOTS = ScreenshotPipeline()
@@ -1,26 +1,31 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from pages.locators import SidebarLocators
+from util.element_cache import ElementCache
+from util.perf_metrics import perf_action
+from util.waits import AdaptiveWait
 
 class Sidebar:
     def __init__(self, driver, timeout=10):
         self.driver = driver
-        self.wait = WebDriverWait(driver, timeout)
+        self.wait = AdaptiveWait(driver, timeout)
 
     def click_menu(self, menu_name):
         """Klik menu berdasarkan text di sidebar"""
-        menu_btn = self.wait.until(EC.element_to_be_clickable((
-            By.XPATH,
-            f"//span[normalize-space()='{menu_name}']/ancestor::button"
-        )))
+        menu_btn = self.wait.until(
+            EC.element_to_be_clickable(SidebarLocators.MENU_BUTTON(menu=menu_name)), name=f"sidebar.{menu_name}"
+        )
         menu_btn.click()
+        ElementCache.for_driver(self.driver).invalidate()
 
+    @perf_action
     def go_to_transactions(self):
         self.click_menu("Transactions")
 
+    @perf_action
     def go_to_reports(self):
         self.click_menu("Reports")
 
+    @perf_action
     def go_to_pos(self):
         self.click_menu("Point of Sale")
 
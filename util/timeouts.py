@@ -0,0 +1,98 @@
+"""
+Timeout adaptif dari latency wait yang teramati lintas run.
+
+Setiap wait bernama (DomWaiter / AdaptiveWait) mencatat latency-nya ke WAIT_METRICS;
+di akhir sesi latency yang berhasil digabung ke history (.wait_timings.json),
+dikelompokkan per target (URL aplikasi / stand-in lokal) karena latency Netlify dan
+stand-in lokal tidak bisa saling dipakai.
+Dengan --adaptive-timeouts, timeout tiap wait = p99 x margin (dibatasi floor dan
+timeout hard-coded-nya), jadi wait yang biasanya selesai dalam 200ms tidak lagi
+menunggu 10 detik penuh saat hasilnya memang negatif.
+"""
+import json
+import logging
+import os
+
+from util.benchmark import percentile
+from util.driver_provider import file_lock
+
+logger = logging.getLogger(__name__)
+
+TIMINGS_FILE = ".wait_timings.json"
+MAX_SAMPLES = 200
+
+
+class TimingStore:
+    """History latency per nama wait (untuk satu target) + turunan timeout-nya."""
+
+    def __init__(self, path=TIMINGS_FILE, adaptive=False, margin=3.0, floor=0.5, min_samples=20, target="default"):
+        self.path = path
+        self.target = target
+        self.adaptive = adaptive
+        self.margin = margin
+        self.floor = floor
+        self.min_samples = min_samples
+        self.history = {}
+
+    def configure(self, path=TIMINGS_FILE, adaptive=False, margin=3.0, floor=0.5, min_samples=20, target="default"):
+        self.__init__(path, adaptive, margin, floor, min_samples, target)
+        self.history = self._load().get(target, {})
+
+    def _load(self):
+        """Isi file history: {target: {nama wait: [latency, ...]}}."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # Format lama (nama wait langsung di root, tanpa target) dibuang
+        return {target: entries for target, entries in data.items() if isinstance(entries, dict)}
+
+    def p99(self, name):
+        samples = self.history.get(name)
+        return percentile(samples, 99) if samples else None
+
+    def timeout(self, name, default):
+        """
+        Timeout untuk wait `name`: p99 x margin, minimal `floor`, maksimal `default`
+        (timeout hard-coded tidak pernah dilonggarkan). Tanpa --adaptive-timeouts atau
+        sample kurang dari min_samples -> `default`.
+        """
+        samples = self.history.get(name)
+        if not self.adaptive or not samples or len(samples) < self.min_samples:
+            return default
+        return round(min(max(percentile(samples, 99) * self.margin, self.floor), default), 3)
+
+    def save(self, metrics):
+        """Gabung latency sukses sesi ini ke file history (aman untuk worker paralel)."""
+        if not metrics.latencies:
+            return
+        with file_lock(f"{self.path}.lock"):
+            data = self._load()
+            history = data.setdefault(self.target, {})
+            for name, values in metrics.latencies.items():
+                history[name] = (history.get(name, []) + [round(v, 4) for v in values])[-MAX_SAMPLES:]
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.path)
+        self.history = history
+        logger.info(f"[TimingStore] ✅ {len(history)} wait point ({self.target}) disimpan ke {self.path}")
+
+    def overgenerous(self, metrics, ratio=10.0):
+        """
+        Wait yang timeout-nya (nilai terbesar yang dipakai sesi ini) >= ratio x p99 latency.
+        Return list (nama, timeout, p99, n) diurutkan dari rasio terbesar.
+        """
+        rows = []
+        for name, limit in metrics.limits.items():
+            samples = self.history.get(name, []) or metrics.latencies.get(name, [])
+            if len(samples) < self.min_samples:
+                continue
+            p99 = max(percentile(samples, 99), 0.001)
+            if limit / p99 >= ratio:
+                rows.append((name, limit, p99, len(samples)))
+        return sorted(rows, key=lambda row: row[1] / row[2], reverse=True)
+
+
+TIMINGS = TimingStore()
@@ -0,0 +1,146 @@
+"""
+Generator transaksi sintetis (skema pos_transactions) untuk stress test Reports
+dan Transactions, plus injeksi ke localStorage secara bertahap (per chunk).
+
+JSON dibangun streaming: transaksi di-generate satu per satu dan di-serialize per
+chunk, jadi di sisi Python tidak pernah ada list besar berisi semua transaksi.
+"""
+import json
+import logging
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from data.config import STORAGE_KEYS
+
+logger = logging.getLogger(__name__)
+
+PAYMENT_METHODS = ("Cash", "Card", "Digital")
+FIRST_NAMES = ("Andi", "Budi", "Citra", "Dewi", "Eko", "Fitri", "Gilang", "Hana", "Indra", "Joko", "Kartika", "Lina")
+LAST_NAMES = ("Saputra", "Wijaya", "Pratama", "Lestari", "Nugroho", "Santoso", "Hidayat", "Kusuma")
+
+
+def generate_transactions(count, products, span_days=365, seed=0, now=None):
+    """
+    Yield `count` transaksi urut lama -> baru (sama seperti app yang append di akhir),
+    tersebar di `span_days` hari terakhir. TXID unik (minimal 1 detik antar transaksi).
+    """
+    rng = random.Random(seed)
+    now = now or datetime.now()
+    step = max(span_days * 86400 / count, 1.0) if count else 1.0
+    jitter = max(int(step), 1)
+    customers = [
+        (f"{first} {last}", f"{first}.{last}{i}@example.com".lower())
+        for i, (first, last) in enumerate(
+            (rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)) for _ in range(200)
+        )
+    ]
+
+    for i in range(count):
+        # Interval [floor(k*step), floor(k*step) + floor(step)) tidak saling overlap -> TXID unik
+        seconds_ago = int((count - 1 - i) * step) + rng.randrange(jitter)
+        moment = now - timedelta(seconds=seconds_ago)
+        items = [
+            {"id": p["id"], "name": p["name"], "price": p["price"], "quantity": rng.randint(1, 3)}
+            for p in rng.sample(products, rng.randint(1, min(3, len(products))))
+        ]
+        name, email = rng.choice(customers)
+        yield {
+            "id": moment.strftime("TXN-%Y%m%d-%H%M%S"),
+            "date": moment.astimezone(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+            "customer": {"name": name, "email": email},
+            "items": items,
+            "total": round(sum(item["price"] * item["quantity"] for item in items), 2),
+            "paymentMethod": rng.choice(PAYMENT_METHODS),
+        }
+
+
+def iter_json_chunks(transactions, chunk_size=2000):
+    """
+    Serialize iterable transaksi jadi potongan string JSON array.
+    Gabungan semua potongan = satu JSON array yang valid.
+    """
+    first = True
+    buffer = []
+    for tx in transactions:
+        buffer.append(json.dumps(tx, separators=(",", ":")))
+        if len(buffer) >= chunk_size:
+            yield ("[" if first else ",") + ",".join(buffer)
+            first = False
+            buffer = []
+    if buffer or first:
+        yield ("[" if first else ",") + ",".join(buffer)
+    yield "]"
+
+
+class TransactionSeeder:
+    """Isi pos_transactions di localStorage browser dengan data sintetis."""
+
+    _COMMIT_JS = """
+    var key = arguments[0], append = arguments[1];
+    var json = (window.__pwdkSeed || []).join('');
+    delete window.__pwdkSeed;
+    var existing = localStorage.getItem(key);
+    if (append && existing && existing !== '[]' && json !== '[]') {
+        json = existing.slice(0, -1) + ',' + json.slice(1);
+    }
+    try {
+        localStorage.setItem(key, json);
+        return { ok: true, chars: json.length };
+    } catch (e) {
+        return { ok: false, chars: json.length, error: e.name };
+    }
+    """
+
+    def __init__(self, driver, keys=STORAGE_KEYS):
+        self.driver = driver
+        self.key = keys["transactions"]
+        self.products_key = keys["products"]
+
+    def seed(self, count, chunk_size=2000, append=False, seed=0, span_days=365):
+        """
+        Generate `count` transaksi dan kirim ke browser per chunk (satu execute_script
+        per chunk), lalu simpan ke localStorage sekali di akhir.
+        Return dict: ok, count, chars, chunks, seconds, sample_ids (TXID awal tiap chunk + terakhir).
+        localStorage Chrome dibatasi ~5 juta karakter per origin; kalau terlewati ok=False.
+        """
+        products = self.driver.execute_script(
+            "return JSON.parse(localStorage.getItem(arguments[0]) || '[]');", self.products_key
+        )
+        if not products:
+            raise ValueError("Katalog produk belum ada di localStorage (buka aplikasi dulu)")
+
+        start = time.perf_counter()
+        sample_ids = []
+        last_id = None
+
+        def tracked():
+            nonlocal last_id
+            for i, tx in enumerate(generate_transactions(count, products, span_days=span_days, seed=seed)):
+                if i % chunk_size == 0:
+                    sample_ids.append(tx["id"])
+                last_id = tx["id"]
+                yield tx
+
+        self.driver.execute_script("window.__pwdkSeed = [];")
+        chunks = 0
+        for chunk in iter_json_chunks(tracked(), chunk_size):
+            self.driver.execute_script("window.__pwdkSeed.push(arguments[0]);", chunk)
+            chunks += 1
+        result = self.driver.execute_script(self._COMMIT_JS, self.key, append)
+
+        if last_id is not None and last_id not in sample_ids:
+            sample_ids.append(last_id)
+        result.update(
+            count=count, chunks=chunks, seconds=round(time.perf_counter() - start, 3), sample_ids=sample_ids
+        )
+        if result["ok"]:
+            logger.info(f"[TransactionSeeder] ✅ {count} transaksi ({result['chars']} karakter) dalam {chunks} chunk")
+        else:
+            logger.warning(
+                f"[TransactionSeeder] ⚠️ Gagal simpan {count} transaksi ({result['chars']} karakter): {result['error']}"
+            )
+        return result
+
+    def clear(self):
+        self.driver.execute_script("localStorage.setItem(arguments[0], '[]');", self.key)
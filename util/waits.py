@@ -0,0 +1,297 @@
+"""
+Wait berbasis event DOM: MutationObserver di-inject lewat execute_async_script
+dan langsung resolve begitu kondisi terpenuhi (pengganti time.sleep tetap).
+"""
+import logging
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from util.driver_provider import IMPLICIT_WAIT
+from util.profiler import PAGE_OBJECT_MODULES
+from util.timeouts import TIMINGS
+
+logger = logging.getLogger(__name__)
+
+_SNAPSHOT_JS = """
+var r = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+var n = r.snapshotLength ? r.snapshotItem(0) : null;
+return {
+    text: n ? n.textContent.trim() : null,
+    count: r.snapshotLength,
+    disabled: n ? n.hasAttribute('disabled') : null
+};
+"""
+
+_WAIT_JS = """
+var condition = arguments[0], xpath = arguments[1], old = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var start = performance.now();
+
+function nodes() {
+    var r = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var out = [];
+    for (var i = 0; i < r.snapshotLength; i++) out.push(r.snapshotItem(i));
+    return out;
+}
+var checks = {
+    text_changed: function () { var n = nodes()[0]; return !n || n.textContent.trim() !== old; },
+    count_changed: function () { return nodes().length !== old; },
+    disabled_changed: function () { var n = nodes()[0]; return !n || n.hasAttribute('disabled') !== old; },
+    present: function () { return nodes().length > 0; },
+    absent: function () { return nodes().length === 0; }
+};
+var check = checks[condition];
+if (!check) { throw new Error('Unknown wait condition: ' + condition); }
+
+var finished = false, observer = null, timer = null;
+function finish(ok) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    if (timer) clearTimeout(timer);
+    done({ ok: ok, elapsed: (performance.now() - start) / 1000 });
+}
+if (check()) { finish(true); return; }
+observer = new MutationObserver(function () { if (check()) finish(true); });
+observer.observe(document.documentElement, {
+    childList: true, subtree: true, characterData: true, attributes: true
+});
+timer = setTimeout(function () { finish(check()); }, timeoutMs);
+"""
+
+# Tunggu elemen pertama yang terlihat dari beberapa locator sekaligus (urutan = prioritas)
+_FIRST_OF_JS = """
+var queries = arguments[0], timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var start = performance.now();
+
+function visible(el) {
+    if (!el.getClientRects().length) return false;
+    var style = getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && style.opacity !== '0';
+}
+function find() {
+    for (var i = 0; i < queries.length; i++) {
+        var q = queries[i], found = [];
+        if (q[0] === 'xpath') {
+            var r = document.evaluate(q[1], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (var j = 0; j < r.snapshotLength; j++) found.push(r.snapshotItem(j));
+        } else {
+            found = document.querySelectorAll(q[1]);
+        }
+        for (var k = 0; k < found.length; k++) {
+            if (visible(found[k])) return { index: i, element: found[k] };
+        }
+    }
+    return null;
+}
+
+var finished = false, observer = null, timer = null;
+function finish(hit) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    if (timer) clearTimeout(timer);
+    done({
+        index: hit ? hit.index : -1,
+        element: hit ? hit.element : null,
+        elapsed: (performance.now() - start) / 1000
+    });
+}
+var hit = find();
+if (hit) { finish(hit); return; }
+observer = new MutationObserver(function () { var h = find(); if (h) finish(h); });
+observer.observe(document.documentElement, {
+    childList: true, subtree: true, characterData: true, attributes: true
+});
+timer = setTimeout(function () { finish(find()); }, timeoutMs);
+"""
+
+# Locator Selenium -> query yang bisa dijalankan di browser
+_CSS_EQUIVALENT = {
+    By.ID: '[id="{}"]',
+    By.NAME: '[name="{}"]',
+    By.CLASS_NAME: ".{}",
+    By.TAG_NAME: "{}",
+}
+
+
+def browser_query(locator):
+    by, value = locator
+    if by == By.XPATH:
+        return ["xpath", value]
+    if by == By.CSS_SELECTOR:
+        return ["css", value]
+    if by in _CSS_EQUIVALENT:
+        return ["css", _CSS_EQUIVALENT[by].format(value)]
+    raise ValueError(f"Locator tidak didukung untuk query di browser: {locator}")
+
+
+class WaitMetrics:
+    """Rekap durasi setiap wait (per nama) selama satu sesi."""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.latencies = defaultdict(list)  # hanya wait yang berhasil (bahan timeout adaptif)
+        self.timeouts = defaultdict(int)
+        self.limits = {}  # timeout terbesar yang dipakai per wait
+
+    def record(self, name, elapsed, ok, timeout=None):
+        self.samples[name].append(elapsed)
+        if ok:
+            self.latencies[name].append(elapsed)
+        else:
+            self.timeouts[name] += 1
+        if timeout is not None:
+            self.limits[name] = max(self.limits.get(name, 0), timeout)
+
+    def reset(self):
+        self.samples.clear()
+        self.latencies.clear()
+        self.timeouts.clear()
+        self.limits.clear()
+
+    def summary(self):
+        lines = []
+        for name in sorted(self.samples):
+            values = self.samples[name]
+            lines.append(
+                f"{name}: n={len(values)}, avg={sum(values) / len(values) * 1000:.0f}ms, "
+                f"max={max(values) * 1000:.0f}ms, timeouts={self.timeouts[name]}"
+            )
+        return lines
+
+
+WAIT_METRICS = WaitMetrics()
+
+
+class DomWaiter:
+    """
+    Tunggu perubahan DOM tertentu (by XPath) tanpa sleep tetap.
+    Pola pakai: snapshot() sebelum aksi, lalu until() sesudah aksi; first_of()
+    untuk menunggu salah satu dari beberapa hasil (sukses / error) sekaligus.
+    """
+
+    def __init__(self, driver, timeout=3, metrics=WAIT_METRICS):
+        self.driver = driver
+        self.timeout = timeout
+        self.metrics = metrics
+
+    def snapshot(self, xpath):
+        """Ambil text, jumlah node, dan status disabled dalam satu round trip."""
+        return self.driver.execute_script(_SNAPSHOT_JS, xpath)
+
+    def until(self, name, condition, xpath, old=None, timeout=None, raise_on_timeout=False):
+        """
+        Tunggu sampai `condition` terpenuhi untuk `xpath`:
+        text_changed, count_changed, disabled_changed, present, absent.
+        Return True kalau terpenuhi, False kalau timeout.
+        """
+        timeout = TIMINGS.timeout(name, self.timeout if timeout is None else timeout)
+        start = time.perf_counter()
+        try:
+            result = self.driver.execute_async_script(_WAIT_JS, condition, xpath, old, int(timeout * 1000))
+            ok = bool(result and result.get("ok"))
+        except (JavascriptException, TimeoutException) as e:
+            logger.warning(f"[DomWaiter] ⚠️ {name}: {e}")
+            ok = False
+        elapsed = time.perf_counter() - start
+        self.metrics.record(name, elapsed, ok, timeout)
+
+        if not ok:
+            logger.warning(f"[DomWaiter] ⚠️ {name}: kondisi '{condition}' tidak terpenuhi dalam {timeout}s")
+            if raise_on_timeout:
+                raise TimeoutException(f"{name}: {condition} on {xpath}")
+        return ok
+
+    def first_of(self, name, outcomes, timeout=None, raise_on_timeout=False):
+        """
+        Tunggu beberapa kemungkinan hasil sekaligus dalam satu timeout, mis.
+        [("dashboard", LOC_A), ("error", LOC_B), ("error", LOC_C)].
+        `outcomes` berupa list (nama, locator) atau dict; kalau beberapa muncul
+        bersamaan, yang lebih dulu di list menang.
+        Return (nama, WebElement) yang pertama terlihat, atau (None, None) kalau timeout.
+        """
+        outcomes = list(outcomes.items()) if isinstance(outcomes, dict) else list(outcomes)
+        timeout = TIMINGS.timeout(name, self.timeout if timeout is None else timeout)
+        queries = [browser_query(locator) for _, locator in outcomes]
+        start = time.perf_counter()
+        try:
+            result = self.driver.execute_async_script(_FIRST_OF_JS, queries, int(timeout * 1000))
+        except (JavascriptException, TimeoutException) as e:
+            logger.warning(f"[DomWaiter] ⚠️ {name}: {e}")
+            result = None
+        index = result["index"] if result else -1
+        self.metrics.record(name, time.perf_counter() - start, index >= 0, timeout)
+
+        if index < 0:
+            labels = ", ".join(sorted({label for label, _ in outcomes}))
+            logger.warning(f"[DomWaiter] ⚠️ {name}: tidak ada dari [{labels}] yang muncul dalam {timeout}s")
+            if raise_on_timeout:
+                raise TimeoutException(f"{name}: tidak ada dari [{labels}] yang muncul dalam {timeout}s")
+            return None, None
+        return outcomes[index][0], result["element"]
+
+
+def _caller_name():
+    """Nama wait default: method page object terdalam yang memanggil until()."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        owner = frame.f_locals.get("self")
+        if owner is not None and frame.f_globals.get("__name__", "").startswith(PAGE_OBJECT_MODULES):
+            return f"{type(owner).__name__}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "<test>"
+
+
+class AdaptiveWait(WebDriverWait):
+    """
+    WebDriverWait yang mencatat latency per nama wait ke WAIT_METRICS dan memakai
+    timeout dari TIMINGS (p99 x margin) kalau --adaptive-timeouts aktif.
+    Nama default = method page object pemanggil; beri `name=` kalau satu method punya beberapa wait.
+    """
+
+    def __init__(self, driver, timeout, metrics=WAIT_METRICS, **kwargs):
+        super().__init__(driver, timeout, **kwargs)
+        self.default_timeout = timeout
+        self.metrics = metrics
+
+    def _timed(self, wait, method, message, name):
+        name = name or _caller_name()
+        self._timeout = TIMINGS.timeout(name, self.default_timeout)
+        start = time.perf_counter()
+        try:
+            result = wait(method, message)
+        except TimeoutException:
+            self.metrics.record(name, time.perf_counter() - start, False, self._timeout)
+            raise
+        self.metrics.record(name, time.perf_counter() - start, True, self._timeout)
+        return result
+
+    def until(self, method, message="", name=None):
+        return self._timed(super().until, method, message, name)
+
+    def until_not(self, method, message="", name=None):
+        return self._timed(super().until_not, method, message, name)
+
+
+@contextmanager
+def no_implicit_wait(driver):
+    """Matikan implicit wait sementara (probe keberadaan elemen tidak perlu menunggu)."""
+    driver.implicitly_wait(0)
+    try:
+        yield
+    finally:
+        driver.implicitly_wait(IMPLICIT_WAIT)
+
+
+def probe(driver, locator):
+    """find_elements tanpa implicit wait: list kosong langsung kalau elemen tidak ada."""
+    with no_implicit_wait(driver):
+        return driver.find_elements(*locator)